@@ -9,7 +9,7 @@ from .song import SongHandler
 from .clip import ClipHandler
 from .clip_slot import ClipSlotHandler
 from .track import TrackHandler
-from .device import DeviceHandler
+from .device import DeviceHandler, DeviceIndex
 from .scene import SceneHandler
 from .view import ViewHandler
-from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT
+from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT, OSC_MTU, OSC_MAX_DATAGRAM_SIZE, OSC_TICK_STATS_WINDOW
@@ -1,8 +1,57 @@
 import re
-from typing import Tuple, Callable, Any, Optional
+import time
+import random
+import struct
+from typing import Tuple, Callable, Any, Optional, List
 from .handler import AbletonOSCHandler
+from .constants import OSC_MAX_DATAGRAM_SIZE
 import Live
 
+#--------------------------------------------------------------------------------
+# Fixed-width big-endian note records used by /live/clip/get/notes/blob and
+# /live/clip/add/notes, mapped by format name:
+#   notes: pitch (uint8), start_time, duration, velocity (float32), mute (uint8)
+#   notes_with_ids: as above, followed by note_id (int32)
+# Keep in sync with client/notes.py.
+#--------------------------------------------------------------------------------
+NOTE_BLOB_FORMATS = {
+    "notes": struct.Struct(">BfffB"),
+    "notes_with_ids": struct.Struct(">BfffBi"),
+}
+DEFAULT_NOTE_BLOB_FORMAT = "notes"
+
+#--------------------------------------------------------------------------------
+# Bytes reserved in each /live/clip/get/notes/blob reply for everything other
+# than the blob's data: the address, type tag, indices, format and counts.
+#--------------------------------------------------------------------------------
+NOTE_BLOB_REPLY_OVERHEAD = 128
+
+#--------------------------------------------------------------------------------
+# Note transforms for /live/clip/transform/<name>. Each modifies a Live note in
+# place, given the transform's numeric arguments.
+#--------------------------------------------------------------------------------
+def transpose_note(note, semitones):
+    note.pitch = min(max(note.pitch + int(semitones), 0), 127)
+
+def quantize_note(note, grid, strength):
+    if grid > 0:
+        quantized_time = round(note.start_time / grid) * grid
+        note.start_time += (quantized_time - note.start_time) * strength
+
+def scale_note_velocity(note, factor):
+    note.velocity = min(max(note.velocity * factor, 1.0), 127.0)
+
+def humanize_note(note, time_amount, velocity_amount):
+    note.start_time = max(note.start_time + random.uniform(-time_amount, time_amount), 0.0)
+    note.velocity = min(max(note.velocity + random.uniform(-velocity_amount, velocity_amount), 1.0), 127.0)
+
+NOTE_TRANSFORMS = {
+    "transpose": (transpose_note, 1),
+    "quantize": (quantize_note, 2),
+    "scale_velocity": (scale_note_velocity, 1),
+    "humanize": (humanize_note, 2),
+}
+
 def note_name_to_midi(name):
     """ Maps a MIDI note name (D3, C#6) to a value.
     Assumes that middle C is C4. """
@@ -24,11 +73,177 @@ def note_name_to_midi(name):
             return index
     return None
 
+#--------------------------------------------------------------------------------
+# Clip names ending in a list of notes, such as "Pad_C-E-G" or "Bass-F#2", are
+# used by /live/clips/filter. Octave numbers are ignored.
+#--------------------------------------------------------------------------------
+CLIP_NAME_NOTES_REGEX = re.compile("([_-])([A-G][A-G#b1-9-]*)$")
+
+#--------------------------------------------------------------------------------
+# Bit set in a pitch class mask for any unrecognised note name (e.g. "Cb"). A clip
+# whose name lists an unrecognised note is therefore muted by any filter that
+# doesn't itself include an unrecognised note name.
+#--------------------------------------------------------------------------------
+UNRECOGNISED_NOTE_MASK = 1 << 12
+
+def get_pitch_class_mask(note_names: List[str]) -> int:
+    """
+    Returns a mask with bit n set for each note name with pitch class n (C = 0), and
+    UNRECOGNISED_NOTE_MASK set if any note name is unrecognised.
+    """
+    mask = 0
+    for name in note_names:
+        pitch_class = note_name_to_midi(name)
+        if pitch_class is None:
+            mask |= UNRECOGNISED_NOTE_MASK
+        else:
+            mask |= 1 << pitch_class
+    return mask
+
+def get_clip_name_pitch_class_mask(clip_name: str) -> int:
+    """
+    Returns the pitch class mask of the notes listed at the end of a clip's name,
+    or 0 if it doesn't end in a list of notes.
+    """
+    match = CLIP_NAME_NOTES_REGEX.search(clip_name)
+    if not match:
+        return 0
+    return get_pitch_class_mask(re.sub("[1-9]", "", match.group(2)).split("-"))
+
+
+class TrackClipNames:
+    """
+    The pitch class mask of each of a track's clip slots, derived from the name of the
+    slot's clip (see get_clip_name_pitch_class_mask), or 0 for empty slots and clips
+    whose names don't list any notes.
+
+    Listens for changes to the track's clip slots, after which it is marked as stale
+    and must be rebuilt, and for clips being added, removed or renamed, after which
+    only the affected slots are refreshed on the next call to refresh().
+    """
+    def __init__(self, track):
+        self.track = track
+        self.stale = False
+        self._observed = []
+        self._observe(track, "clip_slots", self._invalidate)
+        self.clip_slots = list(track.clip_slots)
+        self.masks = [0] * len(self.clip_slots)
+        self._clips = [None] * len(self.clip_slots)
+        self._stale_slots = set(range(len(self.clip_slots)))
+        for clip_slot_index, clip_slot in enumerate(self.clip_slots):
+            self._observe(clip_slot, "has_clip", self._create_slot_invalidator(clip_slot_index))
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Recompute the masks of slots whose clips have been added, removed or renamed.
+        """
+        while self._stale_slots:
+            clip_slot_index = self._stale_slots.pop()
+            clip_slot = self.clip_slots[clip_slot_index]
+            clip = clip_slot.clip if clip_slot.has_clip else None
+            if clip is not self._clips[clip_slot_index]:
+                if self._clips[clip_slot_index] is not None:
+                    self._unobserve(self._clips[clip_slot_index], "name")
+                if clip is not None:
+                    self._observe(clip, "name", self._create_slot_invalidator(clip_slot_index))
+                self._clips[clip_slot_index] = clip
+            self.masks[clip_slot_index] = 0 if clip is None else get_clip_name_pitch_class_mask(clip.name)
+
+    def _create_slot_invalidator(self, clip_slot_index: int) -> Callable:
+        def invalidate_slot():
+            self._stale_slots.add(clip_slot_index)
+        return invalidate_slot
+
+    def _observe(self, target, prop: str, callback: Callable) -> None:
+        getattr(target, "add_%s_listener" % prop)(callback)
+        self._observed.append((target, prop, callback))
+
+    def _unobserve(self, target, prop: str) -> None:
+        for observed in self._observed:
+            if observed[0] is target and observed[1] == prop:
+                self._observed.remove(observed)
+                self._remove_listener(*observed)
+                break
+
+    def _remove_listener(self, target, prop: str, callback: Callable) -> None:
+        try:
+            getattr(target, "remove_%s_listener" % prop)(callback)
+        except Exception:
+            #--------------------------------------------------------------------------------
+            # The track, clip slot or clip may have been deleted; ignore as this is benign.
+            #--------------------------------------------------------------------------------
+            pass
+
+    def _invalidate(self) -> None:
+        self.stale = True
+
+    def close(self) -> None:
+        """
+        Remove all listeners.
+        """
+        for observed in self._observed:
+            self._remove_listener(*observed)
+        self._observed = []
+
+
+class ClipNameIndex:
+    """
+    Cache of each track's TrackClipNames, so that /live/clips/filter doesn't need to
+    parse the name of every clip on every call.
+
+    Tracks are keyed by identity, so must be looked up via the handler's track table,
+    which holds the same track objects until tracks are added, removed or reordered.
+    """
+    def __init__(self):
+        self._tracks = {}
+        self._retired = []
+
+    def get(self, track) -> TrackClipNames:
+        self._close_retired()
+        track_clip_names = self._tracks.get(id(track))
+        if track_clip_names is None or track_clip_names.stale:
+            if track_clip_names is not None:
+                track_clip_names.close()
+            track_clip_names = TrackClipNames(track)
+            self._tracks[id(track)] = track_clip_names
+        else:
+            track_clip_names.refresh()
+        return track_clip_names
+
+    def invalidate(self) -> None:
+        """
+        Discard all cached tracks. Safe to call from within a Live listener, as
+        listeners are only removed on the next call to get().
+        """
+        self._retired.extend(self._tracks.values())
+        self._tracks = {}
+
+    def clear(self) -> None:
+        """
+        Discard all cached tracks and remove their listeners.
+        """
+        self.invalidate()
+        self._close_retired()
+
+    def _close_retired(self) -> None:
+        while self._retired:
+            self._retired.pop().close()
+
+
 class ClipHandler(AbletonOSCHandler):
     def __init__(self, manager):
         super().__init__(manager)
         self.class_identifier = "clip"
-        self._clip_notes_cache = []
+        self.clip_name_index = ClipNameIndex()
+
+    def clear_api(self):
+        super().clear_api()
+        self.clip_name_index.clear()
+
+    def _invalidate_track_table(self):
+        super()._invalidate_track_table()
+        self.clip_name_index.invalidate()
 
     def init_api(self):
         def create_clip_callback(func, *args, pass_clip_index=False):
@@ -58,7 +273,9 @@ class ClipHandler(AbletonOSCHandler):
                 else:
                     rv = func(clip, *args, tuple(params[2:]))
 
-                if rv is not None:
+                if isinstance(rv, list):
+                    return [(track_index, clip_index, *reply) for reply in rv]
+                elif rv is not None:
                     return (track_index, clip_index, *rv)
 
             return clip_callback
@@ -66,8 +283,7 @@ class ClipHandler(AbletonOSCHandler):
         methods = [
             "fire",
             "stop",
-            "duplicate_loop", 
-            "remove_notes_by_id"
+            "duplicate_loop"
         ]
         properties_r = [
             "file_path",
@@ -108,28 +324,91 @@ class ClipHandler(AbletonOSCHandler):
             self.osc_server.add_handler("/live/clip/set/%s" % prop,
                                         create_clip_callback(self._set_property, prop))
 
-        def clip_get_notes(clip, params: Tuple[Any] = ()):
+        def get_notes_in_range(clip, params: Tuple[Any], address: str):
             if len(params) == 4:
                 pitch_start, pitch_span, time_start, time_span = params
             elif len(params) == 0:
                 pitch_start, pitch_span, time_start, time_span = 0, 127, -8192, 16384
             else:
-                raise ValueError("Invalid number of arguments for /clip/get/notes. Either 0 or 4 arguments must be passed.")
-            notes = clip.get_notes_extended(pitch_start, pitch_span, time_start, time_span)
+                raise ValueError("Invalid number of arguments for %s. Either 0 or 4 arguments must be passed." % address)
+            return clip.get_notes_extended(pitch_start, pitch_span, time_start, time_span)
+
+        def get_note_blob_format(params: Tuple[Any]):
+            note_format = params[0] if len(params) > 0 and isinstance(params[0], str) else DEFAULT_NOTE_BLOB_FORMAT
+            if note_format not in NOTE_BLOB_FORMATS:
+                raise ValueError("Unknown note format: %s" % note_format)
+            return note_format
+
+        def clip_get_notes(clip, params: Tuple[Any] = ()):
+            notes = get_notes_in_range(clip, params, "/clip/get/notes")
             all_note_attributes = []
             for note in notes:
                 all_note_attributes += [note.pitch, note.start_time, note.duration, note.velocity, note.mute]
             return tuple(all_note_attributes)
 
+        def clip_get_notes_blob(clip, params: Tuple[Any] = ()):
+            """
+            Query notes as blobs of fixed-width records (see NOTE_BLOB_FORMATS).
+            Params are an optional note format name, followed by an optional range of
+            pitches and times, as for /live/clip/get/notes.
+
+            Replies with one or more messages, each comprising:
+
+                track_id, clip_id, note_format, note_offset, note_count, blob
+
+            where note_count is the total number of notes, and the blob holds the records
+            of the notes from note_offset onwards. Notes are split across messages so that
+            each fits into a single datagram (or chunk, for clients with chunked replies).
+            """
+            note_format = get_note_blob_format(params)
+            if len(params) > 0 and isinstance(params[0], str):
+                params = params[1:]
+            notes = get_notes_in_range(clip, params, "/clip/get/notes/blob")
+            record = NOTE_BLOB_FORMATS[note_format]
+            blob = bytearray(record.size * len(notes))
+            offset = 0
+            if note_format == "notes_with_ids":
+                for note in notes:
+                    record.pack_into(blob, offset, note.pitch, note.start_time, note.duration, note.velocity,
+                                     note.mute, note.note_id)
+                    offset += record.size
+            else:
+                for note in notes:
+                    record.pack_into(blob, offset, note.pitch, note.start_time, note.duration, note.velocity,
+                                     note.mute)
+                    offset += record.size
+
+            max_size = self.osc_server.get_chunked_replies(self.osc_server.remote_addr) or OSC_MAX_DATAGRAM_SIZE
+            notes_per_reply = max(1, (max_size - NOTE_BLOB_REPLY_OVERHEAD) // record.size)
+            if len(notes) <= notes_per_reply:
+                return (note_format, 0, len(notes), bytes(blob))
+            return [(note_format, note_offset, len(notes),
+                     bytes(blob[note_offset * record.size:(note_offset + notes_per_reply) * record.size]))
+                    for note_offset in range(0, len(notes), notes_per_reply)]
+
         def clip_add_notes(clip, params: Tuple[Any] = ()):
+            """
+            Add notes, given either as (pitch, start_time, duration, velocity, mute) params,
+            or as a blob of note records, optionally preceded by the blob's note format.
+            Note IDs in a blob are ignored, as Live assigns IDs to new notes.
+            """
+            if len(params) > 0 and isinstance(params[-1], bytes):
+                record = NOTE_BLOB_FORMATS[get_note_blob_format(params)]
+                blob = params[-1]
+                if len(blob) % record.size != 0:
+                    raise ValueError("Note blob size (%d) is not a multiple of the record size (%d)" %
+                                     (len(blob), record.size))
+                note_attributes = (fields[:5] for fields in record.iter_unpack(blob))
+            else:
+                note_attributes = (params[offset:offset + 5] for offset in range(0, len(params), 5))
+
             notes = []
-            for offset in range(0, len(params), 5):
-                pitch, start_time, duration, velocity, mute = params[offset:offset + 5]
+            for pitch, start_time, duration, velocity, mute in note_attributes:
                 note = Live.Clip.MidiNoteSpecification(start_time=start_time,
                                                        duration=duration,
                                                        pitch=pitch,
                                                        velocity=velocity,
-                                                       mute=mute)
+                                                       mute=bool(mute))
                 notes.append(note)
             clip.add_new_notes(tuple(notes))
 
@@ -143,28 +422,164 @@ class ClipHandler(AbletonOSCHandler):
             clip.remove_notes_extended(pitch_start, pitch_span, time_start, time_span)
 
         self.osc_server.add_handler("/live/clip/get/notes", create_clip_callback(clip_get_notes))
+        self.osc_server.add_handler("/live/clip/get/notes/blob", create_clip_callback(clip_get_notes_blob))
         self.osc_server.add_handler("/live/clip/add/notes", create_clip_callback(clip_add_notes))
         self.osc_server.add_handler("/live/clip/remove/notes", create_clip_callback(clip_remove_notes))
 
-        def clips_filter_handler(params: Tuple):
-            # TODO: Pre-cache clip notes
-            if len(self._clip_notes_cache) == 0:
-                self.logger.warning("Building clip notes cache...")
-                self._build_clip_name_cache()
+        #--------------------------------------------------------------------------------
+        # Incremental note sync, based on Live's note IDs. Notes are exchanged as
+        # (note_id, pitch, start_time, duration, velocity, mute) tuples.
+        #--------------------------------------------------------------------------------
+        def get_note_states(clip, params: Tuple[Any] = (), address: str = "/clip/get/notes/extended"):
+            """
+            Returns a dict mapping the ID of each note in the given range to its
+            (pitch, start_time, duration, velocity, mute).
+            """
+            return {note.note_id: (note.pitch, note.start_time, note.duration, note.velocity, note.mute)
+                    for note in get_notes_in_range(clip, params, address)}
+
+        def clip_get_notes_extended(clip, params: Tuple[Any] = ()):
+            note_attributes = []
+            for note_id, note in get_note_states(clip, params).items():
+                note_attributes += (note_id, *note)
+            return tuple(note_attributes)
+
+        def clip_modify_notes(clip, params: Tuple[Any] = ()):
+            """
+            Modify existing notes, given as (note_id, pitch, start_time, duration, velocity,
+            mute) params, or as a blob in the notes_with_ids format. Only the given notes are
+            read and written back, via Live's apply_note_modifications.
+            """
+            if len(params) > 0 and isinstance(params[-1], bytes):
+                record = NOTE_BLOB_FORMATS["notes_with_ids"]
+                blob = params[-1]
+                if len(blob) % record.size != 0:
+                    raise ValueError("Note blob size (%d) is not a multiple of the record size (%d)" %
+                                     (len(blob), record.size))
+                modifications = {note_id: (pitch, start_time, duration, velocity, mute)
+                                 for pitch, start_time, duration, velocity, mute, note_id in record.iter_unpack(blob)}
             else:
-                self.logger.warning("Found existing clip notes cache (len = %d)" % len(self._clip_notes_cache))
-            note_indices = [note_name_to_midi(name) for name in params]
-
-            self.logger.warning("Got note indices: %s" % note_indices)
-            for track_index, track in enumerate(self.song.tracks):
-                for clip_slot_index, clip_slot in enumerate(track.clip_slots):
-                    clip_notes_list = self._clip_notes_cache[track_index][clip_slot_index]
-                    if clip_notes_list:
+                if len(params) % 6 != 0:
+                    raise ValueError("Invalid number of arguments for /clip/modify/notes. Each note must have 6 arguments.")
+                modifications = {int(params[offset]): tuple(params[offset + 1:offset + 6])
+                                 for offset in range(0, len(params), 6)}
+            if not modifications:
+                return
+
+            notes = clip.get_notes_by_id(tuple(modifications.keys()))
+            for note in notes:
+                note.pitch, note.start_time, note.duration, note.velocity, mute = modifications[note.note_id]
+                note.mute = bool(mute)
+            clip.apply_note_modifications(notes)
+
+        def clip_remove_notes_by_id(clip, params: Tuple[Any] = ()):
+            clip.remove_notes_by_id(tuple(int(note_id) for note_id in params))
+
+        def get_note_diff(params: Tuple[Any], note_states: dict, last_note_states: Optional[dict]):
+            """
+            Returns the notifications describing how a clip's notes have changed since
+            `last_note_states`: the notes that have been added or modified, and the IDs
+            of those that have been removed.
+            """
+            last_note_states = last_note_states or {}
+            changed_notes = []
+            for note_id, note in note_states.items():
+                if last_note_states.get(note_id) != note:
+                    changed_notes += (note_id, *note)
+            removed_note_ids = tuple(note_id for note_id in last_note_states if note_id not in note_states)
+
+            notifications = []
+            if changed_notes:
+                notifications.append(("/live/clip/get/notes/changed", (*params, *changed_notes)))
+            if removed_note_ids:
+                notifications.append(("/live/clip/get/notes/removed", (*params, *removed_note_ids)))
+            return notifications
+
+        def clip_start_listen_notes(clip, params: Tuple[Any] = ()):
+            """
+            Start listening for changes to a clip's notes. The subscriber is first sent all
+            of the clip's notes as changed, and then once per tick (at most) the notes that
+            have since been added or modified, and the IDs of those that have been removed.
+            """
+            listener_key = ("notes", tuple(params))
+            get_notifications = lambda: get_note_states(clip)
+            self.logger.info("Adding listener for clip %s, property: notes" % str(params))
+            self._add_listener(listener_key, clip, "notes",
+                               get_notifications=get_notifications,
+                               get_diff=lambda note_states, last_note_states: get_note_diff(params, note_states,
+                                                                                            last_note_states))
+            remote_addr = self._add_subscriber(listener_key)
+            note_states = get_notifications()
+            notifications = get_note_diff(params, note_states, None) or [("/live/clip/get/notes/changed", tuple(params))]
+            self._notify_subscriber(listener_key, remote_addr, notifications, time.time(), state=note_states)
+
+        self.osc_server.add_handler("/live/clip/get/notes/extended", create_clip_callback(clip_get_notes_extended))
+        self.osc_server.add_handler("/live/clip/modify/notes", create_clip_callback(clip_modify_notes))
+        self.osc_server.add_handler("/live/clip/remove_notes_by_id", create_clip_callback(clip_remove_notes_by_id))
+        self.osc_server.add_handler("/live/clip/start_listen/notes",
+                                    create_clip_callback(clip_start_listen_notes, pass_clip_index=True))
+        self.osc_server.add_handler("/live/clip/stop_listen/notes",
+                                    create_clip_callback(self._stop_listen, "notes", pass_clip_index=True))
+
+        def create_transform_callback(transform_name: str):
+            """
+            Creates a callback for /live/clip/transform/<transform_name>, which expects:
+              (track_index, clip_index, *transform_args, [start_pitch, pitch_span, start_time, time_span])
+
+            track_index and clip_index may each be "*", to apply the transform to the MIDI
+            clips of every track or slot. Notes are modified in place on the server, so
+            nothing is transferred besides the command itself.
+            """
+            transform, num_args = NOTE_TRANSFORMS[transform_name]
+            address = "/clip/transform/%s" % transform_name
+
+            def transform_callback(params: Tuple[Any]) -> None:
+                if len(params) < 2 + num_args:
+                    raise ValueError("Invalid number of arguments for %s. Expected %d transform arguments." %
+                                     (address, num_args))
+                track_id, clip_id = params[:2]
+                transform_args = [float(arg) for arg in params[2:2 + num_args]]
+                note_range = params[2 + num_args:]
+
+                tracks = self.song.tracks if track_id == "*" else [self.song.tracks[int(track_id)]]
+                for track in tracks:
+                    if clip_id == "*":
+                        clips = [clip_slot.clip for clip_slot in track.clip_slots
+                                 if clip_slot.has_clip and clip_slot.clip.is_midi_clip]
+                    else:
+                        clips = [track.clip_slots[int(clip_id)].clip]
+                    for clip in clips:
+                        notes = get_notes_in_range(clip, note_range, address)
+                        if not notes:
+                            continue
+                        for note in notes:
+                            transform(note, *transform_args)
+                        clip.apply_note_modifications(notes)
+
+            return transform_callback
+
+        for transform_name in NOTE_TRANSFORMS:
+            self.osc_server.add_handler("/live/clip/transform/%s" % transform_name,
+                                        create_transform_callback(transform_name))
+
+        def clips_filter_handler(params: Tuple):
+            """
+            Mute each clip whose name lists notes (see get_clip_name_pitch_class_mask) that
+            are not all among the given note names, and unmute the others. Clips whose names
+            don't list any notes are left unchanged. Clips are only modified if their muted
+            state changes.
+            """
+            filter_mask = get_pitch_class_mask([str(name) for name in params])
+            self.logger.info("Filtering clips by pitch classes: %s" % format(filter_mask, "013b"))
+            track_table = self._get_track_table()
+            for track in track_table[:self._num_tracks]:
+                track_clip_names = self.clip_name_index.get(track)
+                for clip_slot, mask in zip(track_clip_names.clip_slots, track_clip_names.masks):
+                    if mask:
                         clip = clip_slot.clip
-                        if all(note in note_indices for note in clip_notes_list):
-                            clip.muted = False
-                        else:
-                            clip.muted = True
+                        muted = (mask & ~filter_mask) != 0
+                        if clip.muted != muted:
+                            clip.muted = muted
 
         self.osc_server.add_handler("/live/clips/filter", clips_filter_handler)
 
@@ -177,23 +592,7 @@ class ClipHandler(AbletonOSCHandler):
                 for clip_slot in track.clip_slots:
                     if clip_slot.has_clip:
                         clip = clip_slot.clip
-                        clip.muted = False
+                        if clip.muted:
+                            clip.muted = False
 
         self.osc_server.add_handler("/live/clips/unfilter", clips_unfilter_handler)
-
-    def _build_clip_name_cache(self):
-        regex = "([_-])([A-G][A-G#b1-9-]*)$"
-        for track_index, track in enumerate(self.song.tracks):
-            self._clip_notes_cache.append([])
-            for clip_slot_index, clip_slot in enumerate(track.clip_slots):
-                self._clip_notes_cache[-1].append([])
-                if clip_slot.has_clip:
-                    clip = clip_slot.clip
-                    clip_name = clip.name
-                    match = re.search(regex, clip_name)
-                    if match:
-                        clip_notes_str = match.group(2)
-                        clip_notes_str = re.sub("[1-9]", "", clip_notes_str)
-                        clip_notes_list = clip_notes_str.split("-")
-                        clip_notes_list = [note_name_to_midi(name) for name in clip_notes_list]
-                        self._clip_notes_cache[-1][-1] = clip_notes_list
\ No newline at end of file
@@ -1,5 +1,50 @@
-from typing import Tuple, Any
+from typing import Tuple, Any, List
 from .handler import AbletonOSCHandler
+from .constants import OSC_MTU
+import struct
+import math
+
+#--------------------------------------------------------------------------------
+# Grid queries return each property as a column of values packed into a blob,
+# with one of the below type codes:
+#  - i: big-endian int32, with -1 for empty clip slots
+#  - f: big-endian float32, with NaN for empty clip slots
+#  - s: UTF-8 strings separated by NUL bytes, with "" for empty clip slots
+#--------------------------------------------------------------------------------
+GRID_EMPTY_VALUES = {"i": -1, "f": math.nan, "s": ""}
+
+def get_grid_column_type(values: List[Any]) -> str:
+    """
+    Returns the type code used to pack a column of grid values, based on its first
+    non-empty value.
+    """
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, float):
+            return "f"
+        if isinstance(value, str):
+            return "s"
+        return "i"
+    return "i"
+
+def pack_grid_column(values: List[Any], type_code: str) -> bytes:
+    """
+    Pack a column of grid values into a blob. None values represent empty clip slots.
+    """
+    empty_value = GRID_EMPTY_VALUES[type_code]
+    if type_code == "s":
+        return b"\x00".join((empty_value if value is None else str(value)).encode("utf-8") for value in values)
+    elif type_code == "f":
+        return struct.pack(">%df" % len(values), *(empty_value if value is None else float(value) for value in values))
+    else:
+        return struct.pack(">%di" % len(values), *(empty_value if value is None else int(value) for value in values))
+
+def get_osc_size(data_size: int) -> int:
+    """
+    Returns the size of a string or blob of `data_size` bytes once padded for OSC.
+    """
+    return (data_size + 4) & ~3
 
 class ClipSlotHandler(AbletonOSCHandler):
     def __init__(self, manager):
@@ -65,3 +110,127 @@ class ClipSlotHandler(AbletonOSCHandler):
             clip_slot.duplicate_clip_to(target_clip_slot)
 
         self.osc_server.add_handler("/live/clip_slot/duplicate_clip_to", create_clip_slot_callback(duplicate_clip_slot))
+
+        def clip_slot_get_grid(params):
+            """
+            Retrieve one or more properties of a block of clip slots and their clips.
+            Properties must be of the format clip.property_name or clip_slot.property_name.
+
+            For example:
+                /live/clip_slot/get/grid 0 16 0 64 clip_slot.is_playing clip.color clip.name
+
+            Queries tracks 0..15 and scenes 0..63 (an end index of -1 denotes the last
+            track or scene). A range that extends past the last track or scene is
+            clamped, and the clamped range is reported in the reply. Replies with one or more messages, each covering a range of
+            tracks and comprising:
+
+                track_start, track_end, scene_start, scene_end,
+                property_0, type_code_0, blob_0, property_1, type_code_1, blob_1, ...
+
+            Each blob holds the values of its property for every clip slot in the
+            range, ordered by track and then by scene. Replies are split by track so
+            that each message fits into a single datagram.
+            """
+            track_start, track_end, scene_start, scene_end, *properties = params
+            track_start, track_end = int(track_start), int(track_end)
+            scene_start, scene_end = int(scene_start), int(scene_end)
+            if min(track_start, scene_start) < 0 or min(track_end, scene_end) < -1:
+                raise ValueError("Invalid range in get/grid: %d, %d, %d, %d" %
+                                 (track_start, track_end, scene_start, scene_end))
+
+            #--------------------------------------------------------------------------------
+            # Clamp the track and scene ranges to the tracks and scenes that exist, so that
+            # the range reported in each reply matches the number of values in its blobs.
+            # Return tracks and the master track have no clip slots, so are excluded.
+            #--------------------------------------------------------------------------------
+            tracks = tuple(self.song.tracks)
+            if track_end == -1 or track_end > len(tracks):
+                track_end = len(tracks)
+            track_start = min(track_start, track_end)
+            scene_count = len(self.song.scenes)
+            if scene_end == -1 or scene_end > scene_count:
+                scene_end = scene_count
+            scene_start = min(scene_start, scene_end)
+
+            properties = [str(prop) for prop in properties]
+            property_names = []
+            for prop in properties:
+                obj, property_name = prop.split(".")
+                if obj not in ("clip", "clip_slot"):
+                    raise ValueError("Unknown object identifier in get/grid: %s" % obj)
+                property_names.append((obj == "clip", property_name))
+
+            #--------------------------------------------------------------------------------
+            # Read every value in a single pass, with one column per property, each of
+            # which contains one row per track.
+            #--------------------------------------------------------------------------------
+            columns = [[] for _ in properties]
+            for track_index in range(track_start, track_end):
+                clip_slots = tuple(tracks[track_index].clip_slots)[scene_start:scene_end]
+                clips = [clip_slot.clip for clip_slot in clip_slots]
+                for column, (is_clip_property, property_name) in zip(columns, property_names):
+                    if is_clip_property:
+                        column.append([None if clip is None else getattr(clip, property_name) for clip in clips])
+                    else:
+                        column.append([getattr(clip_slot, property_name) for clip_slot in clip_slots])
+
+            type_codes = [get_grid_column_type([value for row in column for value in row]) for column in columns]
+
+            address = "/live/clip_slot/get/grid"
+            remote_addr = self.osc_server.remote_addr
+            mtu = self.osc_server.get_bundle_replies(remote_addr) or OSC_MTU
+            header_size = get_osc_size(len(address)) + get_osc_size(len(",iiii" + "ssb" * len(properties))) + 16
+            header_size += sum(get_osc_size(len(prop.encode("utf-8"))) + 4 + 4 + 3 for prop in properties)
+            numeric_cell_size = 4 * sum(type_code != "s" for type_code in type_codes)
+
+            def get_cell_sizes(row_index):
+                cell_sizes = [numeric_cell_size] * (scene_end - scene_start)
+                for column, type_code in zip(columns, type_codes):
+                    if type_code == "s":
+                        for scene_offset, value in enumerate(column[row_index]):
+                            if value is not None:
+                                cell_sizes[scene_offset] += len(str(value).encode("utf-8"))
+                            cell_sizes[scene_offset] += 1
+                return cell_sizes
+
+            def send_chunk(chunk_track_start, chunk_track_end, chunk_scene_start, chunk_scene_end):
+                rows = range(chunk_track_start - track_start, chunk_track_end - track_start)
+                scenes = slice(chunk_scene_start - scene_start, chunk_scene_end - scene_start)
+                rv = [chunk_track_start, chunk_track_end, chunk_scene_start, chunk_scene_end]
+                for prop, type_code, column in zip(properties, type_codes, columns):
+                    values = [value for row_index in rows for value in column[row_index][scenes]]
+                    rv += [prop, type_code, pack_grid_column(values, type_code)]
+                self.osc_server.send(address, tuple(rv), remote_addr)
+
+            #--------------------------------------------------------------------------------
+            # Split the grid into chunks that each fit within the client's MTU: first by
+            # ranges of tracks, and then, for any track that doesn't fit on its own, by
+            # ranges of scenes within that track.
+            #--------------------------------------------------------------------------------
+            chunk_start = track_start
+            chunk_size = header_size
+            for track_index in range(track_start, track_end):
+                cell_sizes = get_cell_sizes(track_index - track_start)
+                row_size = sum(cell_sizes)
+                if chunk_size + row_size <= mtu:
+                    chunk_size += row_size
+                    continue
+                if track_index > chunk_start:
+                    send_chunk(chunk_start, track_index, scene_start, scene_end)
+                chunk_start = track_index
+                chunk_size = header_size + row_size
+                if chunk_size > mtu:
+                    chunk_scene_start = scene_start
+                    chunk_size = header_size
+                    for scene_index, cell_size in enumerate(cell_sizes, scene_start):
+                        if scene_index > chunk_scene_start and chunk_size + cell_size > mtu:
+                            send_chunk(track_index, track_index + 1, chunk_scene_start, scene_index)
+                            chunk_scene_start = scene_index
+                            chunk_size = header_size
+                        chunk_size += cell_size
+                    send_chunk(track_index, track_index + 1, chunk_scene_start, scene_end)
+                    chunk_start = track_index + 1
+                    chunk_size = header_size
+            if chunk_start < track_end or track_start >= track_end:
+                send_chunk(chunk_start, track_end, scene_start, scene_end)
+        self.osc_server.add_handler("/live/clip_slot/get/grid", clip_slot_get_grid)
@@ -4,3 +4,60 @@
 
 OSC_LISTEN_PORT = 11000
 OSC_RESPONSE_PORT = 11001
+
+#--------------------------------------------------------------------------------
+# Limits on the work done by OSCServer.process() in each Live tick.
+# Datagrams beyond these limits are carried over to the next tick.
+#--------------------------------------------------------------------------------
+OSC_TICK_TIME_BUDGET = 0.02
+OSC_TICK_MESSAGE_LIMIT = 500
+OSC_BACKLOG_LIMIT = 10000
+OSC_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+#--------------------------------------------------------------------------------
+# Default maximum datagram size when packing replies into bundles. 1472 bytes is
+# the largest UDP payload that avoids IP fragmentation on Ethernet.
+#--------------------------------------------------------------------------------
+OSC_MTU = 1472
+
+#--------------------------------------------------------------------------------
+# The largest UDP payload over IPv4. Replies larger than this are always split
+# into chunks (see OSCServer.set_chunked_replies).
+#--------------------------------------------------------------------------------
+OSC_MAX_DATAGRAM_SIZE = 65507
+
+#--------------------------------------------------------------------------------
+# Reply templates (see OSCServer.send) are cached for type tags of up to this
+# many params. Longer type tags rarely repeat, so are not cached.
+#--------------------------------------------------------------------------------
+OSC_MAX_CACHED_TYPE_TAG_LENGTH = 64
+
+#--------------------------------------------------------------------------------
+# Bundles with a future time tag are held until they are due, and run on the
+# first tick at or after their time tag. Beyond OSC_SCHEDULE_LIMIT pending
+# bundles, further bundles are dropped. Bundles run more than
+# OSC_SCHEDULE_LATE_THRESHOLD seconds after their time tag are counted as late.
+#--------------------------------------------------------------------------------
+OSC_SCHEDULE_LIMIT = 10000
+OSC_SCHEDULE_LATE_THRESHOLD = 0.1
+
+#--------------------------------------------------------------------------------
+# Upper bounds, in seconds, of the buckets of the per-address histograms of
+# handler time (see OSCServer.set_stats_enabled). Times beyond the last bound
+# fall into a final bucket.
+#--------------------------------------------------------------------------------
+OSC_STATS_TIME_BUCKETS = (0.0001, 0.001, 0.01, 0.1)
+
+#--------------------------------------------------------------------------------
+# The maximum number of addresses and wildcard patterns for which per-address
+# statistics are recorded. Further addresses are handled but not recorded.
+#--------------------------------------------------------------------------------
+OSC_STATS_ADDRESS_LIMIT = 1000
+
+#--------------------------------------------------------------------------------
+# Live calls each control surface's tick every 100ms. When tick statistics are
+# enabled (see OSCServer.set_tick_stats_enabled), the timings of the most recent
+# OSC_TICK_STATS_WINDOW ticks are kept, by default covering the last 10 seconds.
+#--------------------------------------------------------------------------------
+OSC_TICK_INTERVAL = 0.1
+OSC_TICK_STATS_WINDOW = 100
@@ -1,60 +1,131 @@
-from typing import Tuple, Any
+from typing import Tuple, Any, List
+import time
 from .handler import AbletonOSCHandler
 
 
-def get_all_sub_rack_devices(rack):
-    all_sub_devices = []
-    for chain in rack.chains:
-        for device in chain.devices:
-            print(f"Test:{str(type(device))}")
-            if ("<class 'RackDevice.RackDevice'>" in str(type(device))):
-                all_sub_devices.extend([device])
-                sub_devices = get_all_sub_rack_devices(device)
-                all_sub_devices.extend(sub_devices)
-            else:
-                all_sub_devices.extend([device])
-    return all_sub_devices
-
-
-def convert_dict_to_list(dict):
-    dict_list = list(dict.keys())[0]
-    dict_values = list(dict.values())[0]
-    return [dict_list] + dict_values
-
-
-def get_all_devices(track):
-    full_data = []
-    device_list = [x for x in track.devices]
-    devices = []
-    for device in device_list:
-        if ("RackDevice" in str(type(device))):
-            rack = device
-            devices.clear()
-            for chain in rack.chains:
-                for device in chain.devices:
-                    devices.append(device)
-                    print(str(type(device)))
-                    if ("RackDevice" in str(type(device))):
-                        sub_devices = get_all_sub_rack_devices(device)
-                        devices.extend(sub_devices)
-            all_devices_in_rack = {rack: devices}
-            full_data.extend(convert_dict_to_list(all_devices_in_rack))
-        else:
-            full_data.append(device)
-    return full_data
+class DeviceEntry:
+    """
+    A device in a track's flattened device list, together with its position in the
+    rack hierarchy: the rack and chain that contain it, or None for top-level devices.
+    """
+    __slots__ = ("device", "rack", "chain", "chain_index", "is_rack", "is_plain_device")
+
+    def __init__(self, device, rack, chain, chain_index: int):
+        self.device = device
+        self.rack = rack
+        self.chain = chain
+        self.chain_index = chain_index
+        self.is_rack = device.can_have_chains
+        self.is_plain_device = type(device).__name__ == "Device"
+
+
+class TrackDevices:
+    """
+    The flattened list of a track's devices, in which each rack is followed by the devices
+    in each of its chains (recursively). Listens for changes to the track's devices and
+    any rack's chains, after which it is marked as stale and must be rebuilt.
+    """
+    def __init__(self, track):
+        self.track = track
+        self.stale = False
+        self.entries: List[DeviceEntry] = []
+        self._observed = []
+        self._observe(track, "devices")
+        self._add_devices(track.devices, None, None, -1)
+        self.devices = [entry.device for entry in self.entries]
+        self.racks = [entry.device for entry in self.entries if entry.is_rack]
+
+    def _add_devices(self, devices, rack, chain, chain_index: int) -> None:
+        for device in devices:
+            entry = DeviceEntry(device, rack, chain, chain_index)
+            self.entries.append(entry)
+            if entry.is_rack:
+                self._observe(device, "chains")
+                for sub_chain_index, sub_chain in enumerate(device.chains):
+                    self._observe(sub_chain, "devices")
+                    self._add_devices(sub_chain.devices, device, sub_chain, sub_chain_index)
+
+    def _observe(self, target, prop: str) -> None:
+        getattr(target, "add_%s_listener" % prop)(self._invalidate)
+        self._observed.append((target, prop))
+
+    def _invalidate(self) -> None:
+        self.stale = True
+
+    def close(self) -> None:
+        """
+        Remove all listeners.
+        """
+        for target, prop in self._observed:
+            try:
+                getattr(target, "remove_%s_listener" % prop)(self._invalidate)
+            except Exception:
+                #--------------------------------------------------------------------------------
+                # The track, rack or chain may have been deleted; ignore as this is benign.
+                #--------------------------------------------------------------------------------
+                pass
+        self._observed = []
+
+
+class DeviceIndex:
+    """
+    Cache of each track's TrackDevices, so that device lookups don't need to walk the
+    track's racks and chains on every message.
+
+    A single index is created by the Manager and shared by the track and device handlers.
+    Tracks are keyed by identity, so must be looked up via a handler's track table,
+    which holds the same track objects until tracks are added, removed or reordered.
+    """
+    def __init__(self):
+        self._tracks = {}
+        self._retired = []
+
+    def get(self, track) -> TrackDevices:
+        self._close_retired()
+        track_devices = self._tracks.get(id(track))
+        if track_devices is None or track_devices.stale:
+            if track_devices is not None:
+                track_devices.close()
+            track_devices = TrackDevices(track)
+            self._tracks[id(track)] = track_devices
+        return track_devices
+
+    def invalidate(self) -> None:
+        """
+        Discard all cached tracks. Safe to call from within a Live listener, as
+        listeners are only removed on the next call to get().
+        """
+        self._retired.extend(self._tracks.values())
+        self._tracks = {}
+
+    def clear(self) -> None:
+        """
+        Discard all cached tracks and remove their listeners.
+        """
+        self.invalidate()
+        self._close_retired()
+
+    def _close_retired(self) -> None:
+        while self._retired:
+            self._retired.pop().close()
 
 
 class DeviceHandler(AbletonOSCHandler):
     def __init__(self, manager):
         super().__init__(manager)
         self.class_identifier = "device"
+        self.device_index = manager.device_index
+
+    def _invalidate_track_table(self):
+        super()._invalidate_track_table()
+        self.device_index.invalidate()
 
     def init_api(self):
         def create_device_callback(func, *args, include_ids: bool = False):
             def device_callback(params: Tuple[Any]):
                 track_index, device_index = int(params[0]), int(params[1])
-                track = [self.song.tracks + self.song.return_tracks + (self.song.master_track,)][0][track_index]
-                device = get_all_devices(track)[device_index]
+                track = self._get_track_table()[track_index]
+                device = self.device_index.get(track).devices[device_index]
                 if (include_ids):
                     rv = func(device, *args, params[0:])
                 else:
@@ -143,35 +214,29 @@ class DeviceHandler(AbletonOSCHandler):
             return param_index, device.parameters[param_index].str_for_value(device.parameters[param_index].value)
         
         def device_get_parameter_value_listener(device, params: Tuple[Any] = ()):
+            parameter = device.parameters[params[2]]
+            listener_key = ('device_parameter_value', tuple(params))
 
-            def property_changed_callback():
-                value = device.parameters[params[2]].value
+            def get_notifications():
+                value = parameter.value
+                value_string = parameter.str_for_value(value)
                 self.logger.info("Property %s changed of %s %s: %s" % ('value', 'device parameter', str(params), value))
-                self.osc_server.send("/live/device/get/parameter/value", (*params, value,))
-
-                value_string = device.parameters[params[2]].str_for_value(device.parameters[params[2]].value)
-                self.logger.info("Property %s changed of %s %s: %s" % ('value_string', 'device parameter', str(params), value_string))
-                self.osc_server.send("/live/device/get/parameter/value_string", (*params, value_string,))
-
-            listener_key = ('device_parameter_value', tuple(params))
-            if listener_key in self.listener_functions:
-               device_get_parameter_remove_value_listener(device, params)
+                return [("/live/device/get/parameter/value", (*params, value,)),
+                        ("/live/device/get/parameter/value_string", (*params, value_string,))]
 
             self.logger.info("Adding listener for %s %s, property: %s" % ('device parameter', str(params), 'value'))
-            device.parameters[params[2]].add_value_listener(property_changed_callback)
-            self.listener_functions[listener_key] = property_changed_callback
-
-            property_changed_callback()
+            self._add_listener(listener_key, parameter, "value", get_notifications=get_notifications)
+            remote_addr = self._add_subscriber(listener_key)
+            self._notify_subscriber(listener_key, remote_addr, get_notifications(), time.time())
 
         def device_get_parameter_remove_value_listener(device, params: Tuple[Any] = ()):
             listener_key = ('device_parameter_value', tuple(params))
             if listener_key in self.listener_functions:
-                self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), 'value'))
-                listener_function = self.listener_functions[listener_key]
-                device.parameters[params[2]].remove_value_listener(listener_function)
-                del self.listener_functions[listener_key]
+                if self._remove_subscriber(listener_key):
+                    self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), 'value'))
+                    self._remove_listener(listener_key)
             else:
-                self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
+                self.logger.warning("No listener function found for property: %s (%s)" % ('value', str(params)))
 
         def device_set_parameter_value(device, params: Tuple[Any] = ()):
             param_index, param_value = params[:2]
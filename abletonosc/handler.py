@@ -1,6 +1,7 @@
 from ableton.v2.control_surface.component import Component
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Callable, List
 import logging
+import time
 from .osc_server import OSCServer
 
 class AbletonOSCHandler(Component):
@@ -13,13 +14,66 @@ class AbletonOSCHandler(Component):
         self.init_api()
         self.listener_functions = {}
         self.listener_objects = {}
+        self.listener_subscribers = {}
+        self.listener_notifications = {}
+        self.listener_diffs = {}
         self.class_identifier = None
+        self._track_table = None
+        self._num_tracks = 0
+
+        #--------------------------------------------------------------------------------
+        # Subscribers whose listeners have fired since they were last notified, and the
+        # time and notifications last sent to each subscriber.
+        #--------------------------------------------------------------------------------
+        self._changed_subscribers = {}
+        self._last_notifications = {}
 
     def init_api(self):
         pass
 
     def clear_api(self):
         self._clear_listeners()
+        self._track_table = None
+
+    #--------------------------------------------------------------------------------
+    # Track lookup
+    #--------------------------------------------------------------------------------
+    def _get_track_table(self) -> List:
+        """
+        Returns the flat list of tracks addressed by track_index in the OSC API:
+        the song's tracks, followed by its return tracks and the master track.
+
+        The list is cached, and rebuilt only after Live's tracks or return_tracks
+        listeners have fired, so that per-message lookups don't need to fetch and
+        concatenate each of the song's track vectors.
+        """
+        if self._track_table is None:
+            for prop in ("tracks", "return_tracks"):
+                listener_key = (prop, ("track_table",))
+                if listener_key not in self.listener_functions:
+                    self._add_listener(listener_key, self.song, prop, self._invalidate_track_table)
+            tracks = list(self.song.tracks)
+            self._num_tracks = len(tracks)
+            self._track_table = tracks + list(self.song.return_tracks) + [self.song.master_track]
+        return self._track_table
+
+    def _get_return_track(self, return_track_index: int):
+        """
+        Returns the return track at `return_track_index`, taken from the track table.
+        """
+        if return_track_index < 0:
+            raise IndexError("Return track index out of range: %d" % return_track_index)
+        track_table = self._get_track_table()
+        table_index = self._num_tracks + return_track_index
+        if table_index >= len(track_table) - 1:
+            raise IndexError("Return track index out of range: %d" % return_track_index)
+        return track_table[table_index]
+
+    def _get_master_track(self):
+        return self._get_track_table()[-1]
+
+    def _invalidate_track_table(self) -> None:
+        self._track_table = None
 
     #--------------------------------------------------------------------------------
     # Generic callbacks
@@ -50,13 +104,19 @@ class AbletonOSCHandler(Component):
         getter can be used for a customer getter when we're accessing native objects
         e.g. in view.py we don't return the selected_scene, but the selected_scene index.
 
+        Each client that starts listening is added as a subscriber, and all subscribers
+        are sent each change, via a single Live listener per (object, property).
+
         Args:
             target: 
             prop:
             params:
             getter:
         """
-        def property_changed_callback():
+        listener_key = (prop, tuple(params))
+        osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
+
+        def get_notifications():
             if getter is None:
                 value = getattr(target, prop)
             else:
@@ -64,43 +124,26 @@ class AbletonOSCHandler(Component):
             if type(value) is not tuple:
                 value = (value,)
             self.logger.info("Property %s changed of %s %s: %s" % (prop, self.class_identifier, str(params), value))
-            osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
-            self.osc_server.send(osc_address, (*params, *value,))
-
-        listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self._stop_listen(target, prop, params)
+            return [(osc_address, (*params, *value,))]
 
         self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
-        add_listener_function_name = "add_%s_listener" % prop
-        add_listener_function = getattr(target, add_listener_function_name)
-        add_listener_function(property_changed_callback)
-        self.listener_functions[listener_key] = property_changed_callback
-        self.listener_objects[listener_key] = target
+        self._add_listener(listener_key, target, prop, get_notifications=get_notifications)
+        remote_addr = self._add_subscriber(listener_key)
         #--------------------------------------------------------------------------------
-        # Immediately send the current value
+        # Immediately send the current value to the new subscriber
         #--------------------------------------------------------------------------------
-        property_changed_callback()
+        self._notify_subscriber(listener_key, remote_addr, get_notifications(), time.time())
 
     def _stop_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
+        """
+        Stop the current client listening for the property named `prop`. The underlying
+        Live listener is removed once no subscribers remain.
+        """
         listener_key = (prop, tuple(params))
         if listener_key in self.listener_functions:
-            self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), prop))
-            listener_function = self.listener_functions[listener_key]
-            remove_listener_function_name = "remove_%s_listener" % prop
-            remove_listener_function = getattr(target, remove_listener_function_name)
-            try:
-                remove_listener_function(listener_function)
-            except Exception as e:
-                #--------------------------------------------------------------------------------
-                # This exception may be thrown when an observer is no longer connected --
-                # e.g., when trying to stop listening for a clip property of a clip that has been deleted.
-                # Ignore as it is benign.
-                #--------------------------------------------------------------------------------
-                self.logger.info("Exception whilst removing listener (likely benign): %s" % e)
-
-            del self.listener_functions[listener_key]
-            del self.listener_objects[listener_key]
+            if self._remove_subscriber(listener_key):
+                self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), prop))
+                self._remove_listener(listener_key)
         else:
             self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
 
@@ -108,7 +151,187 @@ class AbletonOSCHandler(Component):
         """
         Clears all listener functions, to prevent listeners continuing to report after a reload.
         """
-        for listener_key in list(self.listener_functions.keys())[:]:
-            target = self.listener_objects[listener_key]
-            prop, params = listener_key
-            self._stop_listen(target, prop, params)
+        for listener_key in list(self.listener_functions.keys()):
+            self._remove_listener(listener_key)
+        self.listener_subscribers.clear()
+        self._changed_subscribers.clear()
+        self._last_notifications.clear()
+
+    #--------------------------------------------------------------------------------
+    # Listener and subscriber registry
+    #--------------------------------------------------------------------------------
+    def _add_listener(self,
+                      listener_key: Tuple,
+                      target,
+                      prop: str,
+                      callback: Optional[Callable] = None,
+                      get_notifications: Optional[Callable] = None,
+                      get_diff: Optional[Callable] = None) -> None:
+        """
+        Add a Live listener for `prop` on `target`, replacing any existing listener
+        registered under `listener_key`.
+
+        Args:
+            listener_key: The key under which the listener and its subscribers are registered.
+            target: The Live object to listen to.
+            prop: The name of the property to listen for.
+            callback: The function called by Live when the property changes. If None,
+                      the listener's subscribers are marked as changed, to be notified
+                      by the next call to flush_listeners().
+            get_notifications: A function that returns the list of (address, params)
+                               messages sent to subscribers to describe the current value.
+            get_diff: For listeners whose subscribers are sent changes rather than the
+                      current value. If given, get_notifications instead returns the
+                      current state, and get_diff(state, last_state) returns the messages
+                      describing the changes since the state last sent to a subscriber.
+        """
+        add_listener_function = getattr(target, "add_%s_listener" % prop)
+        if listener_key in self.listener_functions:
+            self._remove_listener(listener_key)
+        if callback is None:
+            callback = lambda: self._mark_listener_changed(listener_key)
+        add_listener_function(callback)
+        self.listener_functions[listener_key] = callback
+        self.listener_objects[listener_key] = (target, prop)
+        if get_notifications is not None:
+            self.listener_notifications[listener_key] = get_notifications
+        if get_diff is not None:
+            self.listener_diffs[listener_key] = get_diff
+
+    def _remove_listener(self, listener_key: Tuple) -> None:
+        target, prop = self.listener_objects.pop(listener_key)
+        listener_function = self.listener_functions.pop(listener_key)
+        self.listener_notifications.pop(listener_key, None)
+        self.listener_diffs.pop(listener_key, None)
+        self._changed_subscribers.pop(listener_key, None)
+        remove_listener_function = getattr(target, "remove_%s_listener" % prop)
+        try:
+            remove_listener_function(listener_function)
+        except Exception as e:
+            #--------------------------------------------------------------------------------
+            # This exception may be thrown when an observer is no longer connected --
+            # e.g., when trying to stop listening for a clip property of a clip that has been deleted.
+            # Ignore as it is benign.
+            #--------------------------------------------------------------------------------
+            self.logger.info("Exception whilst removing listener (likely benign): %s" % e)
+
+    def _add_subscriber(self, listener_key: Tuple) -> Tuple[str, int]:
+        """
+        Subscribe the client whose message is currently being handled to `listener_key`.
+
+        Returns:
+            The client's reply address.
+        """
+        remote_addr = self.osc_server.remote_addr
+        subscribers = self.listener_subscribers.setdefault(listener_key, [])
+        if remote_addr not in subscribers:
+            subscribers.append(remote_addr)
+        return remote_addr
+
+    def _remove_subscriber(self, listener_key: Tuple) -> bool:
+        """
+        Unsubscribe the client whose message is currently being handled from `listener_key`.
+
+        Returns:
+            True if no subscribers remain.
+        """
+        remote_addr = self.osc_server.remote_addr
+        subscribers = self.listener_subscribers.get(listener_key, [])
+        self._last_notifications.pop((listener_key, remote_addr), None)
+        self._changed_subscribers.get(listener_key, set()).discard(remote_addr)
+        if remote_addr in subscribers:
+            subscribers.remove(remote_addr)
+        else:
+            self.logger.warning("Client %s is not subscribed to %s" % (str(remote_addr), str(listener_key)))
+        if not subscribers:
+            self.listener_subscribers.pop(listener_key, None)
+            return True
+        return False
+
+    #--------------------------------------------------------------------------------
+    # Listener notifications
+    #--------------------------------------------------------------------------------
+    def _mark_listener_changed(self, listener_key: Tuple) -> None:
+        """
+        Mark all subscribers to `listener_key` as due a notification. Called from within
+        Live listeners, so does no more work than necessary: the current value is only
+        read once per tick, by flush_listeners().
+        """
+        subscribers = self.listener_subscribers.get(listener_key)
+        if subscribers:
+            self._changed_subscribers.setdefault(listener_key, set()).update(subscribers)
+
+    def _notify_subscriber(self, listener_key: Tuple, remote_addr: Tuple[str, int],
+                           notifications: List[Tuple[str, Tuple]], now: float, state: Any = None) -> None:
+        """
+        Send `notifications` to a subscriber, and record them as the last sent. For
+        listeners with a get_diff function, `state` is recorded instead.
+        """
+        for address, params in notifications:
+            self.osc_server.send(address, params, remote_addr)
+        self._last_notifications[(listener_key, remote_addr)] = (now, notifications if state is None else state)
+
+    def _is_within_threshold(self, notifications: List[Tuple[str, Tuple]],
+                             last_notifications: List[Tuple[str, Tuple]], threshold: float) -> bool:
+        """
+        Returns True if `notifications` differs from `last_notifications` only by numeric
+        values that have each changed by less than `threshold`.
+        """
+        if len(notifications) != len(last_notifications):
+            return False
+        for (address, params), (last_address, last_params) in zip(notifications, last_notifications):
+            if address != last_address or len(params) != len(last_params):
+                return False
+            for value, last_value in zip(params, last_params):
+                if type(value) in (int, float) and type(last_value) in (int, float):
+                    if abs(value - last_value) >= threshold:
+                        return False
+                elif value != last_value:
+                    return False
+        return True
+
+    def flush_listeners(self) -> None:
+        """
+        Send notifications to subscribers whose listeners have fired since they were last
+        notified. Called once per tick, so each subscriber is sent at most one notification
+        per listener per tick, containing the latest value.
+
+        Subscribers that are rate-limited by their client's listener throttle (see
+        OSCServer.set_listener_throttle) remain pending until a later tick.
+        """
+        if not self._changed_subscribers:
+            return
+        now = time.time()
+        changed_subscribers = self._changed_subscribers
+        self._changed_subscribers = {}
+        for listener_key, subscribers in changed_subscribers.items():
+            get_notifications = self.listener_notifications.get(listener_key)
+            if get_notifications is None:
+                continue
+            try:
+                notifications = get_notifications()
+            except Exception as e:
+                self.logger.warning("Exception whilst reading value for listener %s: %s" % (str(listener_key), e))
+                continue
+            get_diff = self.listener_diffs.get(listener_key)
+            for remote_addr in subscribers:
+                throttle = self.osc_server.get_listener_throttle(remote_addr)
+                last_time, last_notifications = self._last_notifications.get((listener_key, remote_addr), (None, None))
+                if last_notifications is not None:
+                    if throttle.max_rate > 0 and now - last_time < 1.0 / throttle.max_rate:
+                        self._changed_subscribers.setdefault(listener_key, set()).add(remote_addr)
+                        continue
+                    if throttle.dedup and notifications == last_notifications:
+                        continue
+                    if get_diff is None and throttle.threshold > 0 and \
+                            self._is_within_threshold(notifications, last_notifications, throttle.threshold):
+                        continue
+                if get_diff is not None:
+                    #--------------------------------------------------------------------------------
+                    # Diffs are taken against the state last sent to each subscriber, so that
+                    # subscribers whose updates were deferred by max_rate don't miss changes.
+                    #--------------------------------------------------------------------------------
+                    self._notify_subscriber(listener_key, remote_addr, get_diff(notifications, last_notifications),
+                                            now, state=notifications)
+                else:
+                    self._notify_subscriber(listener_key, remote_addr, notifications, now)
@@ -1,19 +1,269 @@
-from typing import Tuple, Any, Callable
-from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT
+from typing import Tuple, Any, Callable, List, Optional
+from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT, OSC_TICK_TIME_BUDGET, OSC_TICK_MESSAGE_LIMIT, \
+    OSC_BACKLOG_LIMIT, OSC_RECEIVE_BUFFER_SIZE, OSC_MTU, OSC_MAX_DATAGRAM_SIZE, OSC_SCHEDULE_LIMIT, \
+    OSC_SCHEDULE_LATE_THRESHOLD, OSC_STATS_TIME_BUCKETS, OSC_TICK_INTERVAL, OSC_TICK_STATS_WINDOW, \
+    OSC_MAX_CACHED_TYPE_TAG_LENGTH, OSC_STATS_ADDRESS_LIMIT
 from ..pythonosc.osc_message import OscMessage, ParseError
 from ..pythonosc.osc_bundle import OscBundle
-from ..pythonosc.osc_message_builder import OscMessageBuilder, BuildError
+from ..pythonosc.osc_message_builder import OscMessageBuilder, BuildError, compile_packer, pack_args
+from ..pythonosc.parsing import osc_types
 
 import re
 import errno
 import socket
 import logging
 import traceback
+import time
+import heapq
+import bisect
+import struct
+import functools
+import collections
+
+#--------------------------------------------------------------------------------
+# Header of an outgoing OSC bundle: the #bundle tag, followed by the
+# "immediately" time tag.
+#--------------------------------------------------------------------------------
+_BUNDLE_HEADER = b"#bundle\x00" + osc_types.write_date(osc_types.IMMEDIATELY)
+
+@functools.lru_cache(maxsize=256)
+def _compile_segment_pattern(segment: str):
+    """
+    Compile a single address segment containing wildcards (e.g. "name*") into a regex.
+    As in the original OSC implementation, "*" matches one or more characters
+    within a segment.
+    """
+    return re.compile("[^/]+".join(re.escape(part) for part in segment.split("*")))
+
+class _AddressNode:
+    """
+    Node of the segment trie used to resolve wildcard OSC addresses.
+    Each node corresponds to one "/"-delimited segment of a registered address.
+    """
+    __slots__ = ("children", "address", "order", "_subtree")
+
+    def __init__(self):
+        self.children = {}
+        self.address: Optional[str] = None
+        self.order: int = -1
+        self._subtree = None
+
+    def subtree(self) -> List["_AddressNode"]:
+        """
+        Returns all registered (leaf) nodes at or below this node. Cached until the
+        next handler is added below this node.
+        """
+        if self._subtree is None:
+            nodes = [self] if self.address is not None else []
+            for child in self.children.values():
+                nodes.extend(child.subtree())
+            self._subtree = nodes
+        return self._subtree
+
+#--------------------------------------------------------------------------------
+# Type tags for reply params whose type alone determines their tag.
+#--------------------------------------------------------------------------------
+_SIMPLE_TYPE_TAGS = {
+    float: "f",
+    str: "s",
+    bytes: "b",
+    type(None): "N",
+}
+
+def _infer_type_tag(params: Tuple) -> Optional[str]:
+    """
+    Returns the OSC type tag for a tuple of reply params, following the same rules as
+    OscMessageBuilder, or None if any param needs OscMessageBuilder's full inference
+    (e.g. lists, or subclasses of int such as Live's enums).
+    """
+    type_tag = ""
+    for value in params:
+        value_type = type(value)
+        if value_type is int:
+            type_tag += "h" if value.bit_length() > 32 else "i"
+        elif value_type is bool:
+            type_tag += "T" if value else "F"
+        else:
+            tag = _SIMPLE_TYPE_TAGS.get(value_type)
+            if tag is None:
+                return None
+            type_tag += tag
+    return type_tag
+
+#--------------------------------------------------------------------------------
+# Encoded sizes of fixed-width params, and the overhead of a /live/chunk/data
+# message excluding its params: its address, the type tag's ",ii" prefix and
+# padding, and the transfer ID and sequence number.
+#--------------------------------------------------------------------------------
+_FIXED_PARAM_SIZES = {"i": 4, "f": 4, "h": 8, "d": 8, "T": 0, "F": 0, "N": 0}
+_CHUNK_DATA_OVERHEAD = 20 + 8 + 8
+
+def _get_param_size(value: Any) -> int:
+    """
+    Returns the number of bytes that a param adds to a message, including its type tag.
+    """
+    type_tag = _infer_type_tag((value,))
+    if type_tag in _FIXED_PARAM_SIZES:
+        return _FIXED_PARAM_SIZES[type_tag] + 1
+    elif type_tag == "s":
+        return ((len(value.encode("utf-8")) + 4) & ~3) + 1
+    elif type_tag == "b":
+        return 4 + ((len(value) + 3) & ~3) + 1
+    else:
+        #--------------------------------------------------------------------------------
+        # Overestimate the size of other params with that of a message containing only
+        # that param.
+        #--------------------------------------------------------------------------------
+        builder = OscMessageBuilder("/")
+        builder.add_arg(value)
+        return len(builder.build().dgram)
+
+def _get_reply_template(address: str, type_tag: str) -> Tuple[bytes, Tuple, int]:
+    """
+    Returns the encoded address and type tag for replies to `address` with the given
+    type tag, together with the compiled plan for packing their params.
+
+    Templates are cached unless the type tag is longer than OSC_MAX_CACHED_TYPE_TAG_LENGTH.
+    Long type tags (e.g. of replies containing many notes, whose mute flags vary) are
+    rarely repeated, so caching them would only keep large templates alive.
+    """
+    if len(type_tag) > OSC_MAX_CACHED_TYPE_TAG_LENGTH:
+        return _build_reply_template(address, type_tag)
+    return _build_cached_reply_template(address, type_tag)
+
+def _build_reply_template(address: str, type_tag: str) -> Tuple[bytes, Tuple, int]:
+    type_tag_dgram, steps, fixed_size = compile_packer(type_tag)
+    return osc_types.write_string(address) + type_tag_dgram, steps, fixed_size
+
+_build_cached_reply_template = functools.lru_cache(maxsize=1024)(_build_reply_template)
+
+def _decode_bundle_params(bundle) -> None:
+    """
+    Decode the params of each message in a bundle, including those in nested bundles,
+    which are otherwise decoded lazily when the message is handled.
+    """
+    for element in bundle:
+        if isinstance(element, OscBundle):
+            _decode_bundle_params(element)
+        else:
+            element.params
+
+class _AddressStats:
+    """
+    Statistics on the messages handled for one OSC address: see OSCServer.get_stats().
+    """
+    __slots__ = ("calls", "errors", "total_time", "max_time", "reply_bytes", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.reply_bytes = 0
+        self.histogram = [0] * (len(OSC_STATS_TIME_BUCKETS) + 1)
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        self.histogram[bisect.bisect_right(OSC_STATS_TIME_BUCKETS, elapsed)] += 1
+
+class TickStats:
+    """
+    Timings of the phases of each tick, and of the interval between ticks, over a
+    rolling window of the most recent ticks: see OSCServer.set_tick_stats_enabled().
+
+    Time within a tick is attributed to one phase at a time: switch() ends the
+    current phase and starts another, so phases that nest (such as sending a reply
+    while dispatching a message) are not counted twice.
+    """
+    RECEIVE, PARSE, DISPATCH, LISTENERS, SEND = range(5)
+    PHASE_NAMES = ("receive", "parse", "dispatch", "listeners", "send")
+
+    def __init__(self, window: int = OSC_TICK_STATS_WINDOW):
+        #--------------------------------------------------------------------------------
+        # Each tick is recorded as (interval, total_time, *phase_times), where interval
+        # is the time since the start of the previous tick, or None for the first.
+        #--------------------------------------------------------------------------------
+        self.ticks = collections.deque(maxlen=max(int(window), 1))
+        self._phase = None
+        self._phase_start = 0.0
+        self._phase_times = None
+        self._tick_start = None
+        self._last_tick_start = None
+
+    def start_tick(self) -> None:
+        self._tick_start = time.perf_counter()
+        self._phase_times = [0.0] * len(self.PHASE_NAMES)
+
+    def switch(self, phase: Optional[int]) -> Optional[int]:
+        """
+        End the current phase, if any, and start `phase` (or none, if None). Returns the
+        phase that was ended, so that it can be resumed. Does nothing outside a tick.
+        """
+        if self._phase_times is None:
+            return None
+        now = time.perf_counter()
+        previous_phase = self._phase
+        if previous_phase is not None:
+            self._phase_times[previous_phase] += now - self._phase_start
+        self._phase = phase
+        self._phase_start = now
+        return previous_phase
+
+    def end_tick(self) -> None:
+        if self._phase_times is None:
+            return
+        self.switch(None)
+        now = time.perf_counter()
+        interval = self._tick_start - self._last_tick_start if self._last_tick_start is not None else None
+        self.ticks.append((interval, now - self._tick_start, *self._phase_times))
+        self._last_tick_start = self._tick_start
+        self._phase_times = None
+
+    def reset(self) -> None:
+        """
+        Discard the timings recorded so far. The interval before the next tick is still
+        measured from the start of the last.
+        """
+        self.ticks.clear()
+
+    def get_summary(self) -> Tuple:
+        """
+        Returns a summary of the ticks in the window, with times in seconds:
+
+            (tick_count, mean_interval, mean_jitter, max_jitter, mean_time, max_time,
+             receive_mean, receive_max, parse_mean, parse_max, dispatch_mean, dispatch_max,
+             listeners_mean, listeners_max, send_mean, send_max)
+
+        where jitter is the difference between the interval between consecutive ticks
+        and OSC_TICK_INTERVAL, and time is the total time taken by each tick.
+        """
+        intervals = [tick[0] for tick in self.ticks if tick[0] is not None]
+        jitters = [abs(interval - OSC_TICK_INTERVAL) for interval in intervals]
+        summary = [len(self.ticks),
+                   sum(intervals) / len(intervals) if intervals else 0.0,
+                   sum(jitters) / len(jitters) if jitters else 0.0,
+                   max(jitters, default=0.0)]
+        for index in range(1, len(self.PHASE_NAMES) + 2):
+            times = [tick[index] for tick in self.ticks]
+            summary += [sum(times) / len(times) if times else 0.0, max(times, default=0.0)]
+        return tuple(summary)
+
+#--------------------------------------------------------------------------------
+# Options for listener notifications sent to a client: see set_listener_throttle().
+#--------------------------------------------------------------------------------
+ListenerThrottle = collections.namedtuple("ListenerThrottle", ("max_rate", "threshold", "dedup"))
+DEFAULT_LISTENER_THROTTLE = ListenerThrottle(0.0, 0.0, True)
 
 class OSCServer:
     def __init__(self,
                  local_addr: Tuple[str, int] = ('0.0.0.0', OSC_LISTEN_PORT),
-                 remote_addr: Tuple[str, int] = ('127.0.0.1', OSC_RESPONSE_PORT)):
+                 remote_addr: Tuple[str, int] = ('127.0.0.1', OSC_RESPONSE_PORT),
+                 tick_time_budget: float = OSC_TICK_TIME_BUDGET,
+                 tick_message_limit: int = OSC_TICK_MESSAGE_LIMIT,
+                 backlog_limit: int = OSC_BACKLOG_LIMIT):
         """
         Class that handles OSC server responsibilities, including support for sending
         reply messages.
@@ -27,6 +277,11 @@ class OSCServer:
                         By default, binds to the wildcard address 0.0.0.0, which means listening on
                         every available local IPv4 interface (including 127.0.0.1).
             remote_addr: Remote address to send replies to, by default. Can be overridden in send().
+            tick_time_budget: Maximum time, in seconds, to spend handling messages in each call
+                              to process(). At least one message is always handled.
+            tick_message_limit: Maximum number of datagrams to handle in each call to process().
+            backlog_limit: Maximum number of received datagrams to hold between ticks.
+                           Beyond this, datagrams are left queued on the socket.
         """
 
         self._local_addr = local_addr
@@ -35,8 +290,67 @@ class OSCServer:
 
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._socket.setblocking(0)
+        try:
+            #--------------------------------------------------------------------------------
+            # Enlarge the receive buffer so that bursts of messages arriving between ticks
+            # are not dropped. The OS may cap this at a lower value.
+            #--------------------------------------------------------------------------------
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, OSC_RECEIVE_BUFFER_SIZE)
+        except OSError:
+            pass
         self._socket.bind(self._local_addr)
         self._callbacks = {}
+        self._callback_tree = _AddressNode()
+
+        self._tick_time_budget = tick_time_budget
+        self._tick_message_limit = tick_message_limit
+        self._backlog_limit = backlog_limit
+        self._backlog = collections.deque()
+        self.num_ticks_over_time_budget = 0
+        self.num_ticks_over_message_limit = 0
+
+        #--------------------------------------------------------------------------------
+        # Clients that have opted in to receiving replies as bundles, mapped to their MTU,
+        # and the messages queued for each of them until the next flush().
+        #--------------------------------------------------------------------------------
+        self._bundle_clients = {}
+        self._outbound = {}
+
+        #--------------------------------------------------------------------------------
+        # Per-client options for listener notifications, which default to
+        # DEFAULT_LISTENER_THROTTLE.
+        #--------------------------------------------------------------------------------
+        self._listener_throttles = {}
+
+        #--------------------------------------------------------------------------------
+        # Clients that have opted in to receiving large replies in chunks, mapped to
+        # their maximum chunk size. Replies to other clients are only chunked beyond
+        # OSC_MAX_DATAGRAM_SIZE.
+        #--------------------------------------------------------------------------------
+        self._chunked_clients = {}
+        self._next_transfer_id = 0
+
+        #--------------------------------------------------------------------------------
+        # Bundles whose time tag is in the future, as a heap of (time_tag, sequence_number,
+        # bundle, remote_addr), and statistics on how promptly they have been run.
+        #--------------------------------------------------------------------------------
+        self._scheduled_bundles = []
+        self._next_schedule_sequence_number = 0
+        self.reset_schedule_stats()
+
+        #--------------------------------------------------------------------------------
+        # Per-address statistics, keyed by the address received (including any wildcards),
+        # or None when disabled. While a message is being handled, _current_stats is its
+        # address's statistics, to which the size of any replies is added.
+        #--------------------------------------------------------------------------------
+        self._address_stats = None
+        self._current_stats = None
+
+        #--------------------------------------------------------------------------------
+        # Timings of the phases of recent ticks, or None when disabled. Manager.tick
+        # starts and ends each tick, and times the listener phase.
+        #--------------------------------------------------------------------------------
+        self.tick_stats: Optional[TickStats] = None
 
         self.logger = logging.getLogger("abletonosc")
         self.logger.info("Starting OSC server (local %s, response port %d)",
@@ -51,6 +365,18 @@ class OSCServer:
             handler: A handler function, with signature:
                      params: Tuple[Any, ...]
         """
+        if address not in self._callbacks:
+            #--------------------------------------------------------------------------------
+            # Index the address by segment so that wildcard queries can be resolved
+            # without scanning the whole callback table.
+            #--------------------------------------------------------------------------------
+            node = self._callback_tree
+            node._subtree = None
+            for segment in address.split("/"):
+                node = node.children.setdefault(segment, _AddressNode())
+                node._subtree = None
+            node.address = address
+            node.order = len(self._callbacks)
         self._callbacks[address] = handler
 
     def clear_handlers(self) -> None:
@@ -58,6 +384,49 @@ class OSCServer:
         Remove all existing OSC handlers.
         """
         self._callbacks = {}
+        self._callback_tree = _AddressNode()
+
+    def match_wildcard(self, pattern: str) -> List[str]:
+        """
+        Resolve an address pattern containing "*" wildcards to the list of registered
+        addresses that it matches, in the order that the handlers were added.
+
+        Matching follows the original regex semantics: each "*" matches one or more
+        characters within a segment, and the final segment of the pattern matches as
+        a prefix, so "/live/track/get/*" also matches "/live/track/get/clips/name".
+
+        Args:
+            pattern: The OSC address pattern (e.g. /live/clip/get/*)
+
+        Returns:
+            A list of matching registered addresses.
+        """
+        segments = pattern.split("/")
+        nodes = [self._callback_tree]
+        for segment in segments[:-1]:
+            if not nodes:
+                return []
+            if "*" not in segment:
+                nodes = [node.children[segment] for node in nodes if segment in node.children]
+            elif segment == "*":
+                nodes = [child for node in nodes for child in node.children.values()]
+            else:
+                regex = _compile_segment_pattern(segment)
+                nodes = [child for node in nodes for key, child in node.children.items() if regex.fullmatch(key)]
+
+        last_segment = segments[-1]
+        if "*" in last_segment:
+            regex = _compile_segment_pattern(last_segment)
+            matches = lambda key: regex.match(key) is not None
+        else:
+            matches = lambda key: key.startswith(last_segment)
+
+        leaves = [leaf
+                  for node in nodes
+                  for key, child in node.children.items() if matches(key)
+                  for leaf in child.subtree()]
+        leaves.sort(key=lambda leaf: leaf.order)
+        return [leaf.address for leaf in leaves]
 
     def send(self,
              address: str,
@@ -72,98 +441,510 @@ class OSCServer:
             remote_addr: The remote address to send to, as a 2-tuple (hostname, port).
                          If None, uses the default remote address.
         """
-        msg_builder = OscMessageBuilder(address)
-        for param in params:
-            msg_builder.add_arg(param)
+        if remote_addr is None:
+            remote_addr = self._remote_addr
 
+        tick_stats = self.tick_stats
+        if tick_stats is None:
+            self._send(address, params, remote_addr)
+            return
+        phase = tick_stats.switch(TickStats.SEND)
         try:
-            msg = msg_builder.build()
-            if remote_addr is None:
-                remote_addr = self._remote_addr
-            self._socket.sendto(msg.dgram, remote_addr)
+            self._send(address, params, remote_addr)
+        finally:
+            tick_stats.switch(phase)
+
+    def _send(self, address: str, params: Tuple, remote_addr: Tuple[str, int]) -> None:
+        try:
+            #--------------------------------------------------------------------------------
+            # Replies on the same address with the same param types share a cached template,
+            # so that only the param values need to be packed.
+            #--------------------------------------------------------------------------------
+            type_tag = _infer_type_tag(params)
+            if type_tag is not None and address:
+                header, steps, fixed_size = _get_reply_template(address, type_tag)
+                try:
+                    dgram = pack_args(header, steps, fixed_size, params)
+                except (struct.error, osc_types.BuildError) as e:
+                    raise BuildError("Could not build the message: %s" % e)
+            else:
+                msg_builder = OscMessageBuilder(address)
+                for param in params:
+                    msg_builder.add_arg(param)
+                dgram = msg_builder.build().dgram
+
+            max_size = self._chunked_clients.get(remote_addr, OSC_MAX_DATAGRAM_SIZE)
+            if len(dgram) > max_size and address != "/live/chunk/data":
+                self._send_chunked(address, params, remote_addr, max_size)
+            elif len(dgram) > OSC_MAX_DATAGRAM_SIZE:
+                #--------------------------------------------------------------------------------
+                # A chunk containing a single param that doesn't fit into a datagram, which
+                # can't be split any further.
+                #--------------------------------------------------------------------------------
+                self.logger.error("AbletonOSC: Chunk of reply is too large to send (%d bytes)" % len(dgram))
+            else:
+                if self._current_stats is not None:
+                    self._current_stats.reply_bytes += len(dgram)
+                if remote_addr in self._bundle_clients:
+                    self._outbound.setdefault(remote_addr, []).append(dgram)
+                else:
+                    self._socket.sendto(dgram, remote_addr)
         except BuildError:
             self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
 
+    @property
+    def remote_addr(self) -> Tuple[str, int]:
+        """
+        The reply address of the most recent client. While a handler is being called,
+        this is the address of the client that sent the message being handled.
+        """
+        return self._remote_addr
+
+    def set_bundle_replies(self,
+                           remote_addr: Tuple[str, int],
+                           enabled: bool,
+                           mtu: int = OSC_MTU) -> None:
+        """
+        Opt a client in or out of receiving replies as bundles. When enabled, messages to
+        the client are queued, and sent by flush() packed into as few bundles as possible.
+
+        Args:
+            remote_addr: The client's reply address, as a 2-tuple (hostname, port).
+            enabled: Whether to send bundled replies to this client.
+            mtu: The maximum size of each bundle datagram, in bytes.
+        """
+        if enabled:
+            self._bundle_clients[remote_addr] = int(mtu)
+        elif remote_addr in self._bundle_clients:
+            self._flush_client(remote_addr)
+            del self._bundle_clients[remote_addr]
+
+    def get_bundle_replies(self, remote_addr: Tuple[str, int]) -> Optional[int]:
+        """
+        Returns the bundle MTU for the given client, or None if it has not opted in
+        to bundled replies.
+        """
+        return self._bundle_clients.get(remote_addr)
+
+    def _send_chunked(self,
+                      address: str,
+                      params: Tuple,
+                      remote_addr: Tuple[str, int],
+                      max_size: int) -> None:
+        """
+        Send a reply that is too large for a single datagram as a series of chunks:
+
+            /live/chunk/header transfer_id, address, chunk_count, param_count
+            /live/chunk/data transfer_id, 0, params...
+            /live/chunk/data transfer_id, 1, params...
+
+        Each chunk contains a contiguous range of the reply's params, and fits within
+        `max_size` bytes unless it contains a single param that is larger than that.
+        """
+        chunks = []
+        chunk_start = 0
+        chunk_size = _CHUNK_DATA_OVERHEAD
+        for param_index, param in enumerate(params):
+            param_size = _get_param_size(param)
+            if param_index > chunk_start and chunk_size + param_size > max_size:
+                chunks.append(params[chunk_start:param_index])
+                chunk_start = param_index
+                chunk_size = _CHUNK_DATA_OVERHEAD
+            chunk_size += param_size
+        chunks.append(params[chunk_start:])
+
+        transfer_id = self._next_transfer_id
+        self._next_transfer_id = (self._next_transfer_id + 1) % (1 << 31)
+        self.send("/live/chunk/header", (transfer_id, address, len(chunks), len(params)), remote_addr)
+        for sequence_number, chunk in enumerate(chunks):
+            self.send("/live/chunk/data", (transfer_id, sequence_number, *chunk), remote_addr)
+
+    def set_chunked_replies(self,
+                            remote_addr: Tuple[str, int],
+                            enabled: bool,
+                            mtu: int = OSC_MTU) -> None:
+        """
+        Opt a client in or out of receiving large replies in chunks. When enabled, replies
+        larger than `mtu` bytes are split into chunks (see _send_chunked), to avoid IP
+        fragmentation. Replies larger than OSC_MAX_DATAGRAM_SIZE are always chunked, as they
+        can't be sent as a single datagram.
+
+        Args:
+            remote_addr: The client's reply address, as a 2-tuple (hostname, port).
+            enabled: Whether to chunk replies to this client at `mtu`.
+            mtu: The maximum size of each chunk datagram, in bytes.
+        """
+        if enabled:
+            self._chunked_clients[remote_addr] = min(int(mtu), OSC_MAX_DATAGRAM_SIZE)
+        else:
+            self._chunked_clients.pop(remote_addr, None)
+
+    def get_chunked_replies(self, remote_addr: Tuple[str, int]) -> Optional[int]:
+        """
+        Returns the chunk MTU for the given client, or None if it has not opted in
+        to chunked replies.
+        """
+        return self._chunked_clients.get(remote_addr)
+
+    def set_listener_throttle(self,
+                              remote_addr: Tuple[str, int],
+                              max_rate: float = 0.0,
+                              threshold: float = 0.0,
+                              dedup: bool = True) -> None:
+        """
+        Set how listener notifications are sent to a client. Regardless of these options,
+        each subscription is sent at most one notification (its latest value) per tick.
+
+        Args:
+            remote_addr: The client's reply address, as a 2-tuple (hostname, port).
+            max_rate: The maximum number of notifications per second for each subscription,
+                      or 0 for no limit beyond once per tick.
+            threshold: The minimum change in a numeric value for a notification to be sent.
+            dedup: Whether to skip notifications whose value is the same as the last sent.
+        """
+        throttle = ListenerThrottle(float(max_rate), float(threshold), bool(dedup))
+        if throttle == DEFAULT_LISTENER_THROTTLE:
+            self._listener_throttles.pop(remote_addr, None)
+        else:
+            self._listener_throttles[remote_addr] = throttle
+
+    def get_listener_throttle(self, remote_addr: Tuple[str, int]) -> "ListenerThrottle":
+        """
+        Returns the listener notification options for the given client.
+        """
+        return self._listener_throttles.get(remote_addr, DEFAULT_LISTENER_THROTTLE)
+
+    def flush(self) -> None:
+        """
+        Send all queued messages to clients that have opted in to bundled replies.
+        Called once at the end of each tick.
+        """
+        for remote_addr in list(self._outbound.keys()):
+            self._flush_client(remote_addr)
+
+    def _flush_client(self, remote_addr: Tuple[str, int]) -> None:
+        dgrams = self._outbound.pop(remote_addr, None)
+        if not dgrams:
+            return
+        mtu = self._bundle_clients[remote_addr]
+
+        try:
+            elements = []
+            size = len(_BUNDLE_HEADER)
+            for dgram in dgrams:
+                element_size = 4 + len(dgram)
+                if len(_BUNDLE_HEADER) + element_size > mtu:
+                    #--------------------------------------------------------------------------------
+                    # Too large to share a bundle with anything else: send it as a plain message,
+                    # after any messages queued before it.
+                    #--------------------------------------------------------------------------------
+                    if elements:
+                        self._send_bundle(elements, remote_addr)
+                        elements = []
+                        size = len(_BUNDLE_HEADER)
+                    self._socket.sendto(dgram, remote_addr)
+                    continue
+                if size + element_size > mtu:
+                    self._send_bundle(elements, remote_addr)
+                    elements = []
+                    size = len(_BUNDLE_HEADER)
+                elements.append(dgram)
+                size += element_size
+            if elements:
+                self._send_bundle(elements, remote_addr)
+        except OSError:
+            self.logger.error("AbletonOSC: Error sending bundled replies: %s" % (traceback.format_exc()))
+
+    def _send_bundle(self, dgrams: List[bytes], remote_addr: Tuple[str, int]) -> None:
+        if len(dgrams) == 1:
+            self._socket.sendto(dgrams[0], remote_addr)
+            return
+        parts = [_BUNDLE_HEADER]
+        for dgram in dgrams:
+            parts.append(osc_types.write_int(len(dgram)))
+            parts.append(dgram)
+        self._socket.sendto(b"".join(parts), remote_addr)
+
     def process_message(self, message, remote_addr):
-        if message.address in self._callbacks:
-            callback = self._callbacks[message.address]
-            rv = callback(message.params)
+        self.handle_message(message.address, message.params, remote_addr)
+
+    def handle_message(self, address: str, params: Tuple, remote_addr: Tuple[str, int]) -> None:
+        """
+        Call the handler(s) for an OSC address, as if the message had just been received
+        from `remote_addr`, and send any replies.
 
+        Args:
+            address: The OSC address, which may contain "*" wildcards
+            params: The message's params
+            remote_addr: The address of the client that sent the message
+        """
+        self._remote_addr = (remote_addr[0], self._response_port)
+        if self._address_stats is None:
+            self._dispatch_message(address, params, remote_addr)
+            return
+
+        stats = self._address_stats.get(address)
+        if stats is None:
+            #--------------------------------------------------------------------------------
+            # Only record registered addresses and wildcard patterns that match at least one,
+            # up to OSC_STATS_ADDRESS_LIMIT entries, so that stray or fuzzed messages can't
+            # grow the table without limit.
+            #--------------------------------------------------------------------------------
+            if len(self._address_stats) >= OSC_STATS_ADDRESS_LIMIT or \
+                    (address not in self._callbacks and ("*" not in address or not self.match_wildcard(address))):
+                self._dispatch_message(address, params, remote_addr)
+                return
+            stats = self._address_stats[address] = _AddressStats()
+
+        #--------------------------------------------------------------------------------
+        # Messages can be handled from within another's handler (e.g. scheduled commands),
+        # so restore the outer message's statistics afterwards.
+        #--------------------------------------------------------------------------------
+        outer_stats = self._current_stats
+        self._current_stats = stats
+        t0 = time.perf_counter()
+        try:
+            self._dispatch_message(address, params, remote_addr)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            self._current_stats = outer_stats
+            stats.record(time.perf_counter() - t0)
+
+    def _dispatch_message(self, address: str, params: Tuple, remote_addr: Tuple[str, int]) -> None:
+        if address in self._callbacks:
+            callback = self._callbacks[address]
+            rv = callback(params)
             if rv is not None:
-                assert isinstance(rv, tuple)
-                remote_hostname, _ = remote_addr
-                response_addr = (remote_hostname, self._response_port)
-                self.send(address=message.address,
-                          params=rv,
-                          remote_addr=response_addr)
-        elif "*" in message.address:
-            regex = message.address.replace("*", "[^/]+")
-            for callback_address, callback in self._callbacks.items():
-                if re.match(regex, callback_address):
-                    try:
-                        rv = callback(message.params)
-                    except ValueError:
-                        #--------------------------------------------------------------------------------
-                        # Don't throw errors for queries that require more arguments
-                        # (e.g. /live/track/get/send with no args)
-                        #--------------------------------------------------------------------------------
-                        continue
-                    except AttributeError:
-                        #--------------------------------------------------------------------------------
-                        # Don't throw errors when trying to create listeners for properties that can't
-                        # be listened for (e.g. can_be_armed, is_foldable)
-                        #--------------------------------------------------------------------------------
-                        continue
-                    if rv is not None:
-                        assert isinstance(rv, tuple)
-                        remote_hostname, _ = remote_addr
-                        response_addr = (remote_hostname, self._response_port)
-                        self.send(address=callback_address,
-                                  params=rv,
-                                  remote_addr=response_addr)
+                self._send_reply(address, rv, remote_addr)
+        elif "*" in address:
+            for callback_address in self.match_wildcard(address):
+                callback = self._callbacks[callback_address]
+                try:
+                    rv = callback(params)
+                except ValueError:
+                    #--------------------------------------------------------------------------------
+                    # Don't throw errors for queries that require more arguments
+                    # (e.g. /live/track/get/send with no args)
+                    #--------------------------------------------------------------------------------
+                    continue
+                except AttributeError:
+                    #--------------------------------------------------------------------------------
+                    # Don't throw errors when trying to create listeners for properties that can't
+                    # be listened for (e.g. can_be_armed, is_foldable)
+                    #--------------------------------------------------------------------------------
+                    continue
+                if rv is not None:
+                    self._send_reply(callback_address, rv, remote_addr)
         else:
-            self.logger.error("AbletonOSC: Unknown OSC address: %s" % message.address)
+            self.logger.error("AbletonOSC: Unknown OSC address: %s" % address)
+
+    def _send_reply(self, address: str, rv, remote_addr: Tuple[str, int]) -> None:
+        """
+        Send a handler's return value to the client that sent the message.
+
+        Args:
+            address: The OSC address to reply on
+            rv: A tuple of params, or a list of tuples to send as separate messages
+            remote_addr: The address of the client, whose hostname is used for the reply
+        """
+        remote_hostname, _ = remote_addr
+        response_addr = (remote_hostname, self._response_port)
+        if isinstance(rv, list):
+            replies = rv
+        else:
+            replies = [rv]
+        for params in replies:
+            assert isinstance(params, tuple)
+            self.send(address=address,
+                      params=params,
+                      remote_addr=response_addr)
 
     def process_bundle(self, bundle, remote_addr):
+        """
+        Handle the contents of a bundle, or, if its time tag is in the future, hold it
+        until it is due (see run_scheduled_bundles). Bundles with the "immediately"
+        time tag are handled straight away.
+        """
+        timestamp = bundle.timestamp
+        if timestamp != osc_types.IMMEDIATELY:
+            now = time.time()
+            if timestamp > now:
+                self._schedule_bundle(bundle, remote_addr)
+                return
+            self._record_bundle_lateness(now - timestamp)
+
         for i in bundle:
             if OscBundle.dgram_is_bundle(i.dgram):
                 self.process_bundle(i, remote_addr)
             else:
                 self.process_message(i, remote_addr)
 
+    def _schedule_bundle(self, bundle, remote_addr) -> None:
+        if len(self._scheduled_bundles) >= OSC_SCHEDULE_LIMIT:
+            self.num_scheduled_bundles_dropped += 1
+            self.logger.warning("AbletonOSC: Too many scheduled bundles, dropping bundle for %.3f" % bundle.timestamp)
+            return
+        heapq.heappush(self._scheduled_bundles,
+                       (bundle.timestamp, self._next_schedule_sequence_number, bundle, remote_addr))
+        self._next_schedule_sequence_number += 1
+
+    def _record_bundle_lateness(self, lateness: float) -> None:
+        self.num_scheduled_bundles_run += 1
+        self.total_schedule_lateness += lateness
+        self.max_schedule_lateness = max(self.max_schedule_lateness, lateness)
+        if lateness > OSC_SCHEDULE_LATE_THRESHOLD:
+            self.num_scheduled_bundles_late += 1
+
+    def run_scheduled_bundles(self) -> None:
+        """
+        Handle each held bundle whose time tag has been reached, in time tag order.
+        Bundles with the same time tag are handled in the order they were received.
+        Called at the start of each call to process(), so that bundles are run on the
+        first tick at or after their time tag.
+        """
+        now = time.time()
+        while self._scheduled_bundles and self._scheduled_bundles[0][0] <= now:
+            _, _, bundle, remote_addr = heapq.heappop(self._scheduled_bundles)
+            self._remote_addr = (remote_addr[0], self._response_port)
+            try:
+                self.process_bundle(bundle, remote_addr)
+            except Exception as e:
+                self.logger.error("AbletonOSC: Error handling scheduled OSC bundle: %s" % e)
+                self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+
+    def clear_scheduled_bundles(self) -> None:
+        """
+        Discard all bundles that are waiting for their time tag.
+        """
+        self._scheduled_bundles = []
+
+    @property
+    def scheduled_bundle_count(self) -> int:
+        """
+        The number of bundles waiting for their time tag.
+        """
+        return len(self._scheduled_bundles)
+
+    def get_schedule_stats(self) -> Tuple[int, int, int, int, float, float]:
+        """
+        Returns statistics on bundles with a time tag other than "immediately":
+        (pending, run, late, dropped, mean_lateness, max_lateness), where lateness is
+        the time in seconds between a bundle's time tag and it being handled, and late
+        bundles are those handled more than OSC_SCHEDULE_LATE_THRESHOLD after it.
+        """
+        mean_lateness = self.total_schedule_lateness / self.num_scheduled_bundles_run \
+            if self.num_scheduled_bundles_run else 0.0
+        return (self.scheduled_bundle_count,
+                self.num_scheduled_bundles_run,
+                self.num_scheduled_bundles_late,
+                self.num_scheduled_bundles_dropped,
+                mean_lateness,
+                self.max_schedule_lateness)
+
+    def reset_schedule_stats(self) -> None:
+        self.num_scheduled_bundles_run = 0
+        self.num_scheduled_bundles_late = 0
+        self.num_scheduled_bundles_dropped = 0
+        self.total_schedule_lateness = 0.0
+        self.max_schedule_lateness = 0.0
+
+    def set_stats_enabled(self, enabled: bool) -> None:
+        """
+        Start or stop recording statistics on the messages handled for each address.
+        Stopping discards the statistics recorded so far. While disabled, the only
+        overhead is a check on each message handled and each message sent.
+        """
+        if not enabled:
+            self._address_stats = None
+        elif self._address_stats is None:
+            self._address_stats = {}
+
+    @property
+    def stats_enabled(self) -> bool:
+        return self._address_stats is not None
+
+    def get_stats(self) -> List[Tuple]:
+        """
+        Returns the statistics recorded for each address since they were enabled or last
+        reset, in descending order of total handler time, as tuples of:
+
+            (address, calls, errors, total_time, max_time, reply_bytes, *histogram)
+
+        where times are in seconds, reply_bytes is the total size of the replies sent
+        while handling the address's messages, and histogram is the number of calls whose
+        handler time fell into each bucket of OSC_STATS_TIME_BUCKETS, followed by the
+        number beyond the last bucket.
+        """
+        if self._address_stats is None:
+            return []
+        items = sorted(self._address_stats.items(), key=lambda item: item[1].total_time, reverse=True)
+        return [(address, stats.calls, stats.errors, stats.total_time, stats.max_time, stats.reply_bytes,
+                 *stats.histogram)
+                for address, stats in items]
+
+    def reset_stats(self) -> None:
+        """
+        Discard the per-address statistics recorded so far, if enabled.
+        """
+        if self._address_stats is not None:
+            self._address_stats = {}
+
+    def set_tick_stats_enabled(self, enabled: bool, window: int = OSC_TICK_STATS_WINDOW) -> None:
+        """
+        Start or stop timing the phases of each tick: receiving datagrams, parsing them,
+        dispatching them to handlers, fanning out listener notifications, and sending
+        replies. Timings are kept for the most recent `window` ticks. Stopping discards
+        the timings recorded so far. While disabled, the only overhead is a check on each
+        datagram handled and each message sent.
+        """
+        if not enabled:
+            self.tick_stats = None
+        elif self.tick_stats is None or self.tick_stats.ticks.maxlen != window:
+            self.tick_stats = TickStats(window)
+
     def parse_bundle(self, data, remote_addr):
+        tick_stats = self.tick_stats
         if OscBundle.dgram_is_bundle(data):
             try:
+                if tick_stats is not None:
+                    tick_stats.switch(TickStats.PARSE)
                 bundle = OscBundle(data)
+                if tick_stats is not None:
+                    _decode_bundle_params(bundle)
+                    tick_stats.switch(TickStats.DISPATCH)
                 self.process_bundle(bundle, remote_addr)
             except ParseError:
                 self.logger.error("AbletonOSC: Error parsing OSC bundle: %s" % (traceback.format_exc()))
         else:
             try:
+                if tick_stats is not None:
+                    tick_stats.switch(TickStats.PARSE)
                 message = OscMessage(data)
+                if tick_stats is not None:
+                    #--------------------------------------------------------------------------------
+                    # Params are decoded lazily, on first access. Decode them now, so that the
+                    # time is counted as parsing rather than dispatch.
+                    #--------------------------------------------------------------------------------
+                    message.params
+                    tick_stats.switch(TickStats.DISPATCH)
                 self.process_message(message, remote_addr)
             except ParseError:
                 self.logger.error("AbletonOSC: Error parsing OSC message: %s" % (traceback.format_exc()))
 
-    def process(self) -> None:
+    def receive(self) -> None:
         """
-        Synchronously process all data queued on the OSC socket.
+        Move all data queued on the OSC socket into the backlog, up to the backlog limit.
+        Receiving is cheap compared to handling, so draining the socket promptly avoids
+        datagrams being dropped by the OS during bursts.
         """
         try:
-            repeats = 0
-            while True:
+            while len(self._backlog) < self._backlog_limit:
                 #--------------------------------------------------------------------------------
                 # Loop until no more data is available.
                 #--------------------------------------------------------------------------------
-                data, remote_addr = self._socket.recvfrom(65536)
-                #--------------------------------------------------------------------------------
-                # Update the default reply address to the most recent client. Used when
-                # sending (e.g) /live/song/beat messages and listen updates.
-                #
-                # This is slightly ugly and prevents registering listeners from different IPs.
-                #--------------------------------------------------------------------------------
-                self._remote_addr = (remote_addr[0], OSC_RESPONSE_PORT)
-                self.parse_bundle(data, remote_addr)
+                self._backlog.append(self._socket.recvfrom(65536))
 
         except socket.error as e:
             if e.errno == errno.ECONNRESET:
@@ -183,9 +964,58 @@ class OSCServer:
                 #--------------------------------------------------------------------------------
                 self.logger.error("AbletonOSC: Socket error: %s" % (traceback.format_exc()))
 
-        except Exception as e:
-            self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
-            self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+    def process(self) -> None:
+        """
+        Synchronously process data queued on the OSC socket.
+
+        Processing is bounded by the per-tick time budget and message limit, so that a
+        burst of messages doesn't stall Live's UI thread. Any datagrams that can't be
+        handled within this tick are kept in the backlog and handled on the next tick.
+
+        Bundles held for their time tag are run first, if due, and are not subject to
+        these limits.
+        """
+        tick_stats = self.tick_stats
+        if tick_stats is not None:
+            tick_stats.switch(TickStats.DISPATCH)
+        self.run_scheduled_bundles()
+        if tick_stats is not None:
+            tick_stats.switch(TickStats.RECEIVE)
+        self.receive()
+
+        deadline = time.perf_counter() + self._tick_time_budget
+        message_count = 0
+        while self._backlog:
+            if message_count >= self._tick_message_limit:
+                self.num_ticks_over_message_limit += 1
+                break
+            if message_count > 0 and time.perf_counter() >= deadline:
+                self.num_ticks_over_time_budget += 1
+                break
+
+            data, remote_addr = self._backlog.popleft()
+            message_count += 1
+            #--------------------------------------------------------------------------------
+            # Update the default reply address to the most recent client. Handlers use this
+            # to identify the client whose message is being handled, e.g. to subscribe it
+            # to listener updates.
+            #--------------------------------------------------------------------------------
+            self._remote_addr = (remote_addr[0], self._response_port)
+            try:
+                self.parse_bundle(data, remote_addr)
+            except Exception as e:
+                self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
+                self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+
+        if self._backlog:
+            self.logger.debug("AbletonOSC: Deferring %d datagrams to the next tick" % len(self._backlog))
+
+    @property
+    def backlog_size(self) -> int:
+        """
+        The number of received datagrams waiting to be handled on a subsequent tick.
+        """
+        return len(self._backlog)
 
     def shutdown(self) -> None:
         """
@@ -3,16 +3,49 @@ import sys
 import tempfile
 import Live
 import json
+import time
+import math
+import heapq
+import struct
 from functools import partial
-from typing import Tuple, Any
+from typing import Tuple, Any, List
 
 from .handler import AbletonOSCHandler
 
+#--------------------------------------------------------------------------------
+# Formats for meter blobs: each meter value is a big-endian float32 between 0 and 1,
+# or a big-endian uint16 between 0 and 65535.
+#--------------------------------------------------------------------------------
+METER_FORMATS = ("float32", "uint16")
+
 class SongHandler(AbletonOSCHandler):
     def __init__(self, manager):
         super().__init__(manager)
         self.class_identifier = "song"
 
+        #--------------------------------------------------------------------------------
+        # Clients listening for meters, mapped to their meter format, and the time and
+        # blob last sent to each.
+        #--------------------------------------------------------------------------------
+        self.meter_subscribers = {}
+        self._last_meters = {}
+
+        #--------------------------------------------------------------------------------
+        # Commands scheduled to run at a beat position, as a heap of (beat, sequence_number,
+        # address, params, remote_addr), and those whose beat has been reached, which are
+        # run on the next tick.
+        #--------------------------------------------------------------------------------
+        self.scheduled_commands = []
+        self._due_commands = []
+        self._next_command_sequence_number = 0
+
+    def clear_api(self):
+        super().clear_api()
+        self.meter_subscribers.clear()
+        self._last_meters.clear()
+        self.scheduled_commands.clear()
+        self._due_commands.clear()
+
     def init_api(self):
         #--------------------------------------------------------------------------------
         # Callbacks for Song: methods
@@ -89,7 +122,7 @@ class SongHandler(AbletonOSCHandler):
         #--------------------------------------------------------------------------------
         # Callbacks for Song: Track properties
         #--------------------------------------------------------------------------------
-        self.osc_server.add_handler("/live/song/get/num_tracks", lambda _: (len(self.song.tracks + self.song.return_tracks + (self.song.master_track,)),))
+        self.osc_server.add_handler("/live/song/get/num_tracks", lambda _: (len(self._get_track_table()),))
 
         def song_get_track_names(params):
             if len(params) == 0:
@@ -269,32 +302,196 @@ class SongHandler(AbletonOSCHandler):
         self.last_song_time = -1.0
         
         def stop_beat_listener(params: Tuple[Any] = ()):
-            try:
-                self.song.remove_current_song_time_listener(self.current_song_time_changed)
-                self.logger.info("Removing beat listener")
-            except:
-                pass
+            self._stop_listen(self.song, "beat")
 
         def start_beat_listener(params: Tuple[Any] = ()):
-            stop_beat_listener()
             self.logger.info("Adding beat listener")
-            self.song.add_current_song_time_listener(self.current_song_time_changed)
+            self._add_listener(("beat", ()), self.song, "current_song_time", self.current_song_time_changed,
+                               get_notifications=lambda: [("/live/song/get/beat", (int(self.song.current_song_time),))])
+            self._add_subscriber(("beat", ()))
 
         self.osc_server.add_handler("/live/song/start_listen/beat", start_beat_listener)
         self.osc_server.add_handler("/live/song/stop_listen/beat", stop_beat_listener)
 
+        #--------------------------------------------------------------------------------
+        # Beat-quantized command scheduling
+        #--------------------------------------------------------------------------------
+        def get_beats_per_bar():
+            return self.song.signature_numerator * 4.0 / self.song.signature_denominator
+
+        def schedule_command(beat: float, params: Tuple[Any]):
+            """
+            Schedule the OSC command (address, *params) to be handled once the song reaches
+            `beat`, as if it had been sent by the current client at that moment.
+            """
+            if len(params) == 0:
+                raise ValueError("No OSC address given for scheduled command")
+            address, *command_params = params
+            self.logger.info("Scheduling %s %s at beat %.3f" % (address, command_params, beat))
+            heapq.heappush(self.scheduled_commands, (float(beat), self._next_command_sequence_number, str(address),
+                                                     list(command_params), self.osc_server.remote_addr))
+            self._next_command_sequence_number += 1
+            #--------------------------------------------------------------------------------
+            # The scheduler has its own listener, separate from the beat listener's, so that
+            # each can be added and removed independently of the other.
+            #--------------------------------------------------------------------------------
+            if ("scheduled_commands", ()) not in self.listener_functions:
+                self._add_listener(("scheduled_commands", ()), self.song, "current_song_time",
+                                   self._queue_due_commands)
+            self._queue_due_commands()
+
+        def schedule_at_beat(params: Tuple[Any] = ()):
+            schedule_command(float(params[0]), params[1:])
+
+        def schedule_at_bar(params: Tuple[Any] = ()):
+            #--------------------------------------------------------------------------------
+            # Bars are numbered from 1, as displayed in Live, and assume the song's current
+            # time signature throughout.
+            #--------------------------------------------------------------------------------
+            schedule_command((float(params[0]) - 1) * get_beats_per_bar(), params[1:])
+
+        def schedule_at_next_bar(params: Tuple[Any] = ()):
+            beats_per_bar = get_beats_per_bar()
+            next_bar_index = math.floor(self.song.current_song_time / beats_per_bar) + 1
+            schedule_command(next_bar_index * beats_per_bar, params)
+
+        def get_schedule(params: Tuple[Any] = ()):
+            return (len(self.scheduled_commands) + len(self._due_commands),)
+
+        def clear_schedule(params: Tuple[Any] = ()):
+            """
+            Discard the commands scheduled by the current client.
+            """
+            remote_addr = self.osc_server.remote_addr
+            self.scheduled_commands = [command for command in self.scheduled_commands if command[4] != remote_addr]
+            heapq.heapify(self.scheduled_commands)
+            self._due_commands = [command for command in self._due_commands if command[4] != remote_addr]
+
+        self.osc_server.add_handler("/live/api/schedule", schedule_at_beat)
+        self.osc_server.add_handler("/live/api/schedule/bar", schedule_at_bar)
+        self.osc_server.add_handler("/live/api/schedule/next_bar", schedule_at_next_bar)
+        self.osc_server.add_handler("/live/api/schedule/clear", clear_schedule)
+        self.osc_server.add_handler("/live/api/get/schedule", get_schedule)
+
+        #--------------------------------------------------------------------------------
+        # Meters for all tracks, return tracks and the master track
+        #--------------------------------------------------------------------------------
+        def get_meter_format(params: Tuple[Any]) -> str:
+            meter_format = str(params[0]) if len(params) > 0 else "float32"
+            if meter_format not in METER_FORMATS:
+                raise ValueError("Unknown meter format: %s" % meter_format)
+            return meter_format
+
+        def song_get_meters(params: Tuple[Any] = ()):
+            meter_format = get_meter_format(params)
+            meters = self._get_meters()
+            num_tracks, num_return_tracks = self._get_track_counts()
+            return (meter_format, num_tracks, num_return_tracks, self._pack_meters(meters, meter_format))
+
+        def start_meters_listener(params: Tuple[Any] = ()):
+            meter_format = get_meter_format(params)
+            self.logger.info("Adding meters listener (%s)" % meter_format)
+            self.meter_subscribers[self.osc_server.remote_addr] = meter_format
+            self._last_meters.pop(self.osc_server.remote_addr, None)
+
+        def stop_meters_listener(params: Tuple[Any] = ()):
+            if self.meter_subscribers.pop(self.osc_server.remote_addr, None) is None:
+                self.logger.warning("Client %s is not listening for meters" % str(self.osc_server.remote_addr))
+            self._last_meters.pop(self.osc_server.remote_addr, None)
+
+        self.osc_server.add_handler("/live/song/get/meters", song_get_meters)
+        self.osc_server.add_handler("/live/song/start_listen/meters", start_meters_listener)
+        self.osc_server.add_handler("/live/song/stop_listen/meters", stop_meters_listener)
+
+    def _get_track_counts(self) -> Tuple[int, int]:
+        track_table = self._get_track_table()
+        return self._num_tracks, len(track_table) - self._num_tracks - 1
+
+    def _get_meters(self) -> List[float]:
+        """
+        Returns the output meter level, left and right values of each track, return
+        track and the master track, in track table order.
+        """
+        meters = []
+        for track in self._get_track_table():
+            try:
+                meters += [track.output_meter_level, track.output_meter_left, track.output_meter_right]
+            except RuntimeError:
+                #--------------------------------------------------------------------------------
+                # Tracks without audio outputs don't have stereo meters.
+                #--------------------------------------------------------------------------------
+                meters += [track.output_meter_level, 0.0, 0.0]
+        return meters
+
+    def _pack_meters(self, meters: List[float], meter_format: str) -> bytes:
+        if meter_format == "uint16":
+            return struct.pack(">%dH" % len(meters), *(min(max(int(value * 65535 + 0.5), 0), 65535) for value in meters))
+        else:
+            return struct.pack(">%df" % len(meters), *meters)
+
+    def flush_listeners(self) -> None:
+        """
+        In addition to listener notifications, send meters to each client listening for
+        them, sampled once per tick. Meters are subject to each client's listener
+        throttle, in the same way as listener notifications.
+        """
+        self._run_due_commands()
+        super().flush_listeners()
+        if not self.meter_subscribers:
+            return
+
+        now = time.time()
+        meters = self._get_meters()
+        num_tracks, num_return_tracks = self._get_track_counts()
+        packed_meters = {}
+        for remote_addr, meter_format in self.meter_subscribers.items():
+            if meter_format not in packed_meters:
+                packed_meters[meter_format] = self._pack_meters(meters, meter_format)
+            blob = packed_meters[meter_format]
+
+            throttle = self.osc_server.get_listener_throttle(remote_addr)
+            last_time, last_blob = self._last_meters.get(remote_addr, (None, None))
+            if last_blob is not None:
+                if throttle.max_rate > 0 and now - last_time < 1.0 / throttle.max_rate:
+                    continue
+                if throttle.dedup and blob == last_blob:
+                    continue
+            self.osc_server.send("/live/song/get/meters", (meter_format, num_tracks, num_return_tracks, blob), remote_addr)
+            self._last_meters[remote_addr] = (now, blob)
+
     def current_song_time_changed(self):
         #--------------------------------------------------------------------------------
         # If song has rewound or skipped to next beat, sent a /live/beat message
         #--------------------------------------------------------------------------------
         if (self.song.current_song_time < self.last_song_time) or \
                 (int(self.song.current_song_time) > int(self.last_song_time)):
-            self.osc_server.send("/live/song/get/beat", (int(self.song.current_song_time),))
+            self._mark_listener_changed(("beat", ()))
         self.last_song_time = self.song.current_song_time
 
-    def clear_api(self):
-        super().clear_api()
-        try:
-            self.song.remove_current_song_time_listener(self.current_song_time_changed)
-        except:
-            pass
+    def _queue_due_commands(self) -> None:
+        """
+        Move scheduled commands whose beat has been reached to the queue of due commands.
+        Commands can't be run from within a Live listener, as Live doesn't allow changes
+        to be triggered by notifications, so are run on the next tick.
+        """
+        if not self.scheduled_commands:
+            return
+        song_time = self.song.current_song_time
+        while self.scheduled_commands and self.scheduled_commands[0][0] <= song_time:
+            self._due_commands.append(heapq.heappop(self.scheduled_commands))
+
+    def _run_due_commands(self) -> None:
+        """
+        Handle due commands, in beat order, and stop listening for the song time once
+        no commands remain scheduled.
+        """
+        due_commands = self._due_commands
+        self._due_commands = []
+        for beat, _, address, params, remote_addr in due_commands:
+            self.logger.info("Running %s %s scheduled at beat %.3f" % (address, params, beat))
+            try:
+                self.osc_server.handle_message(address, params, remote_addr)
+            except Exception as e:
+                self.logger.error("Error handling scheduled command %s: %s" % (address, e))
+        if not self.scheduled_commands and ("scheduled_commands", ()) in self.listener_functions:
+            self._remove_listener(("scheduled_commands", ()))
@@ -1,4 +1,5 @@
 from typing import Tuple, Any, Callable, Optional
+import time
 from .handler import AbletonOSCHandler
 
 
@@ -6,19 +7,21 @@ class TrackHandler(AbletonOSCHandler):
     def __init__(self, manager):
         super().__init__(manager)
         self.class_identifier = "track"
+        self.device_index = manager.device_index
+
+    def _invalidate_track_table(self):
+        super()._invalidate_track_table()
+        self.device_index.invalidate()
 
     def init_api(self):
         def create_track_callback(func: Callable,
                                   *args,
                                   include_track_id: bool = False):
             def track_callback(params: Tuple[Any]):
-                if params[0] == "*":
-                    track_indices = list(range(len(self.song.tracks)))
-                else:
-                    track_indices = [int(params[0])]
-
-                for track_index in track_indices:
-                    track = [self.song.tracks + self.song.return_tracks + (self.song.master_track,)][0][track_index]
+                track_table = self._get_track_table()
+                if params[0] != "*":
+                    track_index = int(params[0])
+                    track = track_table[track_index]
                     if include_track_id:
                         rv = func(track, *args, tuple([track_index] + params[1:]))
                     else:
@@ -26,6 +29,33 @@ class TrackHandler(AbletonOSCHandler):
 
                     if rv is not None:
                         return (track_index, *rv)
+                    return None
+
+                #--------------------------------------------------------------------------------
+                # Fan out to every track in a single pass.
+                # Getters reply with one message containing (track_index, value_count, *values)
+                # for each track, so that getters with several values per track can be split
+                # back into tracks. Clients that have opted in to bundled replies instead
+                # receive one (track_index, *values) message per track, which are coalesced
+                # into a bundle.
+                #--------------------------------------------------------------------------------
+                replies = []
+                for track_index in range(self._num_tracks):
+                    track = track_table[track_index]
+                    if include_track_id:
+                        rv = func(track, *args, tuple([track_index] + params[1:]))
+                    else:
+                        rv = func(track, *args, tuple(params[1:]))
+
+                    if rv is not None:
+                        replies.append((track_index, *rv))
+
+                if not replies:
+                    return None
+                if self.osc_server.get_bundle_replies(self.osc_server.remote_addr) is not None:
+                    return replies
+                return tuple(value for track_index, *values in replies
+                             for value in (track_index, len(values), *values))
 
             return track_callback
 
@@ -97,7 +127,7 @@ class TrackHandler(AbletonOSCHandler):
 
         def return_track_devices_name(params):
             track_id = params[0]
-            device_list = get_all_devices(self.song.return_tracks[track_id])
+            device_list = get_all_devices(self._get_return_track(track_id))
             device_names = []
             for device in device_list:
                 if ' | ' in device.name:
@@ -112,7 +142,7 @@ class TrackHandler(AbletonOSCHandler):
 
         def return_track_devices_type(params):
             track_id = params[0]
-            device_list = get_all_devices(self.song.return_tracks[track_id])
+            device_list = get_all_devices(self._get_return_track(track_id))
             # Use integers instead of strings for device types
             device_types = [int(x.type) for x in device_list if hasattr(x, "type")]
             # Return a properly structured tuple without nesting
@@ -121,7 +151,7 @@ class TrackHandler(AbletonOSCHandler):
 
         def return_track_devices_class_name(params):
             track_id = params[0]
-            device_list = get_all_devices(self.song.return_tracks[track_id])
+            device_list = get_all_devices(self._get_return_track(track_id))
             class_names = [x.class_name for x in device_list if hasattr(x, "class_name")]
             # Return a properly structured tuple without nesting
             return (track_id, class_names,)
@@ -129,32 +159,32 @@ class TrackHandler(AbletonOSCHandler):
 
         def return_track_numdevices(params):
             track_id = params[0]
-            device_list = get_all_devices(self.song.return_tracks[track_id])
+            device_list = get_all_devices(self._get_return_track(track_id))
             count = len(device_list)
             # Return a properly structured tuple without nesting
             return (track_id, count, )
         self.osc_server.add_handler("/live/return_track/get/num_devices", return_track_numdevices)
 
         def master_track_devices_num_devices(params):
-            device_list = get_all_devices(self.song.master_track)
+            device_list = get_all_devices(self._get_master_track())
             self.logger.info(device_list)
             return (len(device_list),)
         self.osc_server.add_handler("/live/master_track/get/num_devices", master_track_devices_num_devices)
 
         def master_track_devices_name_devices(params):
-            device_list = get_all_devices(self.song.master_track)
+            device_list = get_all_devices(self._get_master_track())
             names = tuple(f'{x.name}' for x in device_list)
             return (names)
         self.osc_server.add_handler("/live/master_track/get/devices/name", master_track_devices_name_devices)
 
         def master_track_devices_type_devices(params):
-            device_list = get_all_devices(self.song.master_track)
+            device_list = get_all_devices(self._get_master_track())
             types = tuple(int(x.type) for x in device_list if hasattr(x, 'type'))
             return (types)
         self.osc_server.add_handler("/live/master_track/get/devices/type", master_track_devices_type_devices)
 
         def master_track_devices_class_name_devices(params):
-            device_list = get_all_devices(self.song.master_track)
+            device_list = get_all_devices(self._get_master_track())
             class_names = tuple(f'{x.class_name}' for x in device_list if hasattr(x, "class_name"))
             return (class_names)
         self.osc_server.add_handler("/live/master_track/get/devices/class_name",
@@ -235,42 +265,8 @@ class TrackHandler(AbletonOSCHandler):
         self.osc_server.add_handler("/live/track/get/arrangement_clips/length", create_track_callback(track_get_arrangement_clip_lengths))
         self.osc_server.add_handler("/live/track/get/arrangement_clips/start_time", create_track_callback(track_get_arrangement_clip_start_times))
 
-        def get_all_sub_rack_devices(rack):
-            all_sub_devices = []
-            for chain in rack.chains:
-                for device in chain.devices:
-                    if (str(type(device)) == "<class 'RackDevice.RackDevice'>"):
-                        all_sub_devices.extend([device])
-                        sub_devices = get_all_sub_rack_devices(device)
-                        all_sub_devices.extend(sub_devices)
-                    else:
-                        all_sub_devices.extend([device])
-            return all_sub_devices
-
-        def convert_dict_to_list(dict):
-            dict_list = list(dict.keys())[0]
-            dict_values = list(dict.values())[0]
-            return [dict_list] + dict_values
-
         def get_all_devices(track):
-            full_data = []
-            device_list = [x for x in track.devices]
-            devices = []
-            for device in device_list:
-                if ("RackDevice" in str(type(device))):
-                    rack = device
-                    devices.clear()
-                    for chain in rack.chains:
-                        for device in chain.devices:
-                            devices.append(device)
-                            if ("RackDevice" in str(type(device))):
-                                sub_devices = get_all_sub_rack_devices(device)
-                                devices.extend(sub_devices)
-                    all_devices_in_rack = {rack: devices}
-                    full_data.extend(convert_dict_to_list(all_devices_in_rack))
-                else:
-                    full_data.append(device)
-            return full_data
+            return self.device_index.get(track).devices
 
         def track_get_num_devices(track, _):
             devices = get_all_devices(track)
@@ -307,11 +303,8 @@ class TrackHandler(AbletonOSCHandler):
         self.osc_server.add_handler("/live/device/get/rack_device_name", create_track_callback(track_get_device_rack_device_name))
 
         def track_get_device_is_grouped(track, _):
-            full_data = get_all_devices(track)
-            if(str(type(full_data[_[0]].canonical_parent)) == "<class 'Chain.Chain'>"):#hasattr(full_data[_[0]].canonical_parent, 'chains')):
-                return tuple([_[0], True])
-            else:
-                return tuple([_[0], False])
+            entry = self.device_index.get(track).entries[_[0]]
+            return tuple([_[0], type(entry.chain).__name__ == "Chain"])
         self.osc_server.add_handler("/live/device/get/is_grouped", create_track_callback(track_get_device_is_grouped))
 
         def track_get_device_num_of_chains(track, _):
@@ -336,13 +329,13 @@ class TrackHandler(AbletonOSCHandler):
         self.osc_server.add_handler("/live/device/get/names_of_chains", create_track_callback(track_get_device_name_of_chains))
 
         def track_get_device_name_of_devicechains(track, _):
-            full_data = get_all_devices(track)
-            return tuple([_[0], [x.name for x in full_data[_[0]:] if 'Device.Device' in (str(type(x))) and 'Chain' in str(type(x.canonical_parent))]])
+            entries = self.device_index.get(track).entries
+            return tuple([_[0], [x.device.name for x in entries[_[0]:] if x.is_plain_device and x.chain is not None]])
         self.osc_server.add_handler("/live/device/get/names_of_devices_in_chain", create_track_callback(track_get_device_name_of_devicechains))
 
         def track_get_device_name_of_chain(track, _):
-            full_data = get_all_devices(track)
-            return tuple([_[0],[x.name for x in full_data if str(type(x)) == "<class 'RackDevice.RackDevice'>"][_[0]]])
+            racks = self.device_index.get(track).racks
+            return tuple([_[0], racks[_[0]].name])
         self.osc_server.add_handler("/live/device/get/chain_name", create_track_callback(track_get_device_name_of_chain))
 
         def get_device_location(track, _):
@@ -373,12 +366,11 @@ class TrackHandler(AbletonOSCHandler):
         self.osc_server.add_handler("/live/device/get/location", create_track_callback(get_device_location))
 
         def get_selected_device(track):
-            full_data = get_all_devices(self.song.view.selected_track)
-            selected_device_id = [i for i, x in enumerate(full_data) if(x == self.song.view.selected_track.view.selected_device)][0]
-            all_tracks = list(self.song.tracks)
-            all_tracks.extend(x for x in self.song.return_tracks)
-            all_tracks.extend([self.song.master_track])
-            selected_track_id = [i for i,x in enumerate(all_tracks) if(x == self.song.view.selected_track)][0]
+            track_table = self._get_track_table()
+            selected_track_id = track_table.index(self.song.view.selected_track)
+            selected_track = track_table[selected_track_id]
+            full_data = get_all_devices(selected_track)
+            selected_device_id = full_data.index(selected_track.view.selected_device)
             return (selected_track_id, selected_device_id)
         self.osc_server.add_handler("/live/device/get/selected", get_selected_device)
 
@@ -481,32 +473,21 @@ class TrackHandler(AbletonOSCHandler):
 
     def _start_mixer_listen(self, target, prop, params: Optional[Tuple] = ()) -> None:
         parameter_object = getattr(target.mixer_device, prop)
-        def property_changed_callback():
+        listener_key = (prop, tuple(params))
+        osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
+
+        def get_notifications():
             value = parameter_object.value
             self.logger.info("Property %s changed of %s %s: %s" % (prop, self.class_identifier, str(params), value))
-            osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
-            self.osc_server.send(osc_address, (*params, value,))
-
-        listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self._stop_mixer_listen(target, prop, params)
+            return [(osc_address, (*params, value,))]
 
         self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
-
-        parameter_object.add_value_listener(property_changed_callback)
-        self.listener_functions[listener_key] = property_changed_callback
+        self._add_listener(listener_key, parameter_object, "value", get_notifications=get_notifications)
+        remote_addr = self._add_subscriber(listener_key)
         #--------------------------------------------------------------------------------
-        # Immediately send the current value
+        # Immediately send the current value to the new subscriber
         #--------------------------------------------------------------------------------
-        property_changed_callback()
+        self._notify_subscriber(listener_key, remote_addr, get_notifications(), time.time())
 
     def _stop_mixer_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
-        parameter_object = getattr(target.mixer_device, prop)
-        listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), prop))
-            listener_function = self.listener_functions[listener_key]
-            parameter_object.remove_value_listener(listener_function)
-            del self.listener_functions[listener_key]
-        else:
-            self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
+        self._stop_listen(target, prop, params)
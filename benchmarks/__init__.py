@@ -0,0 +1,69 @@
+#--------------------------------------------------------------------------------
+# Offline micro-benchmarks for AbletonOSC.
+#
+# These run outside of Live, against the fake Live object model in fake_live.
+# Run from the AbletonOSC directory, e.g.:
+#
+#   python3 -m benchmarks.bench_dispatch
+#--------------------------------------------------------------------------------
+
+import time
+import types
+import importlib
+
+import fake_live
+
+def load_abletonosc():
+    """
+    Install the fake Live modules, and import and return the `abletonosc` package.
+    """
+    package = fake_live.import_abletonosc()
+    return importlib.import_module(package.__name__ + ".abletonosc")
+
+def load_pythonosc():
+    """
+    Import and return the vendored `pythonosc` package, as used by `abletonosc`,
+    with its message, bundle and builder modules loaded.
+    """
+    abletonosc = load_abletonosc()
+    package_name = abletonosc.__name__.rsplit(".", 1)[0] + ".pythonosc"
+    for module_name in ("osc_message", "osc_bundle", "osc_message_builder"):
+        importlib.import_module(package_name + "." + module_name)
+    return importlib.import_module(package_name)
+
+def create_server(abletonosc):
+    """
+    Create an OSCServer bound to an ephemeral loopback port, so that benchmarks
+    can run alongside a live AbletonOSC instance.
+    """
+    return abletonosc.OSCServer(local_addr=("127.0.0.1", 0))
+
+def create_handlers(abletonosc, server, song=None):
+    """
+    Register the full AbletonOSC API on `server`, in the same order as Manager,
+    with `song` (by default, an empty fake Song) as the current Live set.
+    """
+    fake_live.install(song if song is not None else fake_live.Song())
+    manager = types.SimpleNamespace(osc_server=server, device_index=abletonosc.DeviceIndex())
+    return [
+        abletonosc.SongHandler(manager),
+        abletonosc.ApplicationHandler(manager),
+        abletonosc.ClipHandler(manager),
+        abletonosc.ClipSlotHandler(manager),
+        abletonosc.TrackHandler(manager),
+        abletonosc.DeviceHandler(manager),
+        abletonosc.ViewHandler(manager),
+        abletonosc.SceneHandler(manager)
+    ]
+
+def timeit(fn, repeats: int = 5, number: int = 1000) -> float:
+    """
+    Returns the best per-call time of `fn`, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
@@ -0,0 +1,72 @@
+#--------------------------------------------------------------------------------
+# Compares OscMessageBuilder.build with the original implementation, which
+# appended each argument to the datagram in turn (quadratic in the number of
+# arguments) and then re-parsed the finished datagram.
+#
+# Packing plans are only cached for type tags of up to 64 characters, so for
+# larger messages each build includes compiling its plan. The speedup is
+# therefore small at a few hundred arguments, and grows with the argument count
+# as the legacy builder's quadratic cost takes over.
+#
+#   python3 -m benchmarks.bench_builder
+#--------------------------------------------------------------------------------
+
+from . import load_pythonosc, timeit
+
+ARG_COUNTS = (10, 100, 1000, 10000, 50000)
+
+def legacy_build(pythonosc, builder):
+    osc_types = pythonosc.parsing.osc_types
+    writers = {
+        "s": osc_types.write_string,
+        "i": osc_types.write_int,
+        "h": osc_types.write_int64,
+        "f": osc_types.write_float,
+        "d": osc_types.write_double,
+        "b": osc_types.write_blob,
+    }
+    dgram = b''
+    dgram += osc_types.write_string(builder.address)
+    dgram += osc_types.write_string(',' + "".join([arg[0] for arg in builder.args]))
+    for arg_type, value in builder.args:
+        if arg_type in writers:
+            dgram += writers[arg_type](value)
+    message = pythonosc.osc_message.OscMessage(dgram)
+    message.params
+    return message
+
+def create_builder(pythonosc, num_args):
+    #--------------------------------------------------------------------------------
+    # Mimic a /live/clip/get/notes reply: track_id, clip_id, then
+    # (pitch, start_time, duration, velocity, mute) per note.
+    #--------------------------------------------------------------------------------
+    builder = pythonosc.osc_message_builder.OscMessageBuilder("/live/clip/get/notes")
+    builder.add_arg(0)
+    builder.add_arg(0)
+    for index in range(num_args - 2):
+        field = index % 5
+        if field == 0:
+            builder.add_arg(36 + index % 48)
+        elif field in (1, 2):
+            builder.add_arg(index * 0.25)
+        elif field == 3:
+            builder.add_arg(100)
+        else:
+            builder.add_arg(False)
+    return builder
+
+def main():
+    pythonosc = load_pythonosc()
+
+    print("%-12s %14s %14s %9s" % ("args", "legacy (us)", "new (us)", "speedup"))
+    for num_args in ARG_COUNTS:
+        builder = create_builder(pythonosc, num_args)
+        assert builder.build().dgram == legacy_build(pythonosc, builder).dgram
+
+        number = max(1, 20000 // num_args)
+        legacy_time = timeit(lambda: legacy_build(pythonosc, builder), repeats=3, number=number)
+        new_time = timeit(lambda: builder.build(), repeats=3, number=number)
+        print("%-12d %14.1f %14.1f %8.1fx" % (num_args, legacy_time * 1e6, new_time * 1e6, legacy_time / new_time))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#--------------------------------------------------------------------------------
+# Compares /live/clips/filter with the original approach, which parsed every
+# clip's name to build its note cache (a full rebuild being the only way to
+# pick up renamed, added or deleted clips) and then set `muted` on every clip.
+#
+#   python3 -m benchmarks.bench_clip_filter
+#--------------------------------------------------------------------------------
+
+import re
+
+from . import load_abletonosc, create_server, create_handlers, timeit
+import fake_live
+from fake_live import Song, Track, ClipSlot
+
+NUM_TRACKS = 32
+NUM_SCENES = 64
+CHORDS = ("C-E-G", "D-F-A", "E-G-B", "F-A-C", "G-B-D", "A-C-E", "B-D-F")
+
+class Clip(fake_live.Clip):
+    """
+    Counts writes to `muted`, each of which is a LOM call in Live.
+    """
+    def __init__(self, name):
+        super().__init__(name)
+        self.muted_writes = 0
+
+    def __setattr__(self, name, value):
+        if name == "muted":
+            self.muted_writes += 1
+        super().__setattr__(name, value)
+
+def legacy_filter(abletonosc, song, note_names):
+    clip_module = abletonosc.clip
+    clip_notes_cache = []
+    for track in song.tracks:
+        clip_notes_cache.append([])
+        for clip_slot in track.clip_slots:
+            clip_notes_cache[-1].append([])
+            if clip_slot.has_clip:
+                match = re.search("([_-])([A-G][A-G#b1-9-]*)$", clip_slot.clip.name)
+                if match:
+                    clip_notes_list = re.sub("[1-9]", "", match.group(2)).split("-")
+                    clip_notes_cache[-1][-1] = [clip_module.note_name_to_midi(name) for name in clip_notes_list]
+    note_indices = [clip_module.note_name_to_midi(name) for name in note_names]
+    for track_index, track in enumerate(song.tracks):
+        for clip_slot_index, clip_slot in enumerate(track.clip_slots):
+            clip_notes_list = clip_notes_cache[track_index][clip_slot_index]
+            if clip_notes_list:
+                clip_slot.clip.muted = not all(note in note_indices for note in clip_notes_list)
+
+def get_muted(song):
+    return [[clip_slot.clip.muted for clip_slot in track.clip_slots if clip_slot.has_clip] for track in song.tracks]
+
+def count_muted_writes(song):
+    return sum(clip_slot.clip.muted_writes for track in song.tracks for clip_slot in track.clip_slots if clip_slot.has_clip)
+
+def main():
+    abletonosc = load_abletonosc()
+    song = Song([Track("Track %d" % track_index,
+                       [ClipSlot(Clip("Clip %d_%s" % (scene_index, CHORDS[(track_index + scene_index) % len(CHORDS)])))
+                        for scene_index in range(NUM_SCENES)])
+                 for track_index in range(NUM_TRACKS)])
+    server = create_server(abletonosc)
+    create_handlers(abletonosc, server, song)
+    clips_filter = server._callbacks["/live/clips/filter"]
+
+    #--------------------------------------------------------------------------------
+    # Check that both approaches agree, including after renaming a clip.
+    #--------------------------------------------------------------------------------
+    clips_filter(("C", "E", "G"))
+    legacy_muted = get_muted(song)
+    legacy_filter(abletonosc, song, ("C", "E", "G"))
+    assert get_muted(song) == legacy_muted
+    song.tracks[0].clip_slots[1].clip.name = "Renamed_C-G"
+    clips_filter(("C", "E", "G"))
+    assert song.tracks[0].clip_slots[1].clip.muted is False
+
+    print("Fake song: %d tracks x %d scenes" % (NUM_TRACKS, NUM_SCENES))
+    print()
+    filters = [("C", "E", "G"), ("D", "F", "A"), ("C", "E", "G", "B")]
+    for label, fn in (("legacy (rebuild, write all)", lambda note_names: legacy_filter(abletonosc, song, note_names)),
+                      ("cached masks", clips_filter)):
+        writes_before = count_muted_writes(song)
+        filter_time = timeit(lambda: [fn(note_names) for note_names in filters], number=20) / len(filters)
+        writes = (count_muted_writes(song) - writes_before) / (5 * 20 * len(filters))
+        print("%-40s %10.2f ms %10.1f muted writes per filter" % (label, filter_time * 1e3, writes))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#--------------------------------------------------------------------------------
+# Compares per-message device lookup by walking the track's racks and chains
+# (the original get_all_devices approach) with the cached DeviceIndex.
+#
+#   python3 -m benchmarks.bench_device_index
+#--------------------------------------------------------------------------------
+
+from . import load_abletonosc, create_server, create_handlers, timeit
+from fake_live import Song, Track, Device, RackDevice, Chain
+
+NUM_TRACKS = 16
+NUM_RACKS = 4
+NUM_CHAINS = 4
+NUM_DEVICES_PER_CHAIN = 3
+
+def create_track(name):
+    racks = []
+    for rack_index in range(NUM_RACKS):
+        chains = [Chain("Chain %d" % chain_index,
+                        [Device("Device %d" % device_index) for device_index in range(NUM_DEVICES_PER_CHAIN)])
+                  for chain_index in range(NUM_CHAINS)]
+        racks.append(RackDevice("Rack %d" % rack_index, chains))
+    return Track(name, devices=[Device("Instrument")] + racks)
+
+def walk_devices(track):
+    devices = []
+    def walk(container):
+        for device in container.devices:
+            devices.append(device)
+            if device.can_have_chains:
+                for chain in device.chains:
+                    walk(chain)
+    walk(track)
+    return devices
+
+def main():
+    abletonosc = load_abletonosc()
+    song = Song([create_track("Track %d" % index) for index in range(NUM_TRACKS)])
+    server = create_server(abletonosc)
+    handlers = create_handlers(abletonosc, server, song)
+    device_handler = [handler for handler in handlers if isinstance(handler, abletonosc.DeviceHandler)][0]
+    track = song.tracks[-1]
+    track_index = NUM_TRACKS - 1
+    device_index = len(walk_devices(track)) - 1
+
+    def walk_lookup():
+        return walk_devices(song.tracks[track_index])[device_index]
+
+    def indexed_lookup():
+        return device_handler.device_index.get(device_handler._get_track_table()[track_index]).devices[device_index]
+
+    assert device_handler.device_index.get(track).devices == walk_devices(track)
+    assert walk_lookup() is indexed_lookup()
+    get_name = server._callbacks["/live/device/get/name"]
+    assert get_name((track_index, device_index)) == (track_index, device_index, "Device %d" % (NUM_DEVICES_PER_CHAIN - 1))
+
+    print("Fake track: %d devices (%d racks x %d chains x %d devices)" %
+          (device_index + 1, NUM_RACKS, NUM_CHAINS, NUM_DEVICES_PER_CHAIN))
+    print()
+    walk_time = timeit(walk_lookup, number=10000)
+    indexed_time = timeit(indexed_lookup, number=10000)
+    print("%-40s %10.2f us" % ("lookup (walk racks and chains)", walk_time * 1e6))
+    print("%-40s %10.2f us" % ("lookup (device index)", indexed_time * 1e6))
+    print("%-40s %9.1fx" % ("speedup", walk_time / indexed_time))
+
+    #--------------------------------------------------------------------------------
+    # Adding a device to a chain fires the chain's devices listener, which marks
+    # the track as stale so that it is rebuilt on the next lookup.
+    #--------------------------------------------------------------------------------
+    chain = track.devices[-1].chains[-1]
+    chain.insert_device("New device")
+    assert device_handler.device_index.get(track).devices[-1].name == "New device"
+
+    #--------------------------------------------------------------------------------
+    # Deleting a track invalidates the track table, and with it the device index.
+    #--------------------------------------------------------------------------------
+    song.delete_track(0)
+    assert get_name((0, 0)) == (0, 0, "Instrument")
+    assert len(song.tracks[0]._listeners["devices"]) == 1
+    for handler in handlers:
+        handler.clear_api()
+    device_handler.device_index.clear()
+    assert not song.tracks[0]._listeners["devices"]
+    assert not track._listeners["devices"]
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
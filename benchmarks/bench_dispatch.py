@@ -0,0 +1,49 @@
+#--------------------------------------------------------------------------------
+# Compares wildcard address resolution via a linear regex scan of every
+# registered handler (the original OSCServer.process_message approach) with
+# the segment trie built by OSCServer.add_handler.
+#
+#   python3 -m benchmarks.bench_dispatch
+#--------------------------------------------------------------------------------
+
+import re
+
+from . import load_abletonosc, create_server, create_handlers, timeit
+
+PATTERNS = [
+    "/live/clip/get/*",
+    "/live/track/get/*",
+    "/live/clip_slot/get/*",
+    "/live/song/get/*",
+    "/live/device/get/parameters/*",
+    "/live/*/get/name",
+    "/live/track/start_listen/*",
+]
+
+def linear_scan(callbacks, pattern):
+    regex = pattern.replace("*", "[^/]+")
+    return [address for address in callbacks if re.match(regex, address)]
+
+def main():
+    abletonosc = load_abletonosc()
+    server = create_server(abletonosc)
+    create_handlers(abletonosc, server)
+    callbacks = server._callbacks
+
+    print("Registered handlers: %d" % len(callbacks))
+    print()
+    print("%-32s %8s %12s %12s %8s" % ("pattern", "matches", "linear (us)", "trie (us)", "speedup"))
+    for pattern in PATTERNS:
+        expected = linear_scan(callbacks, pattern)
+        actual = server.match_wildcard(pattern)
+        assert actual == expected, "Mismatch for %s: %s != %s" % (pattern, actual, expected)
+
+        linear_time = timeit(lambda: linear_scan(callbacks, pattern))
+        trie_time = timeit(lambda: server.match_wildcard(pattern))
+        print("%-32s %8d %12.1f %12.1f %7.1fx" % (pattern, len(expected),
+                                                   linear_time * 1e6, trie_time * 1e6,
+                                                   linear_time / trie_time))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
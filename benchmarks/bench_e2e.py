@@ -0,0 +1,361 @@
+#--------------------------------------------------------------------------------
+# End-to-end benchmark of the OSC API: replays mixes of get, set, listen and
+# wildcard traffic through OSCServer and the handlers, ticking them as Manager
+# does, against a synthetic fake_live set. Reports throughput, p50/p99 latency
+# and the cost of each address.
+#
+#  - In-process mode queues datagrams on the server's backlog and ticks straight
+#    away, so latency is the time taken to handle each message.
+#  - Loopback mode sends datagrams over UDP at a fixed rate and ticks every
+#    100ms in real time, so latency is the round trip from send to reply,
+#    including the wait for the next tick.
+#
+#   python3 -m benchmarks.bench_e2e
+#   python3 -m benchmarks.bench_e2e --mode loopback --rate 2000
+#
+# --stats enables the server's per-address statistics, to measure their overhead.
+#
+# Results are compared against the baseline file (benchmarks/baseline.json, one
+# entry per mode) if it exists, and --save-baseline makes the current results the
+# new baseline. Baselines are specific to a machine, so are not checked in.
+#--------------------------------------------------------------------------------
+
+import os
+import sys
+import json
+import time
+import socket
+import logging
+import random
+import argparse
+import collections
+from typing import Dict, List, Optional, Tuple
+
+import fake_live
+from . import load_abletonosc, load_pythonosc, create_handlers
+
+NUM_TRACKS = 16
+NUM_SCENES = 8
+NUM_PARAMETERS = 8
+TICK_DURATION = fake_live.TICK_DURATION
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+#--------------------------------------------------------------------------------
+# Each mix is a list of message generators, chosen between at random. Each
+# generator returns (address, params, reply_address), where reply_address is
+# the address of the single reply used to measure the message's round trip, or
+# None for messages whose replies can't be told apart from others (e.g. listener
+# notifications), which are excluded from loopback latencies.
+#--------------------------------------------------------------------------------
+def _track(rng):
+    return rng.randrange(NUM_TRACKS)
+
+def _scene(rng):
+    return rng.randrange(NUM_SCENES)
+
+def _parameter(rng):
+    return rng.randrange(NUM_PARAMETERS + 1)
+
+GET_TRAFFIC = [
+    lambda rng: ("/live/song/get/tempo", (), "/live/song/get/tempo"),
+    lambda rng: ("/live/track/get/volume", (_track(rng),), "/live/track/get/volume"),
+    lambda rng: ("/live/clip/get/name", (_track(rng), _scene(rng)), "/live/clip/get/name"),
+    lambda rng: ("/live/device/get/parameter/value", (_track(rng), 0, _parameter(rng)),
+                 "/live/device/get/parameter/value"),
+]
+
+SET_TRAFFIC = [
+    lambda rng: ("/live/song/set/tempo", (float(rng.randrange(60, 180)),), None),
+    lambda rng: ("/live/track/set/volume", (_track(rng), rng.random()), None),
+    lambda rng: ("/live/clip/set/name", (_track(rng), _scene(rng), "Clip_C-E-G"), None),
+    lambda rng: ("/live/device/set/parameter/value", (_track(rng), 0, _parameter(rng) or 1, rng.random()), None),
+]
+
+LISTEN_TRAFFIC = [
+    lambda rng: ("/live/track/start_listen/panning", (_track(rng),), None),
+    lambda rng: ("/live/track/set/panning", (_track(rng), rng.uniform(-1.0, 1.0)), None),
+    lambda rng: ("/live/track/set/panning", (_track(rng), rng.uniform(-1.0, 1.0)), None),
+    lambda rng: ("/live/track/stop_listen/panning", (_track(rng),), None),
+]
+
+WILDCARD_TRAFFIC = [
+    lambda rng: ("/live/clip/get/*", (_track(rng), _scene(rng)), "/live/clip/get/length"),
+    lambda rng: ("/live/device/get/parameters/*", (_track(rng), 0), "/live/device/get/parameters/max"),
+]
+
+MIXES = {
+    "get": GET_TRAFFIC,
+    "set": SET_TRAFFIC,
+    "listen": LISTEN_TRAFFIC,
+    "wildcard": WILDCARD_TRAFFIC,
+    "mixed": GET_TRAFFIC * 4 + SET_TRAFFIC * 2 + LISTEN_TRAFFIC + WILDCARD_TRAFFIC,
+}
+
+def create_traffic(mix: str, count: int, seed: int = 0) -> List[Tuple[str, tuple, Optional[str]]]:
+    rng = random.Random(seed)
+    generators = MIXES[mix]
+    return [rng.choice(generators)(rng) for _ in range(count)]
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns the value at `fraction` (0..1) of the way through `values`, by the
+    nearest-rank method, or 0.0 if `values` is empty.
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+class Bench:
+    """
+    An OSCServer and the full set of handlers, serving a synthetic set to a client
+    socket on the loopback interface.
+
+    Ticks are timed, so that the server's own time can be told apart from time spent
+    waiting, and so is the handling of each datagram, by wrapping the server's
+    parse_bundle.
+    """
+    def __init__(self, abletonosc, pythonosc, stats: bool = False):
+        self.pythonosc = pythonosc
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.client.bind(("127.0.0.1", 0))
+        self.client.setblocking(False)
+        self.client_addr = self.client.getsockname()
+
+        self.server = abletonosc.OSCServer(local_addr=("127.0.0.1", 0), remote_addr=self.client_addr)
+        self.server_addr = self.server._socket.getsockname()
+        self.server.set_stats_enabled(stats)
+        song = fake_live.create_song(num_tracks=NUM_TRACKS, num_scenes=NUM_SCENES, clip_density=1.0,
+                                     num_parameters=NUM_PARAMETERS)
+        self.handlers = create_handlers(abletonosc, self.server, song)
+
+        self.handling_times: Dict[str, List[float]] = collections.defaultdict(list)
+        self.tick_time = 0.0
+        parse_bundle = self.server.parse_bundle
+
+        def timed_parse_bundle(data, remote_addr):
+            t0 = time.perf_counter()
+            parse_bundle(data, remote_addr)
+            address = data[:data.index(b"\0")].decode() if data[:1] == b"/" else "#bundle"
+            self.handling_times[address].append(time.perf_counter() - t0)
+
+        self.server.parse_bundle = timed_parse_bundle
+
+    def reset(self) -> None:
+        """
+        Clear timings, listeners and any replies left on the client socket, between mixes.
+        """
+        for handler in self.handlers:
+            handler._clear_listeners()
+        self.tick()
+        self.receive()
+        self.handling_times.clear()
+        self.tick_time = 0.0
+
+    def build(self, address: str, params: tuple) -> bytes:
+        builder = self.pythonosc.osc_message_builder.OscMessageBuilder(address=address)
+        for param in params:
+            builder.add_arg(param)
+        return builder.build().dgram
+
+    def tick(self) -> None:
+        """
+        Handle queued datagrams, fan out listener notifications and flush replies, as
+        Manager.tick does.
+        """
+        t0 = time.perf_counter()
+        self.server.process()
+        for handler in self.handlers:
+            handler.flush_listeners()
+        self.server.flush()
+        self.tick_time += time.perf_counter() - t0
+
+    def receive(self) -> List[Tuple[float, str]]:
+        """
+        Returns the (time, address) of each reply waiting on the client socket.
+        """
+        replies = []
+        while True:
+            try:
+                data = self.client.recv(65536)
+            except BlockingIOError:
+                return replies
+            replies.append((time.perf_counter(), data[:data.index(b"\0")].decode()))
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.client.close()
+
+def run_inprocess(bench: Bench, traffic, messages_per_tick: int) -> dict:
+    """
+    Queue `messages_per_tick` datagrams at a time on the server's backlog, and tick.
+    Latency is the time taken to handle each message, including sending its replies.
+    """
+    dgrams = [bench.build(address, params) for address, params, _ in traffic]
+    replies = 0
+    for offset in range(0, len(dgrams), messages_per_tick):
+        bench.server._backlog.extend((dgram, bench.client_addr) for dgram in dgrams[offset:offset + messages_per_tick])
+        while bench.server.backlog_size:
+            bench.tick()
+            replies += len(bench.receive())
+    latencies = [t for times in bench.handling_times.values() for t in times]
+    return {"replies": replies, "latencies": latencies}
+
+def run_loopback(bench: Bench, traffic, rate: float) -> dict:
+    """
+    Send datagrams over UDP at `rate` messages per second, ticking every 100ms, until
+    all have been sent and their replies received (or a second has passed without any).
+    Latency is the round trip of each message with a distinguishable reply.
+    """
+    dgrams = [bench.build(address, params) for address, params, _ in traffic]
+    pending = collections.defaultdict(collections.deque)
+    latencies = []
+    replies = 0
+    index = 0
+    t0 = time.perf_counter()
+    next_send_time = t0
+    next_tick_time = t0 + TICK_DURATION
+    last_reply_time = t0
+    while True:
+        now = time.perf_counter()
+        while index < len(dgrams) and next_send_time <= now:
+            bench.client.sendto(dgrams[index], bench.server_addr)
+            reply_address = traffic[index][2]
+            if reply_address is not None:
+                pending[reply_address].append(now)
+            index += 1
+            next_send_time += 1.0 / rate
+        if now >= next_tick_time:
+            bench.tick()
+            next_tick_time += TICK_DURATION
+        for reply_time, address in bench.receive():
+            replies += 1
+            last_reply_time = reply_time
+            if pending[address]:
+                latencies.append(reply_time - pending[address].popleft())
+        if index == len(dgrams) and not bench.server.backlog_size:
+            if not any(pending.values()) or now - max(last_reply_time, next_send_time) > 1.0:
+                break
+        wake_time = min(next_send_time if index < len(dgrams) else next_tick_time, next_tick_time)
+        time.sleep(max(wake_time - time.perf_counter(), 0.0))
+    return {"replies": replies, "latencies": latencies}
+
+def run(mode: str, messages: int, rate: float, seed: int, stats: bool = False) -> dict:
+    abletonosc = load_abletonosc()
+    pythonosc = load_pythonosc()
+    bench = Bench(abletonosc, pythonosc, stats)
+    results = {"mixes": {}, "addresses": {}}
+    costs = collections.defaultdict(list)
+    try:
+        for mix in MIXES:
+            traffic = create_traffic(mix, messages, seed)
+            bench.reset()
+            if mode == "inprocess":
+                result = run_inprocess(bench, traffic, max(int(rate * TICK_DURATION), 1))
+            else:
+                result = run_loopback(bench, traffic, rate)
+            results["mixes"][mix] = {
+                "messages": messages,
+                "replies": result["replies"],
+                "throughput": messages / bench.tick_time,
+                "p50_ms": percentile(result["latencies"], 0.5) * 1e3,
+                "p99_ms": percentile(result["latencies"], 0.99) * 1e3,
+            }
+            for address, times in bench.handling_times.items():
+                costs[address] += times
+    finally:
+        bench.close()
+    for address in sorted(costs):
+        times = costs[address]
+        results["addresses"][address] = {
+            "count": len(times),
+            "mean_us": sum(times) / len(times) * 1e6,
+            "p99_us": percentile(times, 0.99) * 1e6,
+        }
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Returns a description of each metric that has regressed by more than `threshold`
+    (as a fraction) since the baseline: lower throughput, or higher latency or cost.
+    """
+    regressions = []
+    checks = [("mixes", "throughput", -1), ("mixes", "p99_ms", 1), ("addresses", "mean_us", 1)]
+    for section, metric, direction in checks:
+        for key, values in results[section].items():
+            base_value = baseline.get(section, {}).get(key, {}).get(metric)
+            if not base_value:
+                continue
+            change = (values[metric] - base_value) / base_value
+            if change * direction > threshold:
+                regressions.append("%s %s: %.2f -> %.2f (%+.0f%%)" % (key, metric, base_value, values[metric], change * 100))
+    return regressions
+
+def print_results(results: dict, baseline: Optional[dict], mode: str) -> None:
+    def change(section, key, metric):
+        if baseline is None or key not in baseline.get(section, {}):
+            return ""
+        base_value = baseline[section][key][metric]
+        return "%+.0f%%" % ((results[section][key][metric] - base_value) / base_value * 100) if base_value else ""
+
+    print("Mode: %s (latency is %s)" % (mode, "handling time" if mode == "inprocess" else "round trip"))
+    print()
+    print("%-10s %9s %9s %14s %8s %10s %8s %10s %8s" % ("mix", "messages", "replies", "throughput/s", "",
+                                                        "p50 (ms)", "", "p99 (ms)", ""))
+    for mix, values in results["mixes"].items():
+        print("%-10s %9d %9d %14.0f %8s %10.3f %8s %10.3f %8s" % (
+            mix, values["messages"], values["replies"],
+            values["throughput"], change("mixes", mix, "throughput"),
+            values["p50_ms"], change("mixes", mix, "p50_ms"),
+            values["p99_ms"], change("mixes", mix, "p99_ms")))
+    print()
+    print("%-40s %8s %10s %8s %10s" % ("address", "count", "mean (us)", "", "p99 (us)"))
+    for address, values in results["addresses"].items():
+        print("%-40s %8d %10.1f %8s %10.1f" % (address, values["count"], values["mean_us"],
+                                             change("addresses", address, "mean_us"), values["p99_us"]))
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end throughput and latency benchmark")
+    parser.add_argument("--mode", choices=("inprocess", "loopback"), default="inprocess")
+    parser.add_argument("--messages", type=int, default=2000, help="Number of messages per mix")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Messages sent per second")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the traffic")
+    parser.add_argument("--stats", action="store_true", help="Record the server's per-address statistics")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Fractional change beyond which a metric counts as a regression")
+    args = parser.parse_args()
+
+    #--------------------------------------------------------------------------------
+    # The listen mix stops listening to tracks at random, which logs a warning for
+    # each track that wasn't being listened to.
+    #--------------------------------------------------------------------------------
+    logging.getLogger("abletonosc").setLevel(logging.ERROR)
+    results = run(args.mode, args.messages, args.rate, args.seed, args.stats)
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as fd:
+            baselines = json.load(fd)
+    baseline = baselines.get(args.mode)
+    print_results(results, baseline, args.mode)
+
+    if args.save_baseline:
+        baselines[args.mode] = results
+        with open(args.baseline, "w") as fd:
+            json.dump(baselines, fd, indent=2, sort_keys=True)
+        print()
+        print("Saved baseline to %s" % args.baseline)
+    elif baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        if regressions:
+            print("Regressions since baseline (beyond %.0f%%):" % (args.threshold * 100))
+            for regression in regressions:
+                print("  " + regression)
+            sys.exit(1)
+        print("No regressions since baseline (beyond %.0f%%)" % (args.threshold * 100))
+
+if __name__ == "__main__":
+    main()
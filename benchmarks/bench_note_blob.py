@@ -0,0 +1,73 @@
+#--------------------------------------------------------------------------------
+# Compares querying a large clip's notes as flattened params (/live/clip/get/notes)
+# with the packed blob format (/live/clip/get/notes/blob): the time to build and
+# send the reply, its size on the wire, and the time for a client to decode it.
+#
+#   python3 -m benchmarks.bench_note_blob
+#--------------------------------------------------------------------------------
+
+from . import load_abletonosc, load_pythonosc, create_server, create_handlers, timeit
+from fake_live import Song, Track, ClipSlot, Clip
+from client.notes import unpack_notes
+
+NUM_NOTES = 20000
+REMOTE_ADDR = ("127.0.0.1", 11001)
+
+def main():
+    abletonosc = load_abletonosc()
+    pythonosc = load_pythonosc()
+    notes = [(36 + index % 48, index * 0.25, 0.25, 100.0, False) for index in range(NUM_NOTES)]
+    song = Song([Track("Track 0", [ClipSlot(Clip("Notes", NUM_NOTES * 0.25, notes=notes))])])
+    server = create_server(abletonosc)
+    create_handlers(abletonosc, server, song)
+
+    #--------------------------------------------------------------------------------
+    # Queue replies as if for a client that has opted in to bundled replies, so that
+    # the benchmark doesn't measure the socket.
+    #--------------------------------------------------------------------------------
+    server.set_bundle_replies(REMOTE_ADDR, True)
+
+    def query(address):
+        server._outbound.clear()
+        server._send_reply(address, server._callbacks[address]((0, 0)), REMOTE_ADDR)
+        return server._outbound[REMOTE_ADDR]
+
+    def decode_params(dgrams):
+        #--------------------------------------------------------------------------------
+        # Large flattened replies are chunked, so reassemble the chunks' params and
+        # regroup them into notes.
+        #--------------------------------------------------------------------------------
+        params = []
+        for dgram in dgrams:
+            message = pythonosc.osc_message.OscMessage(dgram)
+            if message.address == "/live/chunk/data":
+                params += message.params[2:]
+            elif message.address == "/live/clip/get/notes":
+                params += message.params
+        return [tuple(params[offset:offset + 5]) for offset in range(2, len(params), 5)]
+
+    def decode_blob(dgrams):
+        blob = b""
+        for dgram in dgrams:
+            params = pythonosc.osc_message.OscMessage(dgram).params
+            blob += params[5]
+        return unpack_notes(blob, params[2])
+
+    #--------------------------------------------------------------------------------
+    # As in Live, get_notes_extended returns notes ordered by pitch, then time.
+    #--------------------------------------------------------------------------------
+    expected = sorted(notes)
+    print("%d notes" % NUM_NOTES)
+    print("%-24s %12s %12s %12s %12s" % ("format", "datagrams", "bytes", "reply (ms)", "decode (ms)"))
+    for label, address, decode in (("params", "/live/clip/get/notes", decode_params),
+                                   ("blob", "/live/clip/get/notes/blob", decode_blob)):
+        dgrams = query(address)
+        assert decode(dgrams) == expected
+        reply_time = timeit(lambda: query(address), repeats=3, number=5)
+        decode_time = timeit(lambda: decode(dgrams), repeats=3, number=5)
+        print("%-24s %12d %12d %12.2f %12.2f" % (label, len(dgrams), sum(len(dgram) for dgram in dgrams),
+                                                  reply_time * 1e3, decode_time * 1e3))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#--------------------------------------------------------------------------------
+# Compares OscMessage parsing with the original parser, which walked the type tag
+# with an if/elif chain, scanned strings byte by byte and sliced the datagram for
+# each argument.
+#
+#   python3 -m benchmarks.bench_parser
+#--------------------------------------------------------------------------------
+
+import struct
+
+from . import load_pythonosc, timeit
+
+NUM_NOTES = 5000
+
+#--------------------------------------------------------------------------------
+# The original parser, reduced to the argument types that AbletonOSC uses.
+#--------------------------------------------------------------------------------
+def legacy_get_string(dgram, start_index):
+    offset = 0
+    while dgram[start_index + offset] != 0:
+        offset += 1
+    if offset % 4 == 0:
+        offset += 4
+    else:
+        offset += (-offset % 4)
+    if offset > len(dgram[start_index:]):
+        raise ValueError("Datagram is too short")
+    data_str = dgram[start_index:start_index + offset]
+    return data_str.replace(b'\x00', b'').decode('utf-8'), start_index + offset
+
+def legacy_get_fixed(format, size):
+    def get_fixed(dgram, start_index):
+        if len(dgram[start_index:]) < size:
+            raise ValueError("Datagram is too short")
+        return struct.unpack(format, dgram[start_index:start_index + size])[0], start_index + size
+    return get_fixed
+
+legacy_get_int = legacy_get_fixed(">i", 4)
+legacy_get_float = legacy_get_fixed(">f", 4)
+legacy_get_double = legacy_get_fixed(">d", 8)
+
+def legacy_parse(dgram):
+    address, index = legacy_get_string(dgram, 0)
+    if not dgram[index:]:
+        return address, []
+    type_tag, index = legacy_get_string(dgram, index)
+    if type_tag.startswith(','):
+        type_tag = type_tag[1:]
+    params = []
+    for param in type_tag:
+        if param == "i":
+            val, index = legacy_get_int(dgram, index)
+        elif param == "f":
+            val, index = legacy_get_float(dgram, index)
+        elif param == "d":
+            val, index = legacy_get_double(dgram, index)
+        elif param == "s":
+            val, index = legacy_get_string(dgram, index)
+        elif param == "T":
+            val = True
+        elif param == "F":
+            val = False
+        elif param == "N":
+            val = None
+        else:
+            raise ValueError("Unhandled parameter type: %s" % param)
+        params.append(val)
+    return address, params
+
+def build_message(pythonosc, address, params):
+    builder = pythonosc.osc_message_builder.OscMessageBuilder(address)
+    for param in params:
+        builder.add_arg(param)
+    return builder.build().dgram
+
+def main():
+    pythonosc = load_pythonosc()
+
+    notes = []
+    for note_index in range(NUM_NOTES):
+        notes += [36 + note_index % 48, note_index * 0.25, 0.25, 100, False]
+
+    messages = [
+        ("/live/song/get/tempo", []),
+        ("/live/track/get/volume", [3]),
+        ("/live/song/set/tempo", [123.5]),
+        ("/live/track/set/name", [3, "Lead synth"]),
+        ("/live/clip/get/notes", [2, 4]),
+        ("/live/song/get/track_data", [0, 16, "track.name", "clip.name", "clip.length"]),
+        ("/live/clip/add/notes", [2, 4] + notes),
+    ]
+
+    print("%-40s %12s %12s %9s" % ("message", "legacy (us)", "new (us)", "speedup"))
+    for address, params in messages:
+        dgram = build_message(pythonosc, address, params)
+        legacy_address, legacy_params = legacy_parse(dgram)
+        message = pythonosc.osc_message.OscMessage(dgram)
+        assert (message.address, message.params) == (legacy_address, legacy_params)
+
+        number = 20 if len(params) > 1000 else 10000
+        legacy_time = timeit(lambda: legacy_parse(dgram), number=number)
+        new_time = timeit(lambda: pythonosc.osc_message.OscMessage(dgram).params, number=number)
+        label = "%s (%d args)" % (address, len(params))
+        print("%-40s %12.2f %12.2f %8.1fx" % (label, legacy_time * 1e6, new_time * 1e6, legacy_time / new_time))
+
+if __name__ == "__main__":
+    main()
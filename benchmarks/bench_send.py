@@ -0,0 +1,60 @@
+#--------------------------------------------------------------------------------
+# Compares OSCServer.send, which packs params into a cached per-(address, type tag)
+# reply template, with building each reply with OscMessageBuilder (the original
+# approach).
+#
+#   python3 -m benchmarks.bench_send
+#--------------------------------------------------------------------------------
+
+from . import load_abletonosc, load_pythonosc, create_server, timeit
+
+REMOTE_ADDR = ("127.0.0.1", 11001)
+
+def main():
+    abletonosc = load_abletonosc()
+    pythonosc = load_pythonosc()
+    server = create_server(abletonosc)
+
+    #--------------------------------------------------------------------------------
+    # Queue replies as if for a client that has opted in to bundled replies, and
+    # discard them, so that the benchmark doesn't measure the socket.
+    #--------------------------------------------------------------------------------
+    server.set_bundle_replies(REMOTE_ADDR, True)
+
+    def builder_send(address, params):
+        builder = pythonosc.osc_message_builder.OscMessageBuilder(address)
+        for param in params:
+            builder.add_arg(param)
+        server._outbound.setdefault(REMOTE_ADDR, []).append(builder.build().dgram)
+        server._outbound.clear()
+
+    def template_send(address, params):
+        server.send(address, params, REMOTE_ADDR)
+        server._outbound.clear()
+
+    replies = [
+        ("/live/song/get/beat", (12,)),
+        ("/live/track/get/volume", (3, 0.85)),
+        ("/live/track/get/mute", (3, False)),
+        ("/live/device/get/parameter/value", (3, 0, 4, 0.5)),
+        ("/live/device/get/parameter/value_string", (3, 0, 4, "2500 Hz")),
+        ("/live/clip/get/notes", (0, 0) + (60, 0.0, 0.25, 100, False) * 64),
+    ]
+
+    print("%-50s %12s %12s %9s" % ("reply", "builder (us)", "template (us)", "speedup"))
+    for address, params in replies:
+        server.send(address, params, REMOTE_ADDR)
+        builder = pythonosc.osc_message_builder.OscMessageBuilder(address)
+        for param in params:
+            builder.add_arg(param)
+        assert server._outbound[REMOTE_ADDR] == [builder.build().dgram]
+        server._outbound.clear()
+
+        builder_time = timeit(lambda: builder_send(address, params), number=5000)
+        template_time = timeit(lambda: template_send(address, params), number=5000)
+        label = "%s (%d params)" % (address, len(params))
+        print("%-50s %12.2f %12.2f %8.1fx" % (label, builder_time * 1e6, template_time * 1e6, builder_time / template_time))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#--------------------------------------------------------------------------------
+# Compares per-message track lookup by concatenating the song's track vectors
+# (the original TrackHandler/DeviceHandler approach) with the cached track table.
+#
+#   python3 -m benchmarks.bench_track_table
+#--------------------------------------------------------------------------------
+
+from . import load_abletonosc, create_server, create_handlers, timeit
+from fake_live import Song, Track
+
+NUM_TRACKS = 200
+NUM_RETURN_TRACKS = 4
+
+def main():
+    abletonosc = load_abletonosc()
+    #--------------------------------------------------------------------------------
+    # As in Live, each access to the fake Song's `tracks` or `return_tracks` fetches a
+    # new tuple of track objects.
+    #--------------------------------------------------------------------------------
+    song = Song([Track("Track %d" % index) for index in range(NUM_TRACKS)],
+                [Track("Return %d" % index, can_be_armed=False) for index in range(NUM_RETURN_TRACKS)])
+    server = create_server(abletonosc)
+    handlers = create_handlers(abletonosc, server, song)
+    track_handler = [handler for handler in handlers if isinstance(handler, abletonosc.TrackHandler)][0]
+    track_index = NUM_TRACKS - 1
+
+    def concatenate_lookup():
+        return [song.tracks + song.return_tracks + (song.master_track,)][0][track_index]
+
+    def cached_lookup():
+        return track_handler._get_track_table()[track_index]
+
+    assert concatenate_lookup() is cached_lookup()
+    get_name = server._callbacks["/live/track/get/name"]
+    assert get_name((track_index,)) == (track_index, "Track %d" % track_index)
+
+    print("Fake song: %d tracks, %d return tracks" % (NUM_TRACKS, NUM_RETURN_TRACKS))
+    print()
+    concatenate_time = timeit(concatenate_lookup, number=10000)
+    cached_time = timeit(cached_lookup, number=10000)
+    print("%-40s %10.2f us" % ("lookup (concatenate vectors)", concatenate_time * 1e6))
+    print("%-40s %10.2f us" % ("lookup (cached track table)", cached_time * 1e6))
+    print("%-40s %9.1fx" % ("speedup", concatenate_time / cached_time))
+
+    callback_time = timeit(lambda: get_name((track_index,)), number=10000)
+    print("%-40s %10.2f us" % ("/live/track/get/name (cached)", callback_time * 1e6))
+
+    #--------------------------------------------------------------------------------
+    # Adding a track fires the tracks listener, which invalidates the table.
+    #--------------------------------------------------------------------------------
+    song.create_midi_track()
+    assert track_handler._get_track_table()[NUM_TRACKS] is song.tracks[-1]
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import argparse
+import logging
+import socket
 import threading
+import time
 from pythonosc.udp_client import SimpleUDPClient, OscBundle, OscMessageBuilder
-from pythonosc.osc_bundle_builder import OscBundleBuilder
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 from typing import Callable, Iterable
@@ -15,6 +18,16 @@ LOCAL_PORT = 11001
 #--------------------------------------------------------------------------------
 TICK_DURATION = 0.150
 
+#--------------------------------------------------------------------------------
+# Chunked replies that are still incomplete after CHUNK_TRANSFER_TIMEOUT seconds
+# (e.g. because a chunk was lost) are discarded. At most MAX_CHUNK_TRANSFERS are
+# reassembled at once, discarding the oldest beyond that.
+#--------------------------------------------------------------------------------
+CHUNK_TRANSFER_TIMEOUT = 5.0
+MAX_CHUNK_TRANSFERS = 64
+
+logger = logging.getLogger(__name__)
+
 class AbletonOSCClient:
     def __init__(self, hostname="127.0.0.1", port=REMOTE_PORT, client_port=LOCAL_PORT):
         """
@@ -27,6 +40,19 @@ class AbletonOSCClient:
         dispatcher = Dispatcher()
         dispatcher.set_default_handler(self.handle_osc)
         self.server = ThreadingOSCUDPServer(("0.0.0.0", client_port), dispatcher)
+        #--------------------------------------------------------------------------------
+        # socketserver reads at most 8kB per datagram by default, truncating larger
+        # replies. Read up to the largest UDP payload instead.
+        #--------------------------------------------------------------------------------
+        self.server.max_packet_size = 65535
+        #--------------------------------------------------------------------------------
+        # Enlarge the receive buffer, so that large replies split across many datagrams
+        # are not dropped. The OS may cap this at a lower value.
+        #--------------------------------------------------------------------------------
+        try:
+            self.server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        except OSError:
+            pass
         self.server_thread = threading.Thread(target=self.server.serve_forever)
         self.server_thread.daemon = True
         self.server_thread.start()
@@ -34,24 +60,86 @@ class AbletonOSCClient:
         self.client = SimpleUDPClient(hostname, port)
         self.verbose = False
 
+        #--------------------------------------------------------------------------------
+        # Chunked replies that are being reassembled, keyed by transfer ID. Each is a
+        # dict containing the reply's address, chunk and param counts (once the header
+        # has been received), the chunks received so far, and the time that its first
+        # chunk was received.
+        #--------------------------------------------------------------------------------
+        self.transfers = {}
+        self.transfer_timeout = CHUNK_TRANSFER_TIMEOUT
+        self.transfers_lock = threading.Lock()
+
     def handle_osc(self, address, *params):
         # print("Received OSC: %s %s" % (address, params))
+        if address == "/live/chunk/header" or address == "/live/chunk/data":
+            self.handle_chunk(address, params)
+            return
         if address in self.address_handlers:
             self.address_handlers[address](address, params)
         if self.verbose:
             print(address, params)
 
+    def handle_chunk(self, address, params):
+        """
+        Reassemble a reply that has been split into chunks, and handle it as a regular
+        message once all its chunks have been received. Chunks may arrive in any order.
+        Incomplete replies are discarded once they expire.
+        """
+        transfer_id = params[0]
+        with self.transfers_lock:
+            self._expire_transfers()
+            transfer = self.transfers.get(transfer_id)
+            if transfer is None:
+                transfer = {"chunks": {}, "time": time.monotonic()}
+                self.transfers[transfer_id] = transfer
+            if address == "/live/chunk/header":
+                _, transfer["address"], transfer["chunk_count"], transfer["param_count"] = params
+            else:
+                sequence_number = params[1]
+                transfer["chunks"][sequence_number] = params[2:]
+            if "chunk_count" not in transfer or len(transfer["chunks"]) < transfer["chunk_count"]:
+                return
+            del self.transfers[transfer_id]
+
+        reply_params = tuple(param
+                             for sequence_number in range(transfer["chunk_count"])
+                             for param in transfer["chunks"][sequence_number])
+        if len(reply_params) != transfer["param_count"]:
+            logger.warning("Discarding chunked reply to %s with %d params, expected %d" %
+                           (transfer["address"], len(reply_params), transfer["param_count"]))
+            return
+        self.handle_osc(transfer["address"], *reply_params)
+
+    def _expire_transfers(self):
+        """
+        Discard chunked replies that have been incomplete for longer than the transfer
+        timeout, and the oldest replies beyond MAX_CHUNK_TRANSFERS.
+        Must be called with transfers_lock held.
+        """
+        expiry_time = time.monotonic() - self.transfer_timeout
+        for transfer_id, transfer in list(self.transfers.items()):
+            if transfer["time"] < expiry_time or len(self.transfers) >= MAX_CHUNK_TRANSFERS:
+                del self.transfers[transfer_id]
+
     def stop(self):
         self.server.shutdown()
         self.server_thread.join()
         self.server = None
 
     def send_bundle(self,
-                    messages: list[tuple[str, tuple]]):
+                    messages: list[tuple[str, tuple]],
+                    timestamp: float = None):
+        """
+        Send a bundle of messages to the server.
 
-        import time
-        now = int(time.time())
-        bundle_builder = OscBundleBuilder(now)
+        Args:
+            messages: A list of (address, params) tuples.
+            timestamp: Optional time at which the server should handle the messages, as
+                       seconds since the epoch (e.g. time.time() + 0.5). By default, the
+                       messages are handled immediately.
+        """
+        bundle_builder = OscBundleBuilder(IMMEDIATELY if timestamp is None else timestamp)
         for address, params in messages:
             builder = OscMessageBuilder(address=address)
             for param in params:
@@ -0,0 +1,171 @@
+#--------------------------------------------------------------------------------
+# Helpers for the packed note format used by /live/clip/get/notes/blob and
+# /live/clip/add/notes. Each note is a fixed-width big-endian record:
+#
+#   notes:          pitch (uint8), start_time, duration, velocity (float32), mute (uint8)
+#   notes_with_ids: as above, followed by note_id (int32)
+#
+# Keep in sync with NOTE_BLOB_FORMATS in abletonosc/clip.py.
+#
+# NumPy is only imported by the functions that return or accept arrays, so the
+# tuple-based helpers can be used without it.
+#--------------------------------------------------------------------------------
+
+import struct
+import threading
+from typing import Iterable, List, Tuple
+
+from .client import TICK_DURATION
+
+#--------------------------------------------------------------------------------
+# The largest note blob to send in a single /live/clip/add/notes message, leaving
+# room for the rest of the message within a UDP datagram.
+#--------------------------------------------------------------------------------
+MAX_NOTE_BLOB_SIZE = 65507 - 128
+
+NOTE_RECORD_STRUCTS = {
+    "notes": struct.Struct(">BfffB"),
+    "notes_with_ids": struct.Struct(">BfffBi"),
+}
+
+NOTE_RECORD_FIELDS = {
+    "notes": [("pitch", "u1"), ("start_time", ">f4"), ("duration", ">f4"), ("velocity", ">f4"), ("mute", "?")],
+    "notes_with_ids": [("pitch", "u1"), ("start_time", ">f4"), ("duration", ">f4"), ("velocity", ">f4"), ("mute", "?"),
+                       ("note_id", ">i4")],
+}
+
+def _get_record_struct(note_format: str) -> struct.Struct:
+    if note_format not in NOTE_RECORD_STRUCTS:
+        raise ValueError("Unknown note format: %s" % note_format)
+    return NOTE_RECORD_STRUCTS[note_format]
+
+def pack_notes(notes: Iterable[Tuple], note_format: str = "notes") -> bytes:
+    """
+    Pack notes into a blob that can be passed to /live/clip/add/notes.
+
+    Args:
+        notes: Tuples of (pitch, start_time, duration, velocity, mute), plus note_id
+               for the notes_with_ids format.
+        note_format: The record format, either "notes" or "notes_with_ids".
+    """
+    record = _get_record_struct(note_format)
+    return b"".join(record.pack(*note) for note in notes)
+
+def unpack_notes(blob: bytes, note_format: str = "notes") -> List[Tuple]:
+    """
+    Unpack a blob returned by /live/clip/get/notes/blob into a list of tuples of
+    (pitch, start_time, duration, velocity, mute), plus note_id for the
+    notes_with_ids format.
+    """
+    record = _get_record_struct(note_format)
+    return [(pitch, start_time, duration, velocity, bool(mute), *note_id)
+            for pitch, start_time, duration, velocity, mute, *note_id in record.iter_unpack(blob)]
+
+def get_note_dtype(note_format: str = "notes"):
+    """
+    Returns the NumPy structured dtype for the given note format.
+    """
+    import numpy as np
+    _get_record_struct(note_format)
+    return np.dtype(NOTE_RECORD_FIELDS[note_format])
+
+def notes_to_array(blob: bytes, note_format: str = "notes"):
+    """
+    Decode a blob returned by /live/clip/get/notes/blob into a NumPy structured array,
+    with fields pitch, start_time, duration, velocity, mute (and note_id). The array
+    shares the blob's memory, and is therefore read-only.
+    """
+    import numpy as np
+    return np.frombuffer(blob, dtype=get_note_dtype(note_format))
+
+def array_to_notes(array, note_format: str = "notes") -> bytes:
+    """
+    Encode a NumPy structured array with (at least) the fields of the given note format
+    into a blob that can be passed to /live/clip/add/notes.
+
+    Raises:
+        ValueError: If the array lacks any of the fields of the note format.
+    """
+    import numpy as np
+    dtype = get_note_dtype(note_format)
+    missing = [name for name in dtype.names if name not in (array.dtype.names or ())]
+    if missing:
+        raise ValueError("Note array is missing fields: %s" % ", ".join(missing))
+    packed = np.empty(len(array), dtype=dtype)
+    for name in dtype.names:
+        packed[name] = array[name]
+    return packed.tobytes()
+
+def query_note_blob(client,
+                    track_id: int,
+                    clip_id: int,
+                    note_format: str = "notes",
+                    note_range: Tuple = (),
+                    timeout: float = TICK_DURATION) -> bytes:
+    """
+    Query a clip's notes with /live/clip/get/notes/blob, and return the records of all
+    of its notes as a single blob, joining the replies that they are split across.
+
+    Args:
+        client: An AbletonOSCClient.
+        track_id: The index of the clip's track.
+        clip_id: The index of the clip's slot.
+        note_format: The record format, either "notes" or "notes_with_ids".
+        note_range: Optional (start_pitch, pitch_span, start_time, time_span).
+        timeout: Maximum number of seconds to wait for each reply.
+
+    Raises:
+        TimeoutError if not all notes are received within the timeout.
+    """
+    record = _get_record_struct(note_format)
+    parts = {}
+    note_count = None
+    event = threading.Event()
+
+    def handle_reply(address, params):
+        nonlocal note_count
+        if tuple(params[:3]) != (track_id, clip_id, note_format):
+            return
+        _, _, _, note_offset, note_count, blob = params
+        parts[note_offset] = blob
+        if sum(len(part) for part in parts.values()) >= note_count * record.size:
+            event.set()
+
+    client.set_handler("/live/clip/get/notes/blob", handle_reply)
+    try:
+        client.send_message("/live/clip/get/notes/blob", (track_id, clip_id, note_format, *note_range))
+        #--------------------------------------------------------------------------------
+        # Keep waiting for as long as replies are still arriving.
+        #--------------------------------------------------------------------------------
+        received = 0
+        while not event.wait(timeout):
+            if len(parts) == received:
+                raise TimeoutError("Received %d of %s notes from /live/clip/get/notes/blob" %
+                                   (sum(len(part) for part in parts.values()) // record.size, note_count))
+            received = len(parts)
+    finally:
+        client.remove_handler("/live/clip/get/notes/blob")
+    return b"".join(parts[note_offset] for note_offset in sorted(parts))
+
+def add_notes(client,
+              track_id: int,
+              clip_id: int,
+              blob: bytes,
+              note_format: str = "notes"):
+    """
+    Add the notes in a blob to a clip with /live/clip/add/notes, splitting them across
+    as many messages as needed to fit each into a UDP datagram.
+
+    Args:
+        client: An AbletonOSCClient.
+        track_id: The index of the clip's track.
+        clip_id: The index of the clip's slot.
+        blob: Note records, as returned by pack_notes or array_to_notes.
+        note_format: The record format, either "notes" or "notes_with_ids".
+    """
+    record = _get_record_struct(note_format)
+    if len(blob) % record.size != 0:
+        raise ValueError("Note blob size (%d) is not a multiple of the record size (%d)" % (len(blob), record.size))
+    part_size = MAX_NOTE_BLOB_SIZE - MAX_NOTE_BLOB_SIZE % record.size
+    for offset in range(0, len(blob), part_size):
+        client.send_message("/live/clip/add/notes", (track_id, clip_id, note_format, blob[offset:offset + part_size]))
@@ -0,0 +1,90 @@
+#--------------------------------------------------------------------------------
+# An in-process fake of the parts of Live that AbletonOSC uses, so that Manager
+# and the handlers can run headless: for benchmarks, profiling and load tests
+# outside of Live.
+#
+# install() registers the fake as the `Live` and `ableton.v2.control_surface`
+# modules, which must happen before AbletonOSC is imported:
+#
+#   import fake_live
+#   song = fake_live.create_song(num_tracks=1000, rack_depth=4)
+#   live = fake_live.FakeLive(song)
+#   live.tick()
+#
+# Or, to serve the OSC API on the usual ports with a synthetic set:
+#
+#   python3 -m fake_live --tracks 16 --scenes 8
+#--------------------------------------------------------------------------------
+
+import os
+import sys
+import types
+import importlib
+from typing import Optional
+
+from . import lom
+from . import control_surface
+from .lom import Application, Song, Track, ClipSlot, Clip, MidiNote, MidiNoteSpecification, Scene, CuePoint, \
+    Device, RackDevice, Chain, DeviceParameter, DeviceType, MixerDevice, RoutingType, RoutingChannel
+from .control_surface import Component, ControlSurface, CInstance
+from .sets import create_song, create_default_song, create_clip, create_devices, create_parameters
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _create_module(name: str, **attributes) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    module.__fake_live__ = True
+    sys.modules[name] = module
+    return module
+
+def install(song: Optional[Song] = None) -> None:
+    """
+    Register the fake as the `Live` and `ableton.v2.control_surface` modules, if not
+    already registered, and make `song` the current Live set.
+
+    Raises:
+        RuntimeError if Live's own `Live` module has already been imported.
+    """
+    live_module = sys.modules.get("Live")
+    if live_module is None:
+        _create_module("Live",
+                       Application=_create_module("Live.Application", Application=Application,
+                                                  get_application=Application.get_application),
+                       Song=_create_module("Live.Song", Song=Song, CuePoint=CuePoint),
+                       Track=_create_module("Live.Track", Track=Track),
+                       ClipSlot=_create_module("Live.ClipSlot", ClipSlot=ClipSlot),
+                       Clip=_create_module("Live.Clip", Clip=Clip, MidiNote=MidiNote,
+                                           MidiNoteSpecification=MidiNoteSpecification),
+                       Scene=_create_module("Live.Scene", Scene=Scene),
+                       Device=_create_module("Live.Device", Device=Device, DeviceType=DeviceType),
+                       RackDevice=_create_module("Live.RackDevice", RackDevice=RackDevice),
+                       Chain=_create_module("Live.Chain", Chain=Chain),
+                       DeviceParameter=_create_module("Live.DeviceParameter", DeviceParameter=DeviceParameter),
+                       MixerDevice=_create_module("Live.MixerDevice", MixerDevice=MixerDevice))
+        component_module = _create_module("ableton.v2.control_surface.component", Component=Component)
+        control_surface_module = _create_module("ableton.v2.control_surface", ControlSurface=ControlSurface,
+                                                Component=Component, component=component_module)
+        v2_module = _create_module("ableton.v2", control_surface=control_surface_module)
+        _create_module("ableton", v2=v2_module)
+    elif not getattr(live_module, "__fake_live__", False):
+        raise RuntimeError("Live's own Live module is already loaded")
+
+    if song is not None:
+        Application.get_application().set_document(song)
+
+def import_abletonosc() -> types.ModuleType:
+    """
+    Install the fake, and import and return the AbletonOSC package (the directory
+    containing manager.py). AbletonOSC uses relative imports, so must be imported
+    as a package rather than from within its directory.
+    """
+    install()
+    parent_dir = os.path.dirname(ROOT_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    package = importlib.import_module(os.path.basename(ROOT_DIR))
+    importlib.import_module(package.__name__ + ".manager")
+    return package
+
+from .runner import FakeLive, TICK_DURATION
@@ -0,0 +1,46 @@
+#--------------------------------------------------------------------------------
+# Serve the AbletonOSC API on the usual ports, backed by a synthetic fake Live
+# set, so that clients and the tests can be run without Live. From the
+# AbletonOSC directory:
+#
+#   python3 -m fake_live --tracks 16 --scenes 8
+#--------------------------------------------------------------------------------
+
+import argparse
+import logging
+
+from . import FakeLive, create_song, create_default_song
+
+def main():
+    parser = argparse.ArgumentParser(description="Run AbletonOSC against a fake Live set")
+    parser.add_argument("--tracks", type=int, default=8, help="Number of MIDI tracks")
+    parser.add_argument("--scenes", type=int, default=8, help="Number of scenes")
+    parser.add_argument("--return-tracks", type=int, default=2, help="Number of return tracks")
+    parser.add_argument("--clip-density", type=float, default=0.5, help="Proportion of clip slots with clips")
+    parser.add_argument("--notes", type=int, default=16, help="Number of notes per clip")
+    parser.add_argument("--rack-depth", type=int, default=0, help="Levels of nested racks per track")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for clips and notes")
+    parser.add_argument("--blank", action="store_true", help="Use a set like Live's default blank set, as expected by tests/")
+    parser.add_argument("--verbose", action="store_true", help="Log AbletonOSC's activity")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="(%(asctime)s) [%(levelname)s] %(message)s")
+    if args.blank:
+        song = create_default_song()
+    else:
+        song = create_song(num_tracks=args.tracks, num_scenes=args.scenes, num_return_tracks=args.return_tracks,
+                           clip_density=args.clip_density, num_notes=args.notes, rack_depth=args.rack_depth,
+                           seed=args.seed)
+    live = FakeLive(song)
+    print("AbletonOSC: listening on %s with a fake set of %d tracks and %d scenes" %
+          (str(live.osc_server._local_addr), len(song.tracks), len(song.scenes)))
+    try:
+        live.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        live.close()
+
+if __name__ == "__main__":
+    main()
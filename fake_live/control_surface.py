@@ -0,0 +1,81 @@
+#--------------------------------------------------------------------------------
+# Stand-ins for the classes that AbletonOSC uses from ableton.v2.control_surface.
+#--------------------------------------------------------------------------------
+
+import contextlib
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from .lom import Application, Song
+
+logger = logging.getLogger("fake_live")
+
+class Component:
+    """
+    Stand-in for ableton.v2.control_surface.component.Component. As in Live, `song` is
+    the document of the running Application.
+    """
+    def __init__(self, *args, **kwargs):
+        pass
+
+    @property
+    def song(self) -> Song:
+        return Application.get_application().get_document()
+
+    def disconnect(self) -> None:
+        pass
+
+class CInstance:
+    """
+    Stand-in for the c_instance that Live passes to a control surface's create_instance.
+    """
+    def __init__(self):
+        self.messages: List[str] = []
+
+    def show_message(self, message: str) -> None:
+        self.messages.append(message)
+        logger.info(message)
+
+class ControlSurface(Component):
+    """
+    Stand-in for ableton.v2.control_surface.ControlSurface. Live calls update_display
+    every 100ms, which runs the callbacks passed to schedule_message once their delay
+    (in ticks) has elapsed.
+    """
+    def __init__(self, c_instance: Optional[CInstance] = None, *args, **kwargs):
+        super().__init__()
+        self._c_instance = c_instance if c_instance is not None else CInstance()
+        self._scheduled_messages: List[Tuple[int, Callable, tuple]] = []
+
+    def schedule_message(self, delay_in_ticks: int, callback: Callable, parameter=None) -> None:
+        """
+        Run `callback` on the `delay_in_ticks`th call to update_display from now, or the
+        next if `delay_in_ticks` is 0.
+        """
+        parameters = () if parameter is None else (parameter,)
+        self._scheduled_messages.append((max(delay_in_ticks, 1), callback, parameters))
+
+    def update_display(self) -> None:
+        #--------------------------------------------------------------------------------
+        # Callbacks scheduled from within a callback are not run until a later tick.
+        #--------------------------------------------------------------------------------
+        scheduled_messages = self._scheduled_messages
+        self._scheduled_messages = []
+        for delay_in_ticks, callback, parameters in scheduled_messages:
+            if delay_in_ticks > 1:
+                self._scheduled_messages.append((delay_in_ticks - 1, callback, parameters))
+            else:
+                callback(*parameters)
+
+    def show_message(self, message: str) -> None:
+        self._c_instance.show_message(message)
+
+    def log_message(self, *message) -> None:
+        logger.info(" ".join(str(part) for part in message))
+
+    @contextlib.contextmanager
+    def component_guard(self):
+        yield
+
+    def disconnect(self) -> None:
+        self._scheduled_messages = []
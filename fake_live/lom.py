@@ -0,0 +1,1125 @@
+#--------------------------------------------------------------------------------
+# A pure-Python stand-in for the parts of Live's object model (LOM) that
+# AbletonOSC uses: Song, Track, ClipSlot, Clip, Scene, Device, RackDevice, Chain,
+# DeviceParameter and their listeners.
+#
+# As in Live:
+#  - vectors such as Song.tracks return a new tuple on each access
+#  - listeners are registered with add_<prop>_listener/remove_<prop>_listener,
+#    and are only called when a property's value changes
+#  - making changes from within a listener raises a RuntimeError
+#  - notes are returned as copies, which are written back with
+#    apply_note_modifications
+#
+# Methods that are not part of the LOM, and exist to build or drive sets from
+# tests and benchmarks, are marked as such in their docstrings.
+#--------------------------------------------------------------------------------
+
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+#--------------------------------------------------------------------------------
+# The number of listener notifications in progress. Live doesn't allow changes to
+# be triggered by notifications.
+#--------------------------------------------------------------------------------
+_notification_depth = 0
+
+def _check_not_notifying() -> None:
+    if _notification_depth > 0:
+        raise RuntimeError("Changes cannot be triggered by notifications. You will need to defer your response.")
+
+class listenable_property:
+    """
+    A property of a LiveObject that can be listened to. Setting the property to a
+    new value calls its listeners.
+
+    Args:
+        default: The property's initial value.
+        read_only: If True, the property can only be changed by the fake itself,
+                   with LiveObject._update().
+    """
+    def __init__(self, default: Any = None, read_only: bool = False):
+        self.default = default
+        self.read_only = read_only
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self.name, self.default)
+
+    def __set__(self, obj, value):
+        if self.read_only:
+            raise AttributeError("Property is read-only: %s" % self.name)
+        _check_not_notifying()
+        obj._update(self.name, value)
+
+class LiveObject:
+    """
+    Base class for fake LOM objects. Provides add_<prop>_listener, remove_<prop>_listener
+    and <prop>_has_listener for each listenable_property, and for each property named in
+    the class's `listenable` tuple.
+    """
+    listenable: Tuple[str, ...] = ()
+    _listenable_props = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        props = set(cls._listenable_props) | set(cls.listenable)
+        props.update(name for name, value in vars(cls).items() if isinstance(value, listenable_property))
+        cls._listenable_props = frozenset(props)
+
+    def __init__(self):
+        self._listeners = {}
+        self.canonical_parent = None
+
+    def __getattr__(self, name: str):
+        if name.endswith("_listener"):
+            for prefix, method in (("add_", self._add_listener), ("remove_", self._remove_listener)):
+                prop = name[len(prefix):-len("_listener")]
+                if name.startswith(prefix) and prop in self._listenable_props:
+                    return lambda listener: method(prop, listener)
+            if name.endswith("_has_listener") and name[:-len("_has_listener")] in self._listenable_props:
+                prop = name[:-len("_has_listener")]
+                return lambda listener: listener in self._listeners.get(prop, ())
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def _add_listener(self, prop: str, listener: Callable) -> None:
+        listeners = self._listeners.setdefault(prop, [])
+        if listener in listeners:
+            raise RuntimeError("Listener is already connected: %s" % prop)
+        listeners.append(listener)
+
+    def _remove_listener(self, prop: str, listener: Callable) -> None:
+        listeners = self._listeners.get(prop, [])
+        if listener not in listeners:
+            raise RuntimeError("Listener is not connected: %s" % prop)
+        listeners.remove(listener)
+
+    def _update(self, prop: str, value: Any) -> None:
+        """
+        Set a listenable property, bypassing the checks made for changes made through
+        the LOM, and call its listeners if its value has changed.
+        """
+        if getattr(self, prop) != value:
+            self.__dict__[prop] = value
+            self.notify(prop)
+
+    def notify(self, prop: str) -> None:
+        """
+        Not part of the LOM: call the listeners for `prop`, as Live does when it changes.
+        """
+        global _notification_depth
+        listeners = self._listeners.get(prop)
+        if not listeners:
+            return
+        _notification_depth += 1
+        try:
+            for listener in list(listeners):
+                listener()
+        finally:
+            _notification_depth -= 1
+
+def _insert(items: List, item, index: int) -> int:
+    """
+    Insert `item` into `items` at `index`, where -1 denotes the end, as in Live's
+    create_* methods. Returns the index at which the item was inserted.
+    """
+    if index == -1 or index >= len(items):
+        index = len(items)
+    items.insert(index, item)
+    return index
+
+#--------------------------------------------------------------------------------
+# Devices
+#--------------------------------------------------------------------------------
+class DeviceType:
+    """
+    Values of Live.Device.DeviceType.
+    """
+    undefined = 0
+    instrument = 1
+    audio_effect = 2
+    midi_effect = 4
+
+class DeviceParameter(LiveObject):
+    value = listenable_property(0.0)
+    name = listenable_property("", read_only=True)
+    is_enabled = listenable_property(True, read_only=True)
+    automation_state = listenable_property(0, read_only=True)
+
+    def __init__(self, name: str, value: float = 0.0, min: float = 0.0, max: float = 1.0,
+                 is_quantized: bool = False, value_items: Tuple[str, ...] = ()):
+        super().__init__()
+        self._update("name", name)
+        self.min = min
+        self.max = max
+        self.default_value = value
+        self.is_quantized = is_quantized
+        self.value_items = tuple(value_items)
+        self.__dict__["value"] = value
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "value":
+            if not self.min <= value <= self.max:
+                raise RuntimeError("Invalid value. Check the parameter's min/max")
+        super().__setattr__(name, value)
+
+    def str_for_value(self, value: float) -> str:
+        if self.value_items:
+            return self.value_items[int(value)]
+        return "%.2f" % value
+
+    def duplicate(self) -> "DeviceParameter":
+        """
+        Not part of the LOM: returns a copy of the parameter, without listeners.
+        """
+        return DeviceParameter(self.name, self.value, self.min, self.max, self.is_quantized, self.value_items)
+
+class Device(LiveObject):
+    name = listenable_property("")
+    is_active = listenable_property(True, read_only=True)
+    listenable = ("parameters",)
+    can_have_chains = False
+    can_have_drum_pads = False
+
+    def __init__(self, name: str, class_name: str = "PluginDevice", type: int = DeviceType.audio_effect,
+                 parameters: Optional[Iterable[DeviceParameter]] = None):
+        super().__init__()
+        self.__dict__["name"] = name
+        self.class_name = class_name
+        self.class_display_name = class_name
+        self.type = type
+        if parameters is None:
+            parameters = [DeviceParameter("Device On", 1.0, 0.0, 1.0, is_quantized=True)]
+        self._parameters = list(parameters)
+        for parameter in self._parameters:
+            parameter.canonical_parent = self
+
+    @property
+    def parameters(self) -> Tuple[DeviceParameter, ...]:
+        return tuple(self._parameters)
+
+    def store_chosen_bank(self, script_index: int, bank_index: int) -> None:
+        pass
+
+    def duplicate(self) -> "Device":
+        """
+        Not part of the LOM: returns a copy of the device, without listeners.
+        """
+        return Device(self.name, self.class_name, self.type, [parameter.duplicate() for parameter in self._parameters])
+
+class Chain(LiveObject):
+    name = listenable_property("")
+    color = listenable_property(0)
+    color_index = listenable_property(0)
+    mute = listenable_property(False)
+    solo = listenable_property(False)
+    listenable = ("devices",)
+
+    def __init__(self, name: str, devices: Iterable[Device] = ()):
+        super().__init__()
+        self.__dict__["name"] = name
+        self._devices = []
+        for device in devices:
+            self._devices.append(device)
+            device.canonical_parent = self
+
+    @property
+    def devices(self) -> Tuple[Device, ...]:
+        return tuple(self._devices)
+
+    def insert_device(self, device, target_index: int = -1) -> None:
+        """
+        Insert a device, given either by name (as in Live) or as a Device, at `target_index`.
+        """
+        _check_not_notifying()
+        if isinstance(device, str):
+            device = Device(device)
+        device.canonical_parent = self
+        _insert(self._devices, device, target_index)
+        self.notify("devices")
+
+    def delete_device(self, index: int) -> None:
+        _check_not_notifying()
+        del self._devices[index]
+        self.notify("devices")
+
+    def duplicate(self) -> "Chain":
+        """
+        Not part of the LOM: returns a copy of the chain and its devices, without listeners.
+        """
+        return Chain(self.name, [device.duplicate() for device in self._devices])
+
+class RackDevice(Device):
+    is_showing_chains = listenable_property(False)
+    listenable = ("chains",)
+    can_have_chains = True
+
+    def __init__(self, name: str, chains: Iterable[Chain] = (), class_name: str = "AudioEffectGroupDevice",
+                 type: int = DeviceType.audio_effect, parameters: Optional[Iterable[DeviceParameter]] = None):
+        if parameters is None:
+            parameters = [DeviceParameter("Device On", 1.0, 0.0, 1.0, is_quantized=True)] + \
+                         [DeviceParameter("Macro %d" % (index + 1), 0.0, 0.0, 127.0) for index in range(8)]
+        super().__init__(name, class_name, type, parameters)
+        self._chains = []
+        for chain in chains:
+            self._chains.append(chain)
+            chain.canonical_parent = self
+
+    @property
+    def chains(self) -> Tuple[Chain, ...]:
+        return tuple(self._chains)
+
+    def insert_chain(self, index: int = -1, chain: Optional[Chain] = None) -> None:
+        """
+        Insert a chain at `index`. `chain` is not part of the LOM, and optionally gives the
+        chain to insert, which is otherwise empty.
+        """
+        _check_not_notifying()
+        if chain is None:
+            chain = Chain("Chain")
+        chain.canonical_parent = self
+        _insert(self._chains, chain, index)
+        self.notify("chains")
+
+    def duplicate(self) -> "RackDevice":
+        return RackDevice(self.name, [chain.duplicate() for chain in self._chains], self.class_name, self.type,
+                          [parameter.duplicate() for parameter in self._parameters])
+
+#--------------------------------------------------------------------------------
+# Clips and notes
+#--------------------------------------------------------------------------------
+class MidiNoteSpecification:
+    """
+    Equivalent of Live.Clip.MidiNoteSpecification, which describes a note to add.
+    """
+    __slots__ = ("pitch", "start_time", "duration", "velocity", "mute", "probability", "velocity_deviation",
+                 "release_velocity")
+
+    def __init__(self, pitch: int, start_time: float, duration: float, velocity: float = 100.0, mute: bool = False,
+                 probability: float = 1.0, velocity_deviation: float = 0.0, release_velocity: float = 64.0):
+        self.pitch = pitch
+        self.start_time = start_time
+        self.duration = duration
+        self.velocity = velocity
+        self.mute = mute
+        self.probability = probability
+        self.velocity_deviation = velocity_deviation
+        self.release_velocity = release_velocity
+
+class MidiNote(MidiNoteSpecification):
+    """
+    Equivalent of Live.Clip.MidiNote, a note in a clip. Clips return copies of their
+    notes, so changes must be written back with Clip.apply_note_modifications.
+    """
+    __slots__ = ("note_id",)
+
+    def __init__(self, note_id: int, pitch: int, start_time: float, duration: float, velocity: float = 100.0,
+                 mute: bool = False, probability: float = 1.0, velocity_deviation: float = 0.0,
+                 release_velocity: float = 64.0):
+        super().__init__(pitch, start_time, duration, velocity, mute, probability, velocity_deviation,
+                         release_velocity)
+        self.note_id = note_id
+
+    def copy(self) -> "MidiNote":
+        return MidiNote(self.note_id, self.pitch, self.start_time, self.duration, self.velocity, self.mute,
+                        self.probability, self.velocity_deviation, self.release_velocity)
+
+    def __repr__(self):
+        return "MidiNote(note_id=%d, pitch=%d, start_time=%s, duration=%s, velocity=%s, mute=%s)" % \
+               (self.note_id, self.pitch, self.start_time, self.duration, self.velocity, self.mute)
+
+class Clip(LiveObject):
+    name = listenable_property("")
+    color = listenable_property(0x3C92E4)
+    color_index = listenable_property(0)
+    muted = listenable_property(False)
+    gain = listenable_property(0.4)
+    gain_display_string = listenable_property("0.0 dB", read_only=True)
+    pitch_coarse = listenable_property(0)
+    pitch_fine = listenable_property(0.0)
+    looping = listenable_property(True)
+    loop_start = listenable_property(0.0)
+    loop_end = listenable_property(4.0)
+    start_marker = listenable_property(0.0)
+    end_marker = listenable_property(4.0)
+    warping = listenable_property(True)
+    is_playing = listenable_property(False, read_only=True)
+    is_recording = listenable_property(False, read_only=True)
+    is_triggered = listenable_property(False, read_only=True)
+    playing_position = listenable_property(0.0, read_only=True)
+    start_time = listenable_property(0.0, read_only=True)
+    file_path = listenable_property("", read_only=True)
+    listenable = ("notes",)
+
+    def __init__(self, name: str = "", length: float = 4.0, is_midi_clip: bool = True,
+                 notes: Iterable[Tuple] = (), start_time: float = 0.0):
+        """
+        Args:
+            name: The clip's name.
+            length: The clip's length in beats, which sets its loop and markers.
+            is_midi_clip: False for an audio clip, which can't contain notes.
+            notes: Not part of the LOM: (pitch, start_time, duration, velocity, mute)
+                   tuples of notes to add to a MIDI clip.
+            start_time: For arrangement clips, the clip's position in beats.
+        """
+        super().__init__()
+        self.is_midi_clip = is_midi_clip
+        self.is_audio_clip = not is_midi_clip
+        self._notes = {}
+        self._next_note_id = 1
+        values = {"name": name, "loop_end": length, "end_marker": length, "start_time": start_time}
+        if not is_midi_clip:
+            values["file_path"] = "%s.wav" % name
+        self.__dict__.update(values)
+        if notes:
+            self._add_notes(MidiNoteSpecification(*note) for note in notes)
+
+    @property
+    def length(self) -> float:
+        return self.loop_end - self.loop_start
+
+    #--------------------------------------------------------------------------------
+    # Playback
+    #--------------------------------------------------------------------------------
+    def fire(self) -> None:
+        """
+        Start the clip, which (unlike in Live) plays immediately, stopping any other clip
+        on its track. As in Live, the song starts playing if it isn't already.
+        """
+        _check_not_notifying()
+        clip_slot = self.canonical_parent
+        if isinstance(clip_slot, ClipSlot) and clip_slot.canonical_parent is not None:
+            track = clip_slot.canonical_parent
+            for other_clip_slot in track._clip_slots:
+                if other_clip_slot is not clip_slot and other_clip_slot.is_playing:
+                    other_clip_slot.clip._set_playing(False)
+            if track.canonical_parent is not None:
+                track.canonical_parent._update("is_playing", True)
+        self._update("playing_position", self.loop_start)
+        self._set_playing(True)
+
+    def stop(self) -> None:
+        _check_not_notifying()
+        self._set_playing(False)
+
+    def _set_playing(self, is_playing: bool) -> None:
+        self._update("is_playing", is_playing)
+        if isinstance(self.canonical_parent, ClipSlot):
+            self.canonical_parent._update_playing_status()
+
+    def _advance(self, beats: float) -> None:
+        position = self.playing_position + beats
+        if position >= self.loop_end:
+            if not self.looping:
+                self._set_playing(False)
+                return
+            position = self.loop_start + (position - self.loop_start) % max(self.length, 1e-9)
+        self._update("playing_position", position)
+
+    def duplicate_loop(self) -> None:
+        _check_not_notifying()
+        length = self.length
+        self._add_notes([MidiNoteSpecification(note.pitch, note.start_time + length, note.duration, note.velocity,
+                                               note.mute) for note in self._notes.values()
+                         if self.loop_start <= note.start_time < self.loop_end])
+        self.loop_end = self.loop_start + length * 2
+        self.end_marker = self.loop_end
+
+    #--------------------------------------------------------------------------------
+    # Notes
+    #--------------------------------------------------------------------------------
+    def _check_is_midi_clip(self) -> None:
+        if not self.is_midi_clip:
+            raise RuntimeError("Not a MIDI clip")
+
+    def _add_notes(self, specifications: Iterable[MidiNoteSpecification]) -> Tuple[int, ...]:
+        note_ids = []
+        for spec in specifications:
+            note_id = self._next_note_id
+            self._next_note_id += 1
+            self._notes[note_id] = MidiNote(note_id, int(spec.pitch), float(spec.start_time), float(spec.duration),
+                                            float(spec.velocity), bool(spec.mute), spec.probability,
+                                            spec.velocity_deviation, spec.release_velocity)
+            note_ids.append(note_id)
+        return tuple(note_ids)
+
+    def _get_notes_in_range(self, from_pitch: int, pitch_span: int, from_time: float, time_span: float) -> List[MidiNote]:
+        return [note for note in self._notes.values()
+                if from_pitch <= note.pitch < from_pitch + pitch_span and
+                from_time <= note.start_time < from_time + time_span]
+
+    def get_notes_extended(self, from_pitch: int, pitch_span: int, from_time: float, time_span: float) -> Tuple[MidiNote, ...]:
+        self._check_is_midi_clip()
+        notes = self._get_notes_in_range(from_pitch, pitch_span, from_time, time_span)
+        notes.sort(key=lambda note: (note.pitch, note.start_time))
+        return tuple(note.copy() for note in notes)
+
+    def get_all_notes_extended(self) -> Tuple[MidiNote, ...]:
+        return self.get_notes_extended(0, 128, -16384.0, 32768.0)
+
+    def get_notes_by_id(self, note_ids: Iterable[int]) -> Tuple[MidiNote, ...]:
+        self._check_is_midi_clip()
+        notes = []
+        for note_id in note_ids:
+            if note_id not in self._notes:
+                raise RuntimeError("Note with ID %d not found" % note_id)
+            notes.append(self._notes[note_id].copy())
+        return tuple(notes)
+
+    def add_new_notes(self, specifications: Iterable[MidiNoteSpecification]) -> Tuple[int, ...]:
+        _check_not_notifying()
+        self._check_is_midi_clip()
+        note_ids = self._add_notes(specifications)
+        if note_ids:
+            self.notify("notes")
+        return note_ids
+
+    def apply_note_modifications(self, notes: Iterable[MidiNote]) -> None:
+        _check_not_notifying()
+        self._check_is_midi_clip()
+        for note in notes:
+            if note.note_id in self._notes:
+                self._notes[note.note_id] = note.copy()
+        self.notify("notes")
+
+    def remove_notes_extended(self, from_pitch: int, pitch_span: int, from_time: float, time_span: float) -> None:
+        _check_not_notifying()
+        self._check_is_midi_clip()
+        notes = self._get_notes_in_range(from_pitch, pitch_span, from_time, time_span)
+        for note in notes:
+            del self._notes[note.note_id]
+        if notes:
+            self.notify("notes")
+
+    def remove_notes_by_id(self, note_ids: Iterable[int]) -> None:
+        _check_not_notifying()
+        self._check_is_midi_clip()
+        removed = [self._notes.pop(note_id) for note_id in note_ids if note_id in self._notes]
+        if removed:
+            self.notify("notes")
+
+    def duplicate(self) -> "Clip":
+        """
+        Not part of the LOM: returns a copy of the clip and its notes, without listeners.
+        """
+        clip = Clip(self.name, self.length, self.is_midi_clip, start_time=self.start_time)
+        clip.__dict__.update({name: value for name, value in self.__dict__.items()
+                              if name in type(self)._listenable_props and name not in ("is_playing", "is_triggered",
+                                                                                     "playing_position")})
+        clip._add_notes(self._notes.values())
+        return clip
+
+class ClipSlot(LiveObject):
+    has_stop_button = listenable_property(True)
+    controls_other_clips = listenable_property(False, read_only=True)
+    is_group_slot = False
+    is_playing = listenable_property(False, read_only=True)
+    is_triggered = listenable_property(False, read_only=True)
+    is_recording = listenable_property(False, read_only=True)
+    playing_status = listenable_property(0, read_only=True)
+    will_record_on_start = listenable_property(False, read_only=True)
+    color = listenable_property(None, read_only=True)
+    listenable = ("has_clip",)
+
+    def __init__(self, clip: Optional[Clip] = None):
+        super().__init__()
+        self._clip = clip
+        if clip is not None:
+            clip.canonical_parent = self
+
+    @property
+    def clip(self) -> Optional[Clip]:
+        return self._clip
+
+    @property
+    def has_clip(self) -> bool:
+        return self._clip is not None
+
+    def _set_clip(self, clip: Optional[Clip]) -> None:
+        if self._clip is not None:
+            self._clip.canonical_parent = None
+        self._clip = clip
+        if clip is not None:
+            clip.canonical_parent = self
+        self._update_playing_status()
+        self.notify("has_clip")
+
+    def _update_playing_status(self) -> None:
+        is_playing = self._clip is not None and self._clip.is_playing
+        self._update("is_playing", is_playing)
+        self._update("playing_status", 1 if is_playing else 0)
+        if self.canonical_parent is not None:
+            self.canonical_parent._update_playing_status()
+
+    def create_clip(self, length: float) -> None:
+        _check_not_notifying()
+        if self._clip is not None:
+            raise RuntimeError("Clip slot is not empty")
+        if length <= 0:
+            raise RuntimeError("Invalid clip length")
+        self._set_clip(Clip("", length))
+
+    def delete_clip(self) -> None:
+        _check_not_notifying()
+        if self._clip is None:
+            raise RuntimeError("No clip in slot")
+        self._set_clip(None)
+
+    def duplicate_clip_to(self, target_clip_slot: "ClipSlot") -> None:
+        _check_not_notifying()
+        if self._clip is None:
+            raise RuntimeError("No clip in slot")
+        target_clip_slot._set_clip(self._clip.duplicate())
+
+    def fire(self, record_length: Optional[float] = None, launch_quantization: Optional[int] = None,
+             force_legato: bool = False) -> None:
+        """
+        Fire the slot's clip. Firing an empty slot on an armed track records a new clip,
+        which (unlike in Live) is created immediately, with a length of `record_length`
+        beats, or 4 beats if not given.
+        """
+        _check_not_notifying()
+        if self._clip is None:
+            track = self.canonical_parent
+            if track is None or not track.arm:
+                return
+            self._set_clip(Clip("", record_length or 4.0, is_midi_clip=track._is_midi_track))
+        self._clip.fire()
+
+    def stop(self) -> None:
+        if self._clip is not None:
+            self._clip.stop()
+
+    def set_fire_button_state(self, state: bool) -> None:
+        pass
+
+#--------------------------------------------------------------------------------
+# Tracks
+#--------------------------------------------------------------------------------
+class RoutingType:
+    def __init__(self, display_name: str, category: int = 0):
+        self.display_name = display_name
+        self.category = category
+
+class RoutingChannel:
+    def __init__(self, display_name: str, layout: int = 0):
+        self.display_name = display_name
+        self.layout = layout
+
+class MixerDevice(LiveObject):
+    crossfade_assign = listenable_property(1)
+    listenable = ("sends",)
+
+    def __init__(self, num_sends: int = 0):
+        super().__init__()
+        self.volume = DeviceParameter("Track Volume", 0.85, 0.0, 1.0)
+        self.panning = DeviceParameter("Track Panning", 0.0, -1.0, 1.0)
+        self.song_tempo = DeviceParameter("Song Tempo", 120.0, 20.0, 999.0)
+        self.cue_volume = DeviceParameter("Cue Volume", 0.85, 0.0, 1.0)
+        self._sends = [DeviceParameter("Send %s" % chr(ord("A") + index), 0.0, 0.0, 1.0) for index in range(num_sends)]
+
+    @property
+    def sends(self) -> Tuple[DeviceParameter, ...]:
+        return tuple(self._sends)
+
+class TrackView(LiveObject):
+    selected_device = listenable_property(None)
+    is_collapsed = listenable_property(False)
+
+class Track(LiveObject):
+    name = listenable_property("")
+    color = listenable_property(0xFF3636)
+    color_index = listenable_property(0)
+    mute = listenable_property(False)
+    solo = listenable_property(False)
+    arm = listenable_property(False)
+    current_monitoring_state = listenable_property(1)
+    fold_state = listenable_property(0)
+    is_visible = listenable_property(True, read_only=True)
+    fired_slot_index = listenable_property(-1, read_only=True)
+    playing_slot_index = listenable_property(-1, read_only=True)
+    output_meter_level = listenable_property(0.0, read_only=True)
+    output_meter_left = listenable_property(0.0, read_only=True)
+    output_meter_right = listenable_property(0.0, read_only=True)
+    input_routing_type = listenable_property(None)
+    input_routing_channel = listenable_property(None)
+    output_routing_type = listenable_property(None)
+    output_routing_channel = listenable_property(None)
+    listenable = ("clip_slots", "devices", "arrangement_clips", "has_audio_input", "has_audio_output",
+                  "has_midi_input", "has_midi_output", "is_frozen", "available_input_routing_types",
+                  "available_input_routing_channels", "available_output_routing_types",
+                  "available_output_routing_channels")
+
+    def __init__(self, name: str, clip_slots: Iterable[ClipSlot] = (), devices: Iterable[Device] = (),
+                 is_midi_track: bool = True, can_be_armed: bool = True, num_sends: int = 0,
+                 arrangement_clips: Iterable[Clip] = (), is_foldable: bool = False,
+                 group_track: Optional["Track"] = None):
+        """
+        Args:
+            name: The track's name.
+            clip_slots: The track's clip slots, one per scene.
+            devices: The track's top-level devices.
+            is_midi_track: False for an audio track.
+            can_be_armed: False for return tracks and the master track.
+            num_sends: The number of sends in the track's mixer, one per return track.
+            arrangement_clips: Clips in the track's arrangement.
+            is_foldable: True for a group track.
+            group_track: The group track that contains this track.
+        """
+        super().__init__()
+        self.__dict__["name"] = name
+        self._is_midi_track = is_midi_track
+        self.can_be_armed = can_be_armed
+        self.has_midi_input = is_midi_track and can_be_armed
+        self.has_midi_output = False
+        self.has_audio_input = not is_midi_track
+        self.has_audio_output = True
+        self.is_foldable = is_foldable
+        self.group_track = group_track
+        self.is_grouped = group_track is not None
+        self.is_frozen = False
+        self.mixer_device = MixerDevice(num_sends)
+        self.view = TrackView()
+        self._clip_slots = []
+        self._devices = []
+        self._arrangement_clips = list(arrangement_clips)
+        for clip_slot in clip_slots:
+            self._clip_slots.append(clip_slot)
+            clip_slot.canonical_parent = self
+        for device in devices:
+            self._devices.append(device)
+            device.canonical_parent = self
+
+        input_type = "All Ins" if is_midi_track else "Ext. In"
+        self.available_input_routing_types = (RoutingType(input_type), RoutingType("No Input"))
+        self.available_input_routing_channels = (RoutingChannel("All Channels" if is_midi_track else "1/2"),)
+        self.available_output_routing_types = (RoutingType("Master"), RoutingType("Ext. Out"),
+                                               RoutingType("Sends Only"))
+        self.available_output_routing_channels = (RoutingChannel("Track In"), RoutingChannel("1/2"))
+        self.__dict__.update(input_routing_type=self.available_input_routing_types[0],
+                             input_routing_channel=self.available_input_routing_channels[0],
+                             output_routing_type=self.available_output_routing_types[0],
+                             output_routing_channel=self.available_output_routing_channels[0])
+
+    @property
+    def clip_slots(self) -> Tuple[ClipSlot, ...]:
+        return tuple(self._clip_slots)
+
+    @property
+    def devices(self) -> Tuple[Device, ...]:
+        return tuple(self._devices)
+
+    @property
+    def arrangement_clips(self) -> Tuple[Clip, ...]:
+        return tuple(self._arrangement_clips)
+
+    def insert_device(self, device, target_index: int = -1) -> None:
+        """
+        Insert a device, given either by name (as in Live) or as a Device, at `target_index`.
+        """
+        _check_not_notifying()
+        if isinstance(device, str):
+            device = Device(device)
+        device.canonical_parent = self
+        _insert(self._devices, device, target_index)
+        self.notify("devices")
+
+    def delete_device(self, index: int) -> None:
+        _check_not_notifying()
+        device = self._devices.pop(index)
+        if self.view.selected_device is device:
+            self.view._update("selected_device", None)
+        self.notify("devices")
+
+    def stop_all_clips(self, quantized: bool = True) -> None:
+        for clip_slot in self._clip_slots:
+            clip_slot.stop()
+
+    def _update_playing_status(self) -> None:
+        playing_slot_index = -1
+        for clip_slot_index, clip_slot in enumerate(self._clip_slots):
+            if clip_slot.is_playing:
+                playing_slot_index = clip_slot_index
+        self._update("playing_slot_index", playing_slot_index)
+
+    def duplicate(self) -> "Track":
+        """
+        Not part of the LOM: returns a copy of the track, its clips and devices, without listeners.
+        """
+        track = Track(self.name,
+                      [ClipSlot(None if clip_slot.clip is None else clip_slot.clip.duplicate())
+                       for clip_slot in self._clip_slots],
+                      [device.duplicate() for device in self._devices],
+                      is_midi_track=self._is_midi_track,
+                      can_be_armed=self.can_be_armed,
+                      num_sends=len(self.mixer_device.sends),
+                      arrangement_clips=[clip.duplicate() for clip in self._arrangement_clips],
+                      is_foldable=self.is_foldable,
+                      group_track=self.group_track)
+        for name in ("name", "color", "color_index", "mute", "solo", "arm", "current_monitoring_state", "fold_state"):
+            track.__dict__[name] = getattr(self, name)
+        return track
+
+#--------------------------------------------------------------------------------
+# Scenes, cue points and the song
+#--------------------------------------------------------------------------------
+class Scene(LiveObject):
+    name = listenable_property("")
+    color = listenable_property(0x3C92E4)
+    color_index = listenable_property(0)
+    tempo = listenable_property(120.0)
+    tempo_enabled = listenable_property(False)
+    time_signature_numerator = listenable_property(4)
+    time_signature_denominator = listenable_property(4)
+    time_signature_enabled = listenable_property(False)
+    is_triggered = listenable_property(False, read_only=True)
+    listenable = ("is_empty",)
+
+    def __init__(self, name: str = ""):
+        super().__init__()
+        self.__dict__["name"] = name
+
+    def _get_clip_slots(self) -> List[ClipSlot]:
+        song = self.canonical_parent
+        scene_index = song._scenes.index(self)
+        return [track._clip_slots[scene_index] for track in song._tracks if scene_index < len(track._clip_slots)]
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(clip_slot.has_clip for clip_slot in self._get_clip_slots())
+
+    def fire(self, force_legato: bool = False, can_select_scene_on_launch: bool = True) -> None:
+        _check_not_notifying()
+        for clip_slot in self._get_clip_slots():
+            clip_slot.fire()
+
+    def fire_as_selected(self, force_legato: bool = False) -> None:
+        self.fire()
+        song = self.canonical_parent
+        scene_index = song._scenes.index(self)
+        if scene_index + 1 < len(song._scenes):
+            song.view.selected_scene = song._scenes[scene_index + 1]
+
+class CuePoint(LiveObject):
+    name = listenable_property("")
+    time = listenable_property(0.0, read_only=True)
+
+    def __init__(self, name: str, time: float):
+        super().__init__()
+        self.__dict__.update(name=name, time=time)
+
+    def jump(self) -> None:
+        self.canonical_parent.current_song_time = self.time
+
+class SongView(LiveObject):
+    selected_track = listenable_property(None)
+    selected_scene = listenable_property(None)
+    selected_chain = listenable_property(None)
+    detail_clip = listenable_property(None)
+    highlighted_clip_slot = None
+
+    def select_device(self, device: Device, should_appoint_device: bool = True) -> None:
+        _check_not_notifying()
+        track = device.canonical_parent
+        while track is not None and not isinstance(track, Track):
+            track = track.canonical_parent
+        if track is not None:
+            self.selected_track = track
+            track.view.selected_device = device
+
+class Song(LiveObject):
+    arrangement_overdub = listenable_property(False)
+    back_to_arranger = listenable_property(False)
+    clip_trigger_quantization = listenable_property(4)
+    current_song_time = listenable_property(0.0)
+    groove_amount = listenable_property(1.0)
+    loop = listenable_property(False)
+    loop_length = listenable_property(16.0)
+    loop_start = listenable_property(0.0)
+    metronome = listenable_property(False)
+    midi_recording_quantization = listenable_property(0)
+    nudge_down = listenable_property(False)
+    nudge_up = listenable_property(False)
+    punch_in = listenable_property(False)
+    punch_out = listenable_property(False)
+    record_mode = listenable_property(False)
+    session_record = listenable_property(False)
+    signature_denominator = listenable_property(4)
+    signature_numerator = listenable_property(4)
+    tempo = listenable_property(120.0)
+    can_redo = listenable_property(False, read_only=True)
+    can_undo = listenable_property(False, read_only=True)
+    is_playing = listenable_property(False, read_only=True)
+    session_record_status = listenable_property(0, read_only=True)
+    listenable = ("tracks", "return_tracks", "scenes", "cue_points", "song_length")
+
+    def __init__(self, tracks: Iterable[Track] = (), return_tracks: Iterable[Track] = (),
+                 scenes: Iterable[Scene] = (), master_track: Optional[Track] = None,
+                 cue_points: Iterable[CuePoint] = ()):
+        super().__init__()
+        self._tracks = []
+        self._return_tracks = []
+        self._scenes = []
+        self._cue_points = []
+        for items, values in ((self._tracks, tracks), (self._return_tracks, return_tracks),
+                              (self._scenes, scenes), (self._cue_points, cue_points)):
+            for value in values:
+                items.append(value)
+                value.canonical_parent = self
+        if master_track is None:
+            master_track = Track("Master", is_midi_track=False, can_be_armed=False)
+        self.master_track = master_track
+        self.master_track.canonical_parent = self
+        self.view = SongView()
+        self.view.canonical_parent = self
+        self.view.__dict__.update(selected_track=self._tracks[0] if self._tracks else self.master_track,
+                                  selected_scene=self._scenes[0] if self._scenes else None)
+        self._next_track_number = len(self._tracks) + 1
+
+    @property
+    def tracks(self) -> Tuple[Track, ...]:
+        return tuple(self._tracks)
+
+    @property
+    def return_tracks(self) -> Tuple[Track, ...]:
+        return tuple(self._return_tracks)
+
+    @property
+    def visible_tracks(self) -> Tuple[Track, ...]:
+        return tuple(self._tracks)
+
+    @property
+    def scenes(self) -> Tuple[Scene, ...]:
+        return tuple(self._scenes)
+
+    @property
+    def cue_points(self) -> Tuple[CuePoint, ...]:
+        return tuple(sorted(self._cue_points, key=lambda cue_point: cue_point.time))
+
+    @property
+    def song_length(self) -> float:
+        return max([self.loop_start + self.loop_length] +
+                   [clip.start_time + clip.length for track in self._tracks for clip in track._arrangement_clips])
+
+    #--------------------------------------------------------------------------------
+    # Transport
+    #--------------------------------------------------------------------------------
+    def start_playing(self) -> None:
+        """
+        Start playing from the start of the song.
+        """
+        _check_not_notifying()
+        self._update("current_song_time", 0.0)
+        self._update("is_playing", True)
+
+    def stop_playing(self) -> None:
+        _check_not_notifying()
+        self._update("is_playing", False)
+        for track in self._tracks:
+            track.stop_all_clips()
+
+    def continue_playing(self) -> None:
+        _check_not_notifying()
+        self._update("is_playing", True)
+
+    def stop_all_clips(self, quantized: bool = True) -> None:
+        _check_not_notifying()
+        for track in self._tracks:
+            track.stop_all_clips()
+
+    def jump_by(self, beats: float) -> None:
+        self.current_song_time = max(self.current_song_time + beats, 0.0)
+
+    def jump_to_next_cue(self) -> None:
+        for cue_point in self.cue_points:
+            if cue_point.time > self.current_song_time:
+                cue_point.jump()
+                return
+
+    def jump_to_prev_cue(self) -> None:
+        for cue_point in reversed(self.cue_points):
+            if cue_point.time < self.current_song_time:
+                cue_point.jump()
+                return
+
+    def advance(self, seconds: float) -> None:
+        """
+        Not part of the LOM: if the song is playing, move the playhead on by `seconds`
+        at the current tempo, looping within the loop region if loop is enabled.
+        """
+        if not self.is_playing:
+            return
+        beats = seconds * self.tempo / 60.0
+        song_time = self.current_song_time + beats
+        loop_end = self.loop_start + self.loop_length
+        if self.loop and self.loop_length > 0 and self.current_song_time < loop_end <= song_time:
+            song_time = self.loop_start + (song_time - self.loop_start) % self.loop_length
+        self._update("current_song_time", song_time)
+        for track in self._tracks:
+            if track.playing_slot_index >= 0:
+                track._clip_slots[track.playing_slot_index].clip._advance(beats)
+
+    #--------------------------------------------------------------------------------
+    # Tracks and scenes
+    #--------------------------------------------------------------------------------
+    def _create_track(self, index: int, is_midi_track: bool) -> None:
+        _check_not_notifying()
+        if index < -1 or index > len(self._tracks):
+            raise IndexError("Track index out of range")
+        name = "%d-%s" % (self._next_track_number, "MIDI" if is_midi_track else "Audio")
+        self._next_track_number += 1
+        track = Track(name, [ClipSlot() for _ in self._scenes], is_midi_track=is_midi_track,
+                      num_sends=len(self._return_tracks))
+        track.canonical_parent = self
+        _insert(self._tracks, track, index)
+        self.notify("tracks")
+
+    def create_midi_track(self, index: int = -1) -> None:
+        self._create_track(index, True)
+
+    def create_audio_track(self, index: int = -1) -> None:
+        self._create_track(index, False)
+
+    def create_return_track(self) -> None:
+        _check_not_notifying()
+        name = "%s-Return" % chr(ord("A") + len(self._return_tracks))
+        track = Track(name, is_midi_track=False, can_be_armed=False, num_sends=len(self._return_tracks) + 1)
+        track.canonical_parent = self
+        self._return_tracks.append(track)
+        for other_track in self._tracks + self._return_tracks[:-1] + [self.master_track]:
+            other_track.mixer_device._sends.append(DeviceParameter("Send %s" % name[0], 0.0, 0.0, 1.0))
+            other_track.mixer_device.notify("sends")
+        self.notify("return_tracks")
+
+    def delete_track(self, index: int) -> None:
+        _check_not_notifying()
+        if len(self._tracks) <= 1:
+            raise RuntimeError("Cannot delete the last track")
+        track = self._tracks.pop(index)
+        if self.view.selected_track is track:
+            self.view._update("selected_track", self._tracks[min(index, len(self._tracks) - 1)])
+        self.notify("tracks")
+
+    def delete_return_track(self, index: int) -> None:
+        _check_not_notifying()
+        self._return_tracks.pop(index)
+        for track in self._tracks + self._return_tracks + [self.master_track]:
+            del track.mixer_device._sends[index]
+            track.mixer_device.notify("sends")
+        self.notify("return_tracks")
+
+    def duplicate_track(self, index: int) -> None:
+        _check_not_notifying()
+        track = self._tracks[index].duplicate()
+        track.canonical_parent = self
+        self._tracks.insert(index + 1, track)
+        self.notify("tracks")
+
+    def create_scene(self, index: int = -1) -> Scene:
+        _check_not_notifying()
+        if index < -1 or index > len(self._scenes):
+            raise IndexError("Scene index out of range")
+        scene = Scene()
+        scene.canonical_parent = self
+        index = _insert(self._scenes, scene, index)
+        for track in self._tracks:
+            clip_slot = ClipSlot()
+            clip_slot.canonical_parent = track
+            track._clip_slots.insert(index, clip_slot)
+            track.notify("clip_slots")
+        self.notify("scenes")
+        return scene
+
+    def delete_scene(self, index: int) -> None:
+        _check_not_notifying()
+        if len(self._scenes) <= 1:
+            raise RuntimeError("Cannot delete the last scene")
+        scene = self._scenes.pop(index)
+        for track in self._tracks:
+            del track._clip_slots[index]
+            track.notify("clip_slots")
+        if self.view.selected_scene is scene:
+            self.view._update("selected_scene", self._scenes[min(index, len(self._scenes) - 1)])
+        self.notify("scenes")
+
+    def duplicate_scene(self, index: int) -> None:
+        _check_not_notifying()
+        scene = Scene(self._scenes[index].name)
+        scene.canonical_parent = self
+        self._scenes.insert(index + 1, scene)
+        for track in self._tracks:
+            clip = track._clip_slots[index].clip
+            clip_slot = ClipSlot(None if clip is None else clip.duplicate())
+            clip_slot.canonical_parent = track
+            track._clip_slots.insert(index + 1, clip_slot)
+            track.notify("clip_slots")
+        self.notify("scenes")
+
+    def set_or_delete_cue(self) -> None:
+        _check_not_notifying()
+        for cue_point in self._cue_points:
+            if cue_point.time == self.current_song_time:
+                self._cue_points.remove(cue_point)
+                break
+        else:
+            cue_point = CuePoint(str(len(self._cue_points) + 1), self.current_song_time)
+            cue_point.canonical_parent = self
+            self._cue_points.append(cue_point)
+        self.notify("cue_points")
+
+    #--------------------------------------------------------------------------------
+    # Methods with no effect on the fake
+    #--------------------------------------------------------------------------------
+    def capture_midi(self, destination: int = 0) -> None:
+        pass
+
+    def redo(self) -> None:
+        pass
+
+    def undo(self) -> None:
+        pass
+
+    def tap_tempo(self) -> None:
+        pass
+
+    def trigger_session_record(self, record_length: Optional[float] = None) -> None:
+        _check_not_notifying()
+        self.session_record = True
+
+class Application(LiveObject):
+    average_process_usage = listenable_property(0.0, read_only=True)
+    peak_process_usage = listenable_property(0.0, read_only=True)
+
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self._document = None
+
+    @classmethod
+    def get_application(cls) -> "Application":
+        if cls._instance is None:
+            cls._instance = Application()
+        return cls._instance
+
+    def get_document(self) -> Song:
+        return self._document
+
+    def set_document(self, song: Song) -> None:
+        """
+        Not part of the LOM: make `song` the current Live set.
+        """
+        self._document = song
+
+    def get_major_version(self) -> int:
+        return 12
+
+    def get_minor_version(self) -> int:
+        return 0
+
+    def get_bugfix_version(self) -> int:
+        return 0
@@ -0,0 +1,72 @@
+#--------------------------------------------------------------------------------
+# Runs AbletonOSC's Manager headless against a fake Live set.
+#--------------------------------------------------------------------------------
+
+import time
+from typing import Optional
+
+from .lom import Song
+from .control_surface import CInstance
+
+#--------------------------------------------------------------------------------
+# Live calls each control surface's update_display every 100ms.
+#--------------------------------------------------------------------------------
+TICK_DURATION = 0.1
+
+class FakeLive:
+    """
+    Creates AbletonOSC's Manager as Live does, with `song` as the current Live set, and
+    ticks it on demand (tick) or in real time (run). The Manager's OSC server binds to
+    the usual ports, so clients such as AbletonOSCClient can connect to it.
+
+    Raises:
+        OSError if the Manager couldn't bind its OSC server (e.g. because Live, or
+        another FakeLive, is already running AbletonOSC).
+    """
+    def __init__(self, song: Optional[Song] = None):
+        from . import install, import_abletonosc, create_song
+
+        self.song = song if song is not None else create_song()
+        install(self.song)
+        package = import_abletonosc()
+        self.c_instance = CInstance()
+        self.manager = package.manager.Manager(self.c_instance)
+        if not hasattr(self.manager, "osc_server"):
+            raise OSError(self.c_instance.messages[-1])
+
+    @property
+    def osc_server(self):
+        return self.manager.osc_server
+
+    def tick(self, count: int = 1, advance: bool = True) -> None:
+        """
+        Run `count` ticks, each of which first moves the song's playhead on by one tick
+        (if the song is playing and `advance` is True), then calls the Manager's
+        update_display as Live would.
+        """
+        for _ in range(count):
+            if advance:
+                self.song.advance(TICK_DURATION)
+            self.manager.update_display()
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Tick every 100ms in real time, for `duration` seconds, or until interrupted.
+        The playhead moves on by the time actually elapsed between ticks.
+        """
+        t0 = last_time = time.perf_counter()
+        next_tick_time = t0
+        while duration is None or next_tick_time - t0 < duration:
+            now = time.perf_counter()
+            self.song.advance(now - last_time)
+            last_time = now
+            self.manager.update_display()
+            next_tick_time += TICK_DURATION
+            time.sleep(max(next_tick_time - time.perf_counter(), 0.0))
+
+    def close(self) -> None:
+        """
+        Remove AbletonOSC's handlers and listeners, and close its OSC server.
+        """
+        self.manager.clear_api()
+        self.manager.osc_server.shutdown()
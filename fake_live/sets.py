@@ -0,0 +1,120 @@
+#--------------------------------------------------------------------------------
+# Builders for synthetic Live sets, scaled by the number of tracks, scenes,
+# notes and the depth of racks, for load tests and benchmarks.
+#--------------------------------------------------------------------------------
+
+import random
+from typing import List, Optional
+
+from .lom import Song, Track, ClipSlot, Clip, Scene, Device, RackDevice, Chain, DeviceParameter, DeviceType, CuePoint
+
+NOTE_NAMES = ("C", "D", "E", "F", "G", "A", "B")
+
+def create_parameters(num_parameters: int) -> List[DeviceParameter]:
+    """
+    Returns a device's parameters: "Device On", followed by `num_parameters` continuous parameters.
+    """
+    return [DeviceParameter("Device On", 1.0, 0.0, 1.0, is_quantized=True)] + \
+           [DeviceParameter("Parameter %d" % (index + 1), 0.5, 0.0, 1.0) for index in range(num_parameters)]
+
+def create_devices(rack_depth: int = 0,
+                   num_chains: int = 2,
+                   num_devices: int = 2,
+                   num_parameters: int = 8) -> List[Device]:
+    """
+    Returns a chain of `num_devices` devices, the last of which is a rack nested
+    `rack_depth` levels deep if `rack_depth` > 0.
+
+    Args:
+        rack_depth: The number of levels of nested racks.
+        num_chains: The number of chains in each rack.
+        num_devices: The number of devices in each chain, including any nested rack.
+        num_parameters: The number of parameters of each device, besides "Device On".
+    """
+    devices = [Device("Device %d" % (index + 1), "Reverb", DeviceType.audio_effect, create_parameters(num_parameters))
+               for index in range(num_devices - 1 if rack_depth > 0 else num_devices)]
+    if rack_depth > 0:
+        chains = [Chain("Chain %d" % (index + 1), create_devices(rack_depth - 1, num_chains, num_devices, num_parameters))
+                  for index in range(num_chains)]
+        devices.append(RackDevice("Rack %d" % rack_depth, chains))
+    return devices
+
+def create_clip(name: str, num_notes: int = 16, length: float = 4.0, rng: Optional[random.Random] = None) -> Clip:
+    """
+    Returns a MIDI clip containing `num_notes` random notes, on a 16th-note grid.
+    """
+    rng = rng or random.Random(0)
+    steps = max(int(length * 4), 1)
+    notes = [(rng.randrange(36, 96), rng.randrange(steps) / 4.0, 0.25 * rng.randrange(1, 5), float(rng.randrange(40, 128)), False)
+             for _ in range(num_notes)]
+    return Clip(name, length, notes=notes)
+
+def create_song(num_tracks: int = 8,
+                num_scenes: int = 8,
+                num_return_tracks: int = 2,
+                clip_density: float = 0.5,
+                num_notes: int = 16,
+                clip_length: float = 4.0,
+                rack_depth: int = 0,
+                num_chains: int = 2,
+                num_devices: int = 2,
+                num_parameters: int = 8,
+                num_cue_points: int = 0,
+                seed: int = 0) -> Song:
+    """
+    Returns a synthetic Live set of MIDI tracks, each with an instrument followed by a chain
+    of effects. Clips are named after chords (e.g. "Clip 3_C-E-G"), for use with /live/clips/filter.
+
+    For example, a large set with dense clips and deep racks:
+
+        create_song(num_tracks=1000, num_scenes=16, clip_density=1.0, num_notes=256, rack_depth=4)
+
+    Args:
+        num_tracks: The number of MIDI tracks.
+        num_scenes: The number of scenes, and therefore of clip slots per track.
+        num_return_tracks: The number of return tracks.
+        clip_density: The proportion of clip slots that contain a clip.
+        num_notes: The number of notes in each clip.
+        clip_length: The length of each clip, in beats.
+        rack_depth: The number of levels of nested racks on each track.
+        num_chains: The number of chains in each rack.
+        num_devices: The number of devices in each chain, and after each track's instrument.
+        num_parameters: The number of parameters of each device, besides "Device On".
+        num_cue_points: The number of cue points, one every 4 bars.
+        seed: The seed used for clip placement and notes, so that sets are reproducible.
+    """
+    rng = random.Random(seed)
+    tracks = []
+    for track_index in range(num_tracks):
+        clip_slots = []
+        for scene_index in range(num_scenes):
+            clip = None
+            if rng.random() < clip_density:
+                root = rng.randrange(len(NOTE_NAMES))
+                chord = "-".join(NOTE_NAMES[(root + offset) % len(NOTE_NAMES)] for offset in (0, 2, 4))
+                clip = create_clip("Clip %d_%s" % (scene_index + 1, chord), num_notes, clip_length, rng)
+            clip_slots.append(ClipSlot(clip))
+        instrument = Device("Instrument", "OriginalSimpler", DeviceType.instrument, create_parameters(num_parameters))
+        devices = [instrument] + create_devices(rack_depth, num_chains, num_devices, num_parameters)
+        tracks.append(Track("Track %d" % (track_index + 1), clip_slots, devices, num_sends=num_return_tracks))
+    return_tracks = [Track("%s-Return" % chr(ord("A") + index), devices=create_devices(0, num_devices=1),
+                           is_midi_track=False, can_be_armed=False, num_sends=num_return_tracks)
+                     for index in range(num_return_tracks)]
+    master_track = Track("Master", devices=create_devices(0, num_devices=1), is_midi_track=False,
+                         can_be_armed=False, num_sends=0)
+    scenes = [Scene("Scene %d" % (index + 1)) for index in range(num_scenes)]
+    cue_points = [CuePoint("Cue %d" % (index + 1), index * 16.0) for index in range(num_cue_points)]
+    return Song(tracks, return_tracks, scenes, master_track, cue_points)
+
+def create_default_song() -> Song:
+    """
+    Returns a set like Live's default blank set, which the tests in tests/ expect: two MIDI
+    tracks, two audio tracks, two return tracks and eight scenes, with no clips or devices.
+    """
+    tracks = [Track("%d-%s" % (index + 1, "MIDI" if index < 2 else "Audio"), [ClipSlot() for _ in range(8)],
+                    is_midi_track=index < 2, num_sends=2)
+              for index in range(4)]
+    return_tracks = [Track(name, is_midi_track=False, can_be_armed=False, num_sends=2)
+                     for name in ("A-Reverb", "B-Delay")]
+    master_track = Track("Main", is_midi_track=False, can_be_armed=False)
+    return Song(tracks, return_tracks, [Scene() for _ in range(8)], master_track)
@@ -5,6 +5,7 @@ from . import abletonosc
 import importlib
 import traceback
 import logging
+import time
 import os
 
 logger = logging.getLogger("abletonosc")
@@ -17,6 +18,12 @@ class Manager(ControlSurface):
 
         self.handlers = []
 
+        #--------------------------------------------------------------------------------
+        # The cProfile profiler started by /live/api/profile/start, if any, which is
+        # enabled for the duration of each tick.
+        #--------------------------------------------------------------------------------
+        self.profiler = None
+
         try:
             self.osc_server = abletonosc.OSCServer()
             self.schedule_message(0, self.tick)
@@ -36,11 +43,7 @@ class Manager(ControlSurface):
         Start logging to a local logfile (logs/abletonosc.log),
         and relay error messages via OSC.
         """
-        module_path = os.path.dirname(os.path.realpath(__file__))
-        log_dir = os.path.join(module_path, "logs")
-        if not os.path.exists(log_dir):
-            os.mkdir(log_dir, 0o755)
-        log_path = os.path.join(log_dir, "abletonosc.log")
+        log_path = os.path.join(self.get_log_dir(), "abletonosc.log")
         self.log_file_handler = logging.FileHandler(log_path)
         self.log_file_handler.setLevel(self.log_level.upper())
         formatter = logging.Formatter('(%(asctime)s) [%(levelname)s] %(message)s')
@@ -60,6 +63,59 @@ class Manager(ControlSurface):
         self.live_osc_error_handler.setLevel(logging.ERROR)
         logger.addHandler(self.live_osc_error_handler)
 
+    def get_log_dir(self) -> str:
+        """
+        Returns the path of the logs directory within the AbletonOSC directory,
+        creating it if necessary.
+        """
+        module_path = os.path.dirname(os.path.realpath(__file__))
+        log_dir = os.path.join(module_path, "logs")
+        if not os.path.exists(log_dir):
+            os.mkdir(log_dir, 0o755)
+        return log_dir
+
+    def start_profiling(self) -> None:
+        """
+        Start profiling tick processing with cProfile, from the next tick onwards.
+        Restarts the profiler if it is already running.
+        """
+        import cProfile
+
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.profiler = cProfile.Profile()
+        logger.info("Started profiling")
+
+    def stop_profiling(self, count: int = 20) -> tuple:
+        """
+        Stop profiling, and write the profile to logs/profile-<time>.pstats, which can
+        be read with Python's pstats module or viewers such as snakeviz.
+
+        Returns:
+            The path of the profile, followed by (function, ncalls, tottime, cumtime)
+            for the `count` functions with the greatest cumulative time.
+        """
+        import pstats
+
+        if self.profiler is None:
+            raise RuntimeError("Profiler is not running")
+        profiler = self.profiler
+        profiler.disable()
+        self.profiler = None
+
+        profile_path = os.path.join(self.get_log_dir(), "profile-%s.pstats" % time.strftime("%Y%m%d-%H%M%S"))
+        profiler.dump_stats(profile_path)
+        logger.info("Stopped profiling, and wrote profile to %s" % profile_path)
+
+        stats = pstats.Stats(profiler)
+        stats.sort_stats("cumulative")
+        rv = (profile_path,)
+        for function in stats.fcn_list[:count]:
+            filename, line, name = function
+            _, ncalls, tottime, cumtime, _ = stats.stats[function]
+            rv += ("%s:%d(%s)" % (os.path.basename(filename), line, name), ncalls, tottime, cumtime)
+        return rv
+
     def stop_logging(self):
         logger.removeHandler(self.log_file_handler)
         logger.removeHandler(self.live_osc_error_handler)
@@ -77,11 +133,94 @@ class Manager(ControlSurface):
             assert log_level in ("debug", "info", "warning", "error", "critical")
             self.log_level = log_level
             self.log_file_handler.setLevel(self.log_level.upper())
+        def get_bundle_replies_callback(params):
+            mtu = self.osc_server.get_bundle_replies(self.osc_server.remote_addr)
+            return (mtu is not None, mtu or 0)
+        def set_bundle_replies_callback(params):
+            enabled = bool(params[0]) if len(params) > 0 else True
+            mtu = int(params[1]) if len(params) > 1 else abletonosc.OSC_MTU
+            self.osc_server.set_bundle_replies(self.osc_server.remote_addr, enabled, mtu)
+        def get_chunked_replies_callback(params):
+            mtu = self.osc_server.get_chunked_replies(self.osc_server.remote_addr)
+            return (mtu is not None, mtu or 0)
+        def set_chunked_replies_callback(params):
+            enabled = bool(params[0]) if len(params) > 0 else True
+            mtu = int(params[1]) if len(params) > 1 else abletonosc.OSC_MTU
+            self.osc_server.set_chunked_replies(self.osc_server.remote_addr, enabled, mtu)
+        def get_listener_throttle_callback(params):
+            return tuple(self.osc_server.get_listener_throttle(self.osc_server.remote_addr))
+        def set_listener_throttle_callback(params):
+            max_rate = float(params[0]) if len(params) > 0 else 0.0
+            threshold = float(params[1]) if len(params) > 1 else 0.0
+            dedup = bool(params[2]) if len(params) > 2 else True
+            self.osc_server.set_listener_throttle(self.osc_server.remote_addr, max_rate, threshold, dedup)
+        def get_backlog_callback(params):
+            return (self.osc_server.backlog_size,
+                    self.osc_server.num_ticks_over_time_budget,
+                    self.osc_server.num_ticks_over_message_limit)
+        def get_bundle_schedule_callback(params):
+            return self.osc_server.get_schedule_stats()
+        def reset_bundle_schedule_callback(params):
+            self.osc_server.reset_schedule_stats()
+        def clear_bundle_schedule_callback(params):
+            self.osc_server.clear_scheduled_bundles()
+        def get_stats_callback(params):
+            return (self.osc_server.stats_enabled,
+                    *(value for address_stats in self.osc_server.get_stats() for value in address_stats))
+        def set_stats_callback(params):
+            enabled = bool(params[0]) if len(params) > 0 else True
+            self.osc_server.set_stats_enabled(enabled)
+        def reset_stats_callback(params):
+            self.osc_server.reset_stats()
+        def get_tick_stats_callback(params):
+            tick_stats = self.osc_server.tick_stats
+            if tick_stats is None:
+                return (False,)
+            return (True, tick_stats.ticks.maxlen, *tick_stats.get_summary())
+        def set_tick_stats_callback(params):
+            enabled = bool(params[0]) if len(params) > 0 else True
+            window = int(params[1]) if len(params) > 1 else abletonosc.OSC_TICK_STATS_WINDOW
+            self.osc_server.set_tick_stats_enabled(enabled, window)
+        def reset_tick_stats_callback(params):
+            if self.osc_server.tick_stats is not None:
+                self.osc_server.tick_stats.reset()
+        def start_profile_callback(params):
+            self.start_profiling()
+        def stop_profile_callback(params):
+            count = int(params[0]) if len(params) > 0 else 20
+            return self.stop_profiling(count)
+        def get_profile_callback(params):
+            return (self.profiler is not None,)
 
         self.osc_server.add_handler("/live/test", test_callback)
         self.osc_server.add_handler("/live/api/reload", reload_callback)
         self.osc_server.add_handler("/live/api/get/log_level", get_log_level_callback)
         self.osc_server.add_handler("/live/api/set/log_level", set_log_level_callback)
+        self.osc_server.add_handler("/live/api/get/backlog", get_backlog_callback)
+        self.osc_server.add_handler("/live/api/get/bundle_schedule", get_bundle_schedule_callback)
+        self.osc_server.add_handler("/live/api/reset/bundle_schedule", reset_bundle_schedule_callback)
+        self.osc_server.add_handler("/live/api/clear/bundle_schedule", clear_bundle_schedule_callback)
+        self.osc_server.add_handler("/live/api/get/stats", get_stats_callback)
+        self.osc_server.add_handler("/live/api/set/stats", set_stats_callback)
+        self.osc_server.add_handler("/live/api/reset/stats", reset_stats_callback)
+        self.osc_server.add_handler("/live/api/get/tick_stats", get_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/set/tick_stats", set_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/reset/tick_stats", reset_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/profile/start", start_profile_callback)
+        self.osc_server.add_handler("/live/api/profile/stop", stop_profile_callback)
+        self.osc_server.add_handler("/live/api/get/profile", get_profile_callback)
+        self.osc_server.add_handler("/live/api/get/bundle_replies", get_bundle_replies_callback)
+        self.osc_server.add_handler("/live/api/set/bundle_replies", set_bundle_replies_callback)
+        self.osc_server.add_handler("/live/api/get/chunked_replies", get_chunked_replies_callback)
+        self.osc_server.add_handler("/live/api/set/chunked_replies", set_chunked_replies_callback)
+        self.osc_server.add_handler("/live/api/get/listener_throttle", get_listener_throttle_callback)
+        self.osc_server.add_handler("/live/api/set/listener_throttle", set_listener_throttle_callback)
+
+        #--------------------------------------------------------------------------------
+        # A single device index is shared by the track and device handlers, so that each
+        # track's devices are only indexed and observed once.
+        #--------------------------------------------------------------------------------
+        self.device_index = abletonosc.DeviceIndex()
 
         with self.component_guard():
             self.handlers = [
@@ -99,6 +238,7 @@ class Manager(ControlSurface):
         self.osc_server.clear_handlers()
         for handler in self.handlers:
             handler.clear_api()
+        self.device_index.clear()
 
     def tick(self):
         """
@@ -108,8 +248,45 @@ class Manager(ControlSurface):
         processes such as the OSC server to perform operations.
         """
         logger.debug("Tick...")
-        self.osc_server.process()
-        self.schedule_message(1, self.tick)
+        #--------------------------------------------------------------------------------
+        # The profiler may be stopped while handling a message during this tick, in which
+        # case it has already been disabled.
+        #--------------------------------------------------------------------------------
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.enable()
+        #--------------------------------------------------------------------------------
+        # If tick statistics are enabled, OSCServer times receiving, parsing, dispatching
+        # and sending, and the listener phase is timed here.
+        #--------------------------------------------------------------------------------
+        tick_stats = self.osc_server.tick_stats
+        if tick_stats is not None:
+            tick_stats.start_tick()
+        #--------------------------------------------------------------------------------
+        # An error in a single handler or send must not stop the tick loop, so errors are
+        # logged per handler, and the tick is always closed and the next one scheduled.
+        #--------------------------------------------------------------------------------
+        try:
+            self.osc_server.process()
+            if tick_stats is not None:
+                tick_stats.switch(tick_stats.LISTENERS)
+            for handler in self.handlers:
+                try:
+                    handler.flush_listeners()
+                except Exception:
+                    logger.error("Error flushing listeners of %s: %s" % (handler.class_identifier, traceback.format_exc()))
+            if tick_stats is not None:
+                tick_stats.switch(tick_stats.SEND)
+            try:
+                self.osc_server.flush()
+            except Exception:
+                logger.error("Error flushing replies: %s" % traceback.format_exc())
+        finally:
+            if tick_stats is not None:
+                tick_stats.end_tick()
+            if profiler is not None:
+                profiler.disable()
+            self.schedule_message(1, self.tick)
 
     def reload_imports(self):
         try:
@@ -135,6 +312,8 @@ class Manager(ControlSurface):
     def disconnect(self):
         self.show_message("Disconnecting...")
         logger.info("Disconnecting...")
+        if self.profiler is not None:
+            self.profiler.disable()
         self.stop_logging()
         self.osc_server.shutdown()
         super().disconnect()
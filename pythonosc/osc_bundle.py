@@ -45,7 +45,7 @@ class OscBundle(object):
             # The size is an int32 representing the number of 8-bit bytes in the
             # contents, and will always be a multiple of 4. The contents are either
             # an OSC Message or an OSC Bundle.
-            while self._dgram[index:]:
+            while index < len(self._dgram):
                 # Get the sub content size.
                 content_size, index = osc_types.get_int(self._dgram, index)
                 # Get the datagram for the sub content.
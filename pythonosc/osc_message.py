@@ -1,86 +1,201 @@
 """Representation of an OSC message in a pythonesque way."""
 
 import logging
+import struct
+import functools
 
 from .parsing import osc_types
-from typing import List, Iterator, Any
+from typing import List, Iterator, Any, Tuple
 
 
 class ParseError(Exception):
     """Base exception raised when a datagram parsing error occurs."""
 
 
+# Fixed-width argument types, mapped to their struct format characters.
+_FIXED_WIDTH_FORMATS = {
+    "i": "i",  # Integer.
+    "h": "q",  # Int64.
+    "f": "f",  # Float.
+    "d": "d",  # Double.
+    "r": "I",  # RGBA.
+}
+
+# Argument types that take no space in the datagram, mapped to their values.
+_CONSTANT_VALUES = {
+    "T": True,
+    "F": False,
+    "N": None,
+}
+
+# Parse plan steps. Each step is a tuple whose first element is one of these.
+_STEP_STRUCT = 0  # (_STEP_STRUCT, struct.Struct): a run of fixed-width arguments.
+_STEP_STRING = 1  # (_STEP_STRING,)
+_STEP_BLOB = 2  # (_STEP_BLOB,)
+_STEP_CONSTANT = 3  # (_STEP_CONSTANT, value)
+_STEP_GETTER = 4  # (_STEP_GETTER, osc_types getter): types that need conversion.
+_STEP_ARRAY_START = 5  # (_STEP_ARRAY_START,)
+_STEP_ARRAY_END = 6  # (_STEP_ARRAY_END,)
+
+_GETTERS = {
+    "m": osc_types.get_midi,  # MIDI.
+    "t": osc_types.get_timetag,  # OSC time tag.
+}
+
+
+# Type tags longer than this are not cached. Long type tags, such as those of
+# messages containing many notes, rarely repeat, so caching their plans would
+# only keep large plans alive.
+_MAX_CACHED_TYPE_TAG_LENGTH = 64
+
+
+def _compile_plan(type_tag: str) -> Tuple[Tuple, ...]:
+    """Returns the parse plan for a type tag (without its leading comma).
+
+    Plans for short type tags are cached, as clients typically send the same few
+    type tags over and over.
+
+    Raises:
+      ParseError if the type tag's array brackets are unbalanced.
+    """
+    if len(type_tag) > _MAX_CACHED_TYPE_TAG_LENGTH:
+        return _build_plan(type_tag)
+    return _build_cached_plan(type_tag)
+
+
+def _build_plan(type_tag: str) -> Tuple[Tuple, ...]:
+    """Compile a type tag (without its leading comma) into a parse plan.
+
+    Consecutive fixed-width arguments are merged into a single struct, so that
+    they can be decoded by one call to unpack_from.
+
+    Raises:
+      ParseError if the type tag's array brackets are unbalanced.
+    """
+    plan = []  # type: List[Tuple]
+    run = ""
+    depth = 0
+    for param in type_tag:
+        if param in _FIXED_WIDTH_FORMATS:
+            run += _FIXED_WIDTH_FORMATS[param]
+            continue
+        if run:
+            plan.append((_STEP_STRUCT, struct.Struct(">" + run)))
+            run = ""
+        if param == "s":
+            plan.append((_STEP_STRING,))
+        elif param == "b":
+            plan.append((_STEP_BLOB,))
+        elif param in _CONSTANT_VALUES:
+            plan.append((_STEP_CONSTANT, _CONSTANT_VALUES[param]))
+        elif param in _GETTERS:
+            plan.append((_STEP_GETTER, _GETTERS[param]))
+        elif param == "[":
+            depth += 1
+            plan.append((_STEP_ARRAY_START,))
+        elif param == "]":
+            if depth == 0:
+                raise ParseError('Unexpected closing bracket in type tag: {0}'.format(type_tag))
+            depth -= 1
+            plan.append((_STEP_ARRAY_END,))
+        else:
+            # TODO: Support more exotic types as described in the specification.
+            logging.warning('Unhandled parameter type: {0}'.format(param))
+    if run:
+        plan.append((_STEP_STRUCT, struct.Struct(">" + run)))
+    if depth != 0:
+        raise ParseError('Missing closing bracket in type tag: {0}'.format(type_tag))
+    return tuple(plan)
+
+
+_build_cached_plan = functools.lru_cache(maxsize=256)(_build_plan)
+
+
+def _find_string_end(dgram: bytes, start_index: int) -> int:
+    """Returns the index of the null terminating the string at start_index.
+
+    Raises:
+      ParseError if the string is not terminated.
+    """
+    end = dgram.find(b'\x00', start_index)
+    if end < 0:
+        raise ParseError('String is not null-terminated')
+    return end
+
+
 class OscMessage(object):
     """Representation of a parsed datagram representing an OSC message.
 
     An OSC message consists of an OSC Address Pattern followed by an OSC
     Type Tag String followed by zero or more OSC Arguments.
+
+    The address is parsed on construction, and the arguments on first access
+    to params, so that messages whose arguments are never read (for example,
+    those for unknown addresses) are not fully parsed.
     """
 
     def __init__(self, dgram: bytes) -> None:
         self._dgram = dgram
-        self._parameters = []  # type: List[Any]
-        self._parse_datagram()
+        self._parameters = None  # type: Any
+        try:
+            end = _find_string_end(dgram, 0)
+            self._address_regexp = dgram[:end].decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ParseError('Found incorrect datagram, ignoring it', e)
+        self._index = (end + 4) & ~3
 
     def _parse_datagram(self) -> None:
-        try:
-            self._address_regexp, index = osc_types.get_string(self._dgram, 0)
-            if not self._dgram[index:]:
-                # No params is legit, just return now.
-                return
+        dgram = self._dgram
+        index = self._index
+        if index >= len(dgram):
+            # No params is legit, just return now.
+            self._parameters = []
+            return
+
+        # Some clients (e.g. Reaktor) omit the padding of the final argument,
+        # so pad the datagram to a multiple of 4 bytes.
+        if len(dgram) % 4:
+            dgram = dgram + b'\x00' * (-len(dgram) % 4)
 
+        try:
             # Get the parameters types.
-            type_tag, index = osc_types.get_string(self._dgram, index)
+            end = _find_string_end(dgram, index)
+            type_tag = dgram[index:end].decode('utf-8')
+            index = (end + 4) & ~3
             if type_tag.startswith(','):
                 type_tag = type_tag[1:]
 
             params = []  # type: List[Any]
             param_stack = [params]
             # Parse each parameter given its type.
-            for param in type_tag:
-                val = NotImplemented  # type: Any
-                if param == "i":  # Integer.
-                    val, index = osc_types.get_int(self._dgram, index)
-                elif param == "h":  # Int64.
-                    val, index = osc_types.get_int64(self._dgram, index)
-                elif param == "f":  # Float.
-                    val, index = osc_types.get_float(self._dgram, index)
-                elif param == "d":  # Double.
-                    val, index = osc_types.get_double(self._dgram, index)
-                elif param == "s":  # String.
-                    val, index = osc_types.get_string(self._dgram, index)
-                elif param == "b":  # Blob.
-                    val, index = osc_types.get_blob(self._dgram, index)
-                elif param == "r":  # RGBA.
-                    val, index = osc_types.get_rgba(self._dgram, index)
-                elif param == "m":  # MIDI.
-                    val, index = osc_types.get_midi(self._dgram, index)
-                elif param == "t":  # osc time tag:
-                    val, index = osc_types.get_timetag(self._dgram, index)
-                elif param == "T":  # True.
-                    val = True
-                elif param == "F":  # False.
-                    val = False
-                elif param == "N":  # Nil.
-                    val = None
-                elif param == "[":  # Array start.
+            for step in _compile_plan(type_tag):
+                kind = step[0]
+                if kind == _STEP_STRUCT:
+                    packer = step[1]
+                    param_stack[-1].extend(packer.unpack_from(dgram, index))
+                    index += packer.size
+                elif kind == _STEP_STRING:
+                    end = _find_string_end(dgram, index)
+                    param_stack[-1].append(dgram[index:end].decode('utf-8'))
+                    index = (end + 4) & ~3
+                elif kind == _STEP_BLOB:
+                    val, index = osc_types.get_blob(dgram, index)
+                    param_stack[-1].append(val)
+                elif kind == _STEP_CONSTANT:
+                    param_stack[-1].append(step[1])
+                elif kind == _STEP_GETTER:
+                    val, index = step[1](dgram, index)
+                    param_stack[-1].append(val)
+                elif kind == _STEP_ARRAY_START:
                     array = []  # type: List[Any]
                     param_stack[-1].append(array)
                     param_stack.append(array)
-                elif param == "]":  # Array stop.
-                    if len(param_stack) < 2:
-                        raise ParseError('Unexpected closing bracket in type tag: {0}'.format(type_tag))
-                    param_stack.pop()
-                # TODO: Support more exotic types as described in the specification.
                 else:
-                    logging.warning('Unhandled parameter type: {0}'.format(param))
-                    continue
-                if param not in "[]":
-                    param_stack[-1].append(val)
-            if len(param_stack) != 1:
-                raise ParseError('Missing closing bracket in type tag: {0}'.format(type_tag))
+                    param_stack.pop()
+            if index > len(dgram):
+                raise ParseError('Datagram is too short')
             self._parameters = params
-        except osc_types.ParseError as pe:
+        except (osc_types.ParseError, struct.error, UnicodeDecodeError) as pe:
             raise ParseError('Found incorrect datagram, ignoring it', pe)
 
     @property
@@ -110,4 +225,6 @@ class OscMessage(object):
 
     def __iter__(self) -> Iterator[Any]:
         """Returns an iterator over the parameters of this message."""
+        if self._parameters is None:
+            self._parse_datagram()
         return iter(self._parameters)
@@ -3,6 +3,8 @@
 from . import osc_message
 from .parsing import osc_types
 
+import struct
+import functools
 from typing import List, Tuple, Union, Any, Optional
 
 
@@ -13,6 +15,121 @@ class BuildError(Exception):
     """Error raised when an incomplete message is trying to be built."""
 
 
+# Fixed-width argument types, mapped to their struct format characters.
+_FIXED_WIDTH_FORMATS = {
+    "i": "i",  # Integer.
+    "h": "q",  # Int64.
+    "f": "f",  # Float.
+    "d": "d",  # Double.
+    "r": "I",  # RGBA.
+}
+
+# Variable-width argument types, mapped to the functions that write them.
+_WRITERS = {
+    "s": osc_types.write_string,
+    "b": osc_types.write_blob,
+    "m": osc_types.write_midi,
+}
+
+# Argument types that take no space in the datagram.
+_EMPTY_TYPES = "TFN[]"
+
+
+# Argument types longer than this are not cached. Long type tags, such as those
+# of replies containing many notes, rarely repeat, so caching their plans would
+# only keep large plans alive.
+_MAX_CACHED_TYPE_TAG_LENGTH = 64
+
+
+def compile_packer(arg_types: str) -> Tuple[bytes, Tuple[Tuple, ...], int]:
+    """Returns the packing plan for a message's argument types (see _build_packer).
+
+    Plans for short type tags are cached, as the same few are built over and over.
+    """
+    if len(arg_types) > _MAX_CACHED_TYPE_TAG_LENGTH:
+        return _build_packer(arg_types)
+    return _build_cached_packer(arg_types)
+
+
+def _build_packer(arg_types: str) -> Tuple[bytes, Tuple[Tuple, ...], int]:
+    """Compile a message's argument types into a packing plan.
+
+    Returns:
+      A tuple containing the type tag datagram, the list of steps, and the total
+      size of the fixed-width arguments. Each step is either (struct.Struct, index,
+      count), which packs the run of `count` fixed-width arguments starting at
+      `index`, or (writer, index), which writes a single variable-width argument.
+
+    Raises:
+      - BuildError: if an argument type is not supported.
+    """
+    steps = []  # type: List[Tuple]
+    runs = []  # type: List[Tuple[int, str]]
+    for index, arg_type in enumerate(arg_types):
+        if arg_type in _FIXED_WIDTH_FORMATS:
+            if runs and runs[-1][0] + len(runs[-1][1]) == index:
+                runs[-1] = (runs[-1][0], runs[-1][1] + _FIXED_WIDTH_FORMATS[arg_type])
+            else:
+                runs.append((index, _FIXED_WIDTH_FORMATS[arg_type]))
+                steps.append(None)
+        elif arg_type in _WRITERS:
+            steps.append((_WRITERS[arg_type], index))
+        elif arg_type not in _EMPTY_TYPES:
+            raise BuildError('Incorrect parameter type found {}'.format(arg_type))
+
+    # Replace each placeholder step with the struct for its run.
+    fixed_size = 0
+    run_iter = iter(runs)
+    for step_index, step in enumerate(steps):
+        if step is None:
+            run_start, run = next(run_iter)
+            packer = struct.Struct(">" + run)
+            steps[step_index] = (packer, run_start, len(run))
+            fixed_size += packer.size
+    return osc_types.write_string(',' + arg_types), tuple(steps), fixed_size
+
+
+_build_cached_packer = functools.lru_cache(maxsize=256)(_build_packer)
+
+
+def pack_args(header: bytes, steps: Tuple[Tuple, ...], fixed_size: int, values: List[Any]) -> bytes:
+    """Pack argument values into a datagram, following a plan from compile_packer().
+
+    Args:
+      - header: The datagram's address and type tag.
+      - steps, fixed_size: The plan for the argument types.
+      - values: The argument values, one per argument type.
+
+    Raises:
+      - struct.error, osc_types.BuildError: if a value could not be packed.
+    """
+    # Write variable-width arguments up front, so that the size of the
+    # datagram is known before it is allocated.
+    size = len(header) + fixed_size
+    written = []
+    for step in steps:
+        if len(step) == 2:
+            data = step[0](values[step[1]])
+            written.append(data)
+            size += len(data)
+
+    dgram = bytearray(size)
+    offset = len(header)
+    dgram[:offset] = header
+    written_index = 0
+    for step in steps:
+        if len(step) == 3:
+            packer, index, count = step
+            packer.pack_into(dgram, offset, *values[index:index + count])
+            offset += packer.size
+        else:
+            data = written[written_index]
+            written_index += 1
+            dgram[offset:offset + len(data)] = data
+            offset += len(data)
+    return bytes(dgram)
+
+
 class OscMessageBuilder(object):
     """Builds arbitrary OscMessage instances."""
 
@@ -140,44 +257,18 @@ class OscMessageBuilder(object):
         """
         if not self._address:
             raise BuildError('OSC addresses cannot be empty')
-        dgram = b''
         try:
             # Write the address.
-            dgram += osc_types.write_string(self._address)
+            address_dgram = osc_types.write_string(self._address)
             if not self._args:
-                dgram += osc_types.write_string(',')
-                return osc_message.OscMessage(dgram)
-
-            # Write the parameters.
-            arg_types = "".join([arg[0] for arg in self._args])
-            dgram += osc_types.write_string(',' + arg_types)
-            for arg_type, value in self._args:
-                if arg_type == self.ARG_TYPE_STRING:
-                    dgram += osc_types.write_string(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_INT:
-                    dgram += osc_types.write_int(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_INT64:
-                    dgram += osc_types.write_int64(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_FLOAT:
-                    dgram += osc_types.write_float(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_DOUBLE:
-                    dgram += osc_types.write_double(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_BLOB:
-                    dgram += osc_types.write_blob(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_RGBA:
-                    dgram += osc_types.write_rgba(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_MIDI:
-                    dgram += osc_types.write_midi(value)  # type: ignore[arg-type]
-                elif arg_type in (self.ARG_TYPE_TRUE,
-                                  self.ARG_TYPE_FALSE,
-                                  self.ARG_TYPE_ARRAY_START,
-                                  self.ARG_TYPE_ARRAY_STOP,
-                                  self.ARG_TYPE_NIL):
-                    continue
-                else:
-                    raise BuildError('Incorrect parameter type found {}'.format(
-                        arg_type))
+                return osc_message.OscMessage(address_dgram + osc_types.write_string(','))
+
+            type_tag_dgram, steps, fixed_size = compile_packer("".join([arg[0] for arg in self._args]))
+            dgram = pack_args(address_dgram + type_tag_dgram, steps, fixed_size, [arg[1] for arg in self._args])
 
+            # Arguments are only parsed if the message's params are accessed.
             return osc_message.OscMessage(dgram)
+        except struct.error as e:
+            raise BuildError('Could not build the message: Wrong argument value passed: {}'.format(e))
         except osc_types.BuildError as be:
             raise BuildError('Could not build the message: {}'.format(be))
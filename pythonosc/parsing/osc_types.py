@@ -69,28 +69,20 @@ def get_string(dgram: bytes, start_index: int) -> Tuple[str, int]:
     """
     if start_index < 0:
         raise ParseError('start_index < 0')
-    offset = 0
     try:
-        if (len(dgram) > start_index + _STRING_DGRAM_PAD
-                and dgram[start_index + _STRING_DGRAM_PAD] == _EMPTY_STR_DGRAM):
-            return '', start_index + _STRING_DGRAM_PAD
-        while dgram[start_index + offset] != 0:
-            offset += 1
-        # Align to a byte word.
-        if (offset) % _STRING_DGRAM_PAD == 0:
-            offset += _STRING_DGRAM_PAD
-        else:
-            offset += (-offset % _STRING_DGRAM_PAD)
-        # Python slices do not raise an IndexError past the last index,
-        # do it ourselves.
-        if offset > len(dgram[start_index:]):
-            raise ParseError('Datagram is too short')
-        data_str = dgram[start_index:start_index + offset]
-        return data_str.replace(b'\x00', b'').decode('utf-8'), start_index + offset
-    except IndexError as ie:
-        raise ParseError('Could not parse datagram %s' % ie)
+        end_index = dgram.index(b'\x00', start_index)
+    except ValueError:
+        raise ParseError('Datagram is too short')
     except TypeError as te:
         raise ParseError('Could not parse datagram %s' % te)
+    # Align to a byte word, including the terminating null.
+    offset = (end_index - start_index + _STRING_DGRAM_PAD) & ~(_STRING_DGRAM_PAD - 1)
+    if start_index + offset > len(dgram):
+        raise ParseError('Datagram is too short')
+    try:
+        return dgram[start_index:end_index].decode('utf-8'), start_index + offset
+    except UnicodeDecodeError as ue:
+        raise ParseError('Could not parse datagram %s' % ue)
 
 
 def write_int(val: int) -> bytes:
@@ -119,11 +111,10 @@ def get_int(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if (len(dgram) - start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
         return (
-            struct.unpack('>i',
-                          dgram[start_index:start_index + _INT_DGRAM_LEN])[0],
+            struct.unpack_from('>i', dgram, start_index)[0],
             start_index + _INT_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
@@ -155,11 +146,10 @@ def get_int64(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT64_DGRAM_LEN:
+        if (len(dgram) - start_index) < _INT64_DGRAM_LEN:
             raise ParseError('Datagram is too short')
         return (
-            struct.unpack('>q',
-                          dgram[start_index:start_index + _INT64_DGRAM_LEN])[0],
+            struct.unpack_from('>q', dgram, start_index)[0],
             start_index + _INT64_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
@@ -179,11 +169,10 @@ def get_uint64(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _UINT64_DGRAM_LEN:
+        if (len(dgram) - start_index) < _UINT64_DGRAM_LEN:
             raise ParseError('Datagram is too short')
         return (
-            struct.unpack('>Q',
-                          dgram[start_index:start_index + _UINT64_DGRAM_LEN])[0],
+            struct.unpack_from('>Q', dgram, start_index)[0],
             start_index + _UINT64_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
@@ -204,7 +193,7 @@ def get_timetag(dgram: bytes, start_index: int) -> Tuple[Tuple[datetime, int], i
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
+        if (len(dgram) - start_index) < _TIMETAG_DGRAM_LEN:
             raise ParseError('Datagram is too short')
 
         timetag, _ = get_uint64(dgram, start_index)
@@ -247,14 +236,13 @@ def get_float(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _FLOAT_DGRAM_LEN:
+        if (len(dgram) - start_index) < _FLOAT_DGRAM_LEN:
             # Noticed that Reaktor doesn't send the last bunch of \x00 needed to make
             # the float representation complete in some cases, thus we pad here to
             # account for that.
-            dgram = dgram + b'\x00' * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
+            dgram = dgram + b'\x00' * (_FLOAT_DGRAM_LEN - (len(dgram) - start_index))
         return (
-            struct.unpack('>f',
-                          dgram[start_index:start_index + _FLOAT_DGRAM_LEN])[0],
+            struct.unpack_from('>f', dgram, start_index)[0],
             start_index + _FLOAT_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
@@ -286,11 +274,10 @@ def get_double(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _DOUBLE_DGRAM_LEN:
+        if (len(dgram) - start_index) < _DOUBLE_DGRAM_LEN:
             raise ParseError('Datagram is too short')
         return (
-            struct.unpack('>d',
-                          dgram[start_index:start_index + _DOUBLE_DGRAM_LEN])[0],
+            struct.unpack_from('>d', dgram, start_index)[0],
             start_index + _DOUBLE_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram {}'.format(e))
@@ -318,7 +305,7 @@ def get_blob(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
     # Make the size a multiple of 32 bits.
     total_size = size + (-size % _BLOB_DGRAM_PAD)
     end_index = int_offset + size
-    if end_index - start_index > len(dgram[start_index:]):
+    if end_index > len(dgram):
         raise ParseError('Datagram is too short.')
     return dgram[int_offset:int_offset + size], int_offset + total_size
 
@@ -326,11 +313,11 @@ def get_blob(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
 def write_blob(val: bytes) -> bytes:
     """Returns the datagram for the given blob parameter value.
 
+    Empty blobs are permitted, and are written as a zero size count.
+
     Raises:
-      - BuildError if the value was empty or if its size didn't fit an OSC int.
+      - BuildError if its size didn't fit an OSC int.
     """
-    if not val:
-        raise BuildError('Blob value cannot be empty')
     dgram = write_int(len(val))
     dgram += val
     while len(dgram) % _BLOB_DGRAM_PAD != 0:
@@ -360,7 +347,7 @@ def get_date(dgram: bytes, start_index: int) -> Tuple[float, int]:
     # Check for the special case first.
     if dgram[start_index:start_index + _TIMETAG_DGRAM_LEN] == ntp.IMMEDIATELY:
         return IMMEDIATELY, start_index + _TIMETAG_DGRAM_LEN
-    if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
+    if (len(dgram) - start_index) < _TIMETAG_DGRAM_LEN:
         raise ParseError('Datagram is too short')
     timetag, start_index = get_uint64(dgram, start_index)
     seconds = timetag * ntp._NTP_TIMESTAMP_TO_SECONDS
@@ -403,11 +390,10 @@ def get_rgba(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if (len(dgram) - start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
         return (
-            struct.unpack('>I',
-                          dgram[start_index:start_index + _INT_DGRAM_LEN])[0],
+            struct.unpack_from('>I', dgram, start_index)[0],
             start_index + _INT_DGRAM_LEN)
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
@@ -445,10 +431,9 @@ def get_midi(dgram: bytes, start_index: int) -> Tuple[MidiPacket, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if (len(dgram) - start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
-        val = struct.unpack('>I',
-                            dgram[start_index:start_index + _INT_DGRAM_LEN])[0]
+        val = struct.unpack_from('>I', dgram, start_index)[0]
         midi_msg = cast(
             MidiPacket,
             tuple((val & 0xFF << 8 * i) >> 8 * i for i in range(3, -1, -1)))
@@ -15,3 +15,115 @@ def test_application_error(client):
     client.send_message("/live/clip/get/color", (0, 10))
     response = client.await_message("/live/error")
     assert response[0] == "Error handling OSC message: Index out of range"
+
+def test_application_chunked_replies(client):
+    client.send_message("/live/api/set/chunked_replies", (1, 256))
+    assert client.query("/live/api/get/chunked_replies") == (True, 256)
+    track_count = len(client.query("/live/song/get/track_names"))
+    rv = client.query("/live/song/get/track_data", (0, track_count, "track.name", "track.color"))
+    assert len(rv) == track_count * 2
+    client.send_message("/live/api/set/chunked_replies", (0,))
+    assert client.query("/live/api/get/chunked_replies") == (False, 0)
+
+def test_application_chunk_reassembly(client):
+    received = []
+    client.set_handler("/test/chunked", lambda address, params: received.append(params))
+
+    #--------------------------------------------------------------------------------
+    # Chunks and the header may arrive in any order.
+    #--------------------------------------------------------------------------------
+    client.handle_chunk("/live/chunk/data", (1, 1, "c", 4))
+    client.handle_chunk("/live/chunk/header", (1, "/test/chunked", 2, 4))
+    assert received == []
+    client.handle_chunk("/live/chunk/data", (1, 0, 1, "b"))
+    assert received == [(1, "b", "c", 4)]
+
+    #--------------------------------------------------------------------------------
+    # A reply with a missing chunk is never handled, and expires after the timeout.
+    #--------------------------------------------------------------------------------
+    client.transfer_timeout = 0.1
+    client.handle_chunk("/live/chunk/header", (2, "/test/chunked", 2, 2))
+    client.handle_chunk("/live/chunk/data", (2, 1, "y"))
+    assert 2 in client.transfers
+    wait_one_tick()
+    client.handle_chunk("/live/chunk/header", (3, "/test/chunked", 1, 1))
+    assert 2 not in client.transfers
+
+    #--------------------------------------------------------------------------------
+    # A reply whose param count doesn't match its header is discarded.
+    #--------------------------------------------------------------------------------
+    client.handle_chunk("/live/chunk/data", (3, 0, "x", "z"))
+    assert received == [(1, "b", "c", 4)]
+    assert not client.transfers
+    client.remove_handler("/test/chunked")
+
+def test_application_stats(client):
+    client.send_message("/live/api/set/stats", (1,))
+    client.send_message("/live/api/reset/stats")
+    client.query("/live/song/get/tempo")
+    client.query("/live/song/get/tempo")
+    rv = client.query("/live/api/get/stats")
+    assert rv[0] is True
+    stats = {rv[index]: rv[index + 1:index + 11] for index in range(1, len(rv), 11)}
+    calls, errors, total_time, max_time, reply_bytes = stats["/live/song/get/tempo"][:5]
+    assert (calls, errors) == (2, 0)
+    assert 0 < max_time <= total_time
+    assert reply_bytes > 0
+    assert sum(stats["/live/song/get/tempo"][5:]) == 2
+
+    client.send_message("/live/api/reset/stats")
+    rv = client.query("/live/api/get/stats")
+    assert "/live/song/get/tempo" not in rv
+    client.send_message("/live/api/set/stats", (0,))
+    assert client.query("/live/api/get/stats") == (False,)
+
+def test_application_stats_addresses(client):
+    client.send_message("/live/api/set/stats", (1,))
+    client.send_message("/live/api/reset/stats")
+    client.query("/live/song/get/tempo")
+    client.send_message("/live/song/get/temp*")
+    client.send_message("/live/no/such/address")
+    client.send_message("/live/no/such/*")
+    wait_one_tick()
+
+    #--------------------------------------------------------------------------------
+    # Only registered addresses and wildcard patterns that match one are recorded.
+    #--------------------------------------------------------------------------------
+    rv = client.query("/live/api/get/stats")
+    addresses = rv[1::11]
+    assert "/live/song/get/tempo" in addresses
+    assert "/live/song/get/temp*" in addresses
+    assert "/live/no/such/address" not in addresses
+    assert "/live/no/such/*" not in addresses
+    client.send_message("/live/api/set/stats", (0,))
+
+def test_application_tick_stats(client):
+    client.send_message("/live/api/set/tick_stats", (1, 10))
+    client.send_message("/live/api/reset/tick_stats")
+    for _ in range(3):
+        wait_one_tick()
+        client.query("/live/song/get/tempo")
+    rv = client.query("/live/api/get/tick_stats")
+    assert len(rv) == 18
+    enabled, window, tick_count, mean_interval = rv[:4]
+    assert enabled is True and window == 10
+    assert 3 <= tick_count <= 10
+    assert 0.05 < mean_interval < 0.5
+    mean_time, max_time = rv[6:8]
+    assert 0 < mean_time <= max_time
+    phase_means = rv[8::2]
+    assert sum(phase_means) <= mean_time + 1e-6
+    client.send_message("/live/api/set/tick_stats", (0,))
+    assert client.query("/live/api/get/tick_stats") == (False,)
+
+def test_application_profile(client):
+    client.send_message("/live/api/profile/start")
+    assert client.query("/live/api/get/profile") == (True,)
+    for _ in range(3):
+        client.query("/live/song/get/tempo")
+    rv = client.query("/live/api/profile/stop", (5,))
+    assert rv[0].endswith(".pstats")
+    assert len(rv) == 1 + 5 * 4
+    function, ncalls, tottime, cumtime = rv[1:5]
+    assert isinstance(function, str) and ncalls > 0 and cumtime >= tottime
+    assert client.query("/live/api/get/profile") == (False,)
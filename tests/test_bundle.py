@@ -1,4 +1,5 @@
 from . import client, wait_one_tick
+import time
 
 #--------------------------------------------------------------------------------
 # OSC bundles
@@ -19,3 +20,37 @@ def test_bundle(client):
 
     wait_one_tick()
     assert reply_count == 3
+
+def test_bundle_replies(client):
+    reply_count = 0
+    def count_replies(address, params):
+        nonlocal reply_count
+        reply_count += 1
+    client.set_handler("/live/song/get/tempo", count_replies)
+
+    client.send_message("/live/api/set/bundle_replies", (1,))
+    assert client.query("/live/api/get/bundle_replies") == (True, 1472)
+    for _ in range(3):
+        client.send_message("/live/song/get/tempo")
+
+    wait_one_tick()
+    assert reply_count == 3
+    client.send_message("/live/api/set/bundle_replies", (0,))
+    assert client.query("/live/api/get/bundle_replies") == (False, 0)
+
+def test_bundle_timestamp(client):
+    reply_count = 0
+    def count_replies(address, params):
+        nonlocal reply_count
+        reply_count += 1
+    client.set_handler("/live/song/get/tempo", count_replies)
+
+    client.send_bundle([("/live/song/get/tempo", tuple())], time.time() + 0.5)
+    wait_one_tick()
+    assert reply_count == 0
+    assert client.query("/live/api/get/bundle_schedule")[0] == 1
+
+    time.sleep(0.5)
+    wait_one_tick()
+    assert reply_count == 1
+    assert client.query("/live/api/get/bundle_schedule")[0] == 0
@@ -1,6 +1,9 @@
 from . import client, wait_one_tick, TICK_DURATION
+from ..client.notes import add_notes, pack_notes, unpack_notes, query_note_blob, \
+    notes_to_array, array_to_notes
 import pytest
 import random
+import struct
 
 #--------------------------------------------------------------------------------
 # To test clips, initialise by creating an empty MIDI clip and recording
@@ -114,6 +117,139 @@ def test_clip_add_many_notes(client):
     # Clear clip
     client.send_message("/live/clip/remove/notes", (0, 0))
 
+def test_clip_get_notes_chunked(client):
+    notes = tuple(value for index in range(500)
+                  for value in (36 + index % 48, index * 0.25, 0.25, 100.0, False))
+    client.send_message("/live/clip/add/notes", (0, 0) + notes)
+    expected = client.query("/live/clip/get/notes", (0, 0))
+    assert len(expected) == 2 + len(notes)
+
+    #--------------------------------------------------------------------------------
+    # With chunked replies, the notes are split across many datagrams, and reassembled
+    # by the client into the same reply.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/api/set/chunked_replies", (1, 512))
+    assert client.query("/live/clip/get/notes", (0, 0), timeout=TICK_DURATION * 4) == expected
+    client.send_message("/live/api/set/chunked_replies", (0,))
+    client.send_message("/live/clip/remove/notes", (0, 0))
+
+def test_clip_notes_blob(client):
+    notes = [(pitch, pitch * 0.25, 0.25, 100.0, pitch % 2 == 0) for pitch in range(36, 84)]
+    assert client.query("/live/clip/get/notes/blob", (0, 0)) == (0, 0, "notes", 0, 0, b"")
+
+    add_notes(client, 0, 0, pack_notes(notes))
+    assert unpack_notes(query_note_blob(client, 0, 0)) == notes
+    notes_with_ids = unpack_notes(query_note_blob(client, 0, 0, "notes_with_ids", (60, 12, 0, 32)), "notes_with_ids")
+    assert [note[:5] for note in notes_with_ids] == notes[24:36]
+
+    client.send_message("/live/clip/remove/notes", (0, 0))
+
+def test_clip_notes_array(client):
+    np = pytest.importorskip("numpy")
+    notes = [(pitch, pitch * 0.25, 0.25, 100.0, False) for pitch in range(36, 48)]
+    add_notes(client, 0, 0, pack_notes(notes))
+    array = notes_to_array(query_note_blob(client, 0, 0))
+    assert list(array["pitch"]) == list(range(36, 48))
+
+    #--------------------------------------------------------------------------------
+    # Round-trip the notes through an array, transposed up an octave.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/clip/remove/notes", (0, 0))
+    transposed = array.copy()
+    transposed["pitch"] += 12
+    add_notes(client, 0, 0, array_to_notes(transposed))
+    assert unpack_notes(query_note_blob(client, 0, 0)) == [(pitch + 12, *note) for pitch, *note in notes]
+
+    #--------------------------------------------------------------------------------
+    # Arrays missing any of the format's fields are rejected.
+    #--------------------------------------------------------------------------------
+    without_velocity = np.zeros(1, dtype=[(name, array.dtype[name]) for name in array.dtype.names
+                                          if name != "velocity"])
+    with pytest.raises(ValueError, match="velocity"):
+        array_to_notes(without_velocity)
+
+    client.send_message("/live/clip/remove/notes", (0, 0))
+
+def test_clip_notes_sync(client):
+    changes = []
+    removals = []
+    client.set_handler("/live/clip/get/notes/changed", lambda address, params: changes.append(params))
+    client.set_handler("/live/clip/get/notes/removed", lambda address, params: removals.append(params))
+
+    client.send_message("/live/clip/add/notes", (0, 0,
+                                                 60, 0.0, 0.25, 64, False,
+                                                 67, 1.0, 0.5, 32, False))
+    rv = client.query("/live/clip/get/notes/extended", (0, 0))
+    first_id, second_id = rv[2], rv[8]
+    assert rv == (0, 0, first_id, 60, 0.0, 0.25, 64, False, second_id, 67, 1.0, 0.5, 32, False)
+
+    client.send_message("/live/clip/start_listen/notes", (0, 0))
+    wait_one_tick()
+    assert changes == [(0, 0, first_id, 60, 0.0, 0.25, 64, False, second_id, 67, 1.0, 0.5, 32, False)]
+
+    client.send_message("/live/clip/modify/notes", (0, 0, first_id, 62, 0.0, 0.5, 100, False))
+    wait_one_tick()
+    wait_one_tick()
+    assert changes[-1] == (0, 0, first_id, 62, 0.0, 0.5, 100, False)
+
+    client.send_message("/live/clip/remove_notes_by_id", (0, 0, second_id))
+    wait_one_tick()
+    wait_one_tick()
+    assert removals == [(0, 0, second_id)]
+
+    client.send_message("/live/clip/stop_listen/notes", (0, 0))
+    client.remove_handler("/live/clip/get/notes/changed")
+    client.remove_handler("/live/clip/get/notes/removed")
+    client.send_message("/live/clip/remove/notes", (0, 0))
+
+def test_clip_transform_notes(client):
+    client.send_message("/live/clip/add/notes", (0, 0,
+                                                 60, 0.1, 0.25, 64, False,
+                                                 72, 1.0, 0.5, 32, False))
+    client.send_message("/live/clip/transform/transpose", (0, 0, 2))
+    client.send_message("/live/clip/transform/quantize", (0, 0, 0.5, 1.0))
+    client.send_message("/live/clip/transform/scale_velocity", (0, 0, 0.5, 70, 12, 0, 4))
+    assert client.query("/live/clip/get/notes", (0, 0)) == (0, 0,
+                                                            62, 0.0, 0.25, 64, False,
+                                                            74, 1.0, 0.5, 16, False)
+    client.send_message("/live/clip/remove/notes", (0, 0))
+
+def _get_clips_muted(client, track_id, clip_count):
+    rv = client.query("/live/clip_slot/get/grid", (track_id, track_id + 1, 0, clip_count, "clip.muted"))
+    return struct.unpack(">%di" % clip_count, rv[6])
+
+def test_clip_filter(client):
+    track_id = 1
+    names = ["Pad_C-E-G", "Pad_C-Eb", "Pad_Cb", "Plain"]
+    for clip_id, name in enumerate(names):
+        client.send_message("/live/clip_slot/create_clip", (track_id, clip_id, 4.0))
+        client.send_message("/live/clip/set/name", (track_id, clip_id, name))
+    wait_one_tick()
+
+    #--------------------------------------------------------------------------------
+    # Clips listing notes outside the filter, or unrecognised notes, are muted.
+    # Clips whose names don't list notes are left unchanged.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/clips/filter", ("C", "E", "G"))
+    wait_one_tick()
+    assert _get_clips_muted(client, track_id, 4) == (0, 1, 1, 0)
+
+    #--------------------------------------------------------------------------------
+    # Renaming a clip updates its notes.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/clip/set/name", (track_id, 1, "Pad_C-E"))
+    wait_one_tick()
+    client.send_message("/live/clips/filter", ("C", "E", "G"))
+    wait_one_tick()
+    assert _get_clips_muted(client, track_id, 4) == (0, 0, 1, 0)
+
+    client.send_message("/live/clips/unfilter")
+    wait_one_tick()
+    assert _get_clips_muted(client, track_id, 4) == (0, 0, 0, 0)
+    for clip_id in range(len(names)):
+        client.send_message("/live/clip_slot/delete_clip", (track_id, clip_id))
+    wait_one_tick()
+
 def test_clip_playing_position_listen(client):
     client.send_message("/live/clip/start_listen/playing_position", [0, 0])
     client.send_message("/live/clip/fire", [0, 0])
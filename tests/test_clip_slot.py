@@ -1,4 +1,6 @@
 from . import client, wait_one_tick, TICK_DURATION
+import struct
+import math
 
 def test_clip_slot_has_clip(client):
     assert client.query("/live/clip_slot/get/has_clip", (0, 0)) == (0, 0, False)
@@ -29,4 +31,33 @@ def test_clip_slot_property_listen(client):
     assert client.await_message("/live/clip_slot/get/has_clip", TICK_DURATION * 2) == (0, 0, True)
     client.send_message("/live/clip_slot/delete_clip", [0, 0])
     assert client.await_message("/live/clip_slot/get/has_clip", TICK_DURATION * 2) == (0, 0, False)
-    client.send_message("/live/clip_slot/stop_listen/has_clip", (0,))
\ No newline at end of file
+    client.send_message("/live/clip_slot/stop_listen/has_clip", (0,))
+
+def test_clip_slot_get_grid(client):
+    client.send_message("/live/clip_slot/create_clip", (0, 0, 4.0))
+    client.send_message("/live/clip/set/name", (0, 0, "Grid"))
+    wait_one_tick()
+    rv = client.query("/live/clip_slot/get/grid", (0, 1, 0, 2, "clip_slot.has_clip", "clip.name", "clip.length"))
+    assert rv[:4] == (0, 1, 0, 2)
+    assert rv[4:6] == ("clip_slot.has_clip", "i")
+    assert struct.unpack(">2i", rv[6]) == (1, 0)
+    assert rv[7:9] == ("clip.name", "s")
+    assert rv[9].split(b"\x00") == [b"Grid", b""]
+    assert rv[10:12] == ("clip.length", "f")
+    length, empty_length = struct.unpack(">2f", rv[12])
+    assert length == 4.0
+    assert math.isnan(empty_length)
+    client.send_message("/live/clip_slot/delete_clip", (0, 0))
+
+def test_clip_slot_get_grid_clamps_scenes(client):
+    num_scenes = client.query("/live/song/get/num_scenes")[0]
+    rv = client.query("/live/clip_slot/get/grid", (0, 1, 0, num_scenes + 8, "clip_slot.has_clip"))
+    assert rv[:4] == (0, 1, 0, num_scenes)
+    assert len(rv[6]) == 4 * num_scenes
+
+def test_clip_slot_get_grid_clamps_tracks(client):
+    num_tracks = len(client.query("/live/song/get/track_names"))
+    num_scenes = client.query("/live/song/get/num_scenes")[0]
+    rv = client.query("/live/clip_slot/get/grid", (0, num_tracks + 4, 0, num_scenes, "clip_slot.has_clip"))
+    assert rv[:4] == (0, num_tracks, 0, num_scenes)
+    assert len(rv[6]) == 4 * num_tracks * num_scenes
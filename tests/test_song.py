@@ -1,4 +1,5 @@
 from . import client, wait_one_tick, TICK_DURATION
+import time
 
 #--------------------------------------------------------------------------------
 # Test song start/stop
@@ -29,6 +30,70 @@ def test_song_beat(client):
     client.send_message("/live/song/stop_listen/beat")
     wait_one_tick()
 
+def test_song_schedule_command(client):
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [240])
+    client.send_message("/live/song/set/current_song_time", [0])
+    client.send_message("/live/api/schedule/next_bar", ("/live/song/set/tempo", 125))
+    client.send_message("/live/api/schedule", (2.0, "/live/song/set/tempo", 130))
+    wait_one_tick()
+    assert client.query("/live/api/get/schedule") == (2,)
+    assert client.query("/live/song/get/tempo") == (240,)
+
+    client.send_message("/live/song/start_playing")
+    # At 240bpm, beat 2 is reached after 0.5s. The next bar (beat 4) follows after
+    # a further 2 beats at 130bpm.
+    time.sleep(0.5 + TICK_DURATION * 2)
+    assert client.query("/live/song/get/tempo") == (130,)
+    time.sleep(1.5)
+    assert client.query("/live/song/get/tempo") == (125,)
+    assert client.query("/live/api/get/schedule") == (0,)
+
+    client.send_message("/live/api/schedule/next_bar", ("/live/song/set/tempo", 140))
+    client.send_message("/live/api/schedule/clear")
+    assert client.query("/live/api/get/schedule") == (0,)
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [120])
+    wait_one_tick()
+
+def test_song_schedule_command_with_beat_listener(client):
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [240])
+    client.send_message("/live/song/set/current_song_time", [0])
+    client.send_message("/live/song/start_listen/beat")
+    client.send_message("/live/api/schedule", (1.0, "/live/song/set/tempo", 130))
+    client.send_message("/live/api/schedule", (3.0, "/live/song/set/tempo", 125))
+    client.send_message("/live/song/start_playing")
+    assert client.await_message("/live/song/get/beat", timeout=1.0)
+    time.sleep(0.25 + TICK_DURATION * 2)
+    assert client.query("/live/song/get/tempo") == (130,)
+
+    #--------------------------------------------------------------------------------
+    # Stopping the beat listener leaves the remaining command scheduled.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/song/stop_listen/beat")
+    time.sleep(1.0 + TICK_DURATION * 2)
+    assert client.query("/live/song/get/tempo") == (125,)
+    assert client.query("/live/api/get/schedule") == (0,)
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [120])
+    wait_one_tick()
+
+def test_song_schedule_track_command(client):
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [240])
+    client.send_message("/live/song/set/current_song_time", [0])
+    client.send_message("/live/api/schedule", (1.0, "/live/track/start_listen/mute", 0))
+    client.send_message("/live/song/start_playing")
+    assert client.await_message("/live/track/get/mute", timeout=1.0) == (0, False)
+    client.send_message("/live/track/set/mute", (0, True))
+    assert client.await_message("/live/track/get/mute", TICK_DURATION * 2) == (0, True)
+    client.send_message("/live/track/stop_listen/mute", (0,))
+    client.send_message("/live/track/set/mute", (0, False))
+    client.send_message("/live/song/stop_playing")
+    client.send_message("/live/song/set/tempo", [120])
+    wait_one_tick()
+
 def test_song_stop_all_clips(client):
     client.send_message("/live/clip_slot/create_clip", (0, 0, 4))
     client.send_message("/live/clip_slot/create_clip", (1, 0, 4))
@@ -197,3 +262,24 @@ def test_song_undo_redo(client):
     wait_one_tick()
     assert client.query("/live/song/get/num_scenes") == (9,)
     client.send_message("/live/song/delete_scene", [8])
+
+#--------------------------------------------------------------------------------
+# Test song - meters
+#--------------------------------------------------------------------------------
+
+def test_song_get_meters(client):
+    num_tracks = len(client.query("/live/song/get/track_names"))
+    meter_format, rv_num_tracks, num_return_tracks, meters = client.query("/live/song/get/meters")
+    assert meter_format == "float32"
+    assert rv_num_tracks == num_tracks
+    assert len(meters) == (num_tracks + num_return_tracks + 1) * 3 * 4
+
+    meter_format, _, _, meters = client.query("/live/song/get/meters", ("uint16",))
+    assert meter_format == "uint16"
+    assert len(meters) == (num_tracks + num_return_tracks + 1) * 3 * 2
+
+def test_song_listen_meters(client):
+    client.send_message("/live/song/start_listen/meters", ("uint16",))
+    meter_format, _, _, _ = client.await_message("/live/song/get/meters", TICK_DURATION * 2)
+    assert meter_format == "uint16"
+    client.send_message("/live/song/stop_listen/meters")
@@ -32,6 +32,28 @@ def test_track_property_solo(client):
 def test_track_property_name(client):
     _test_track_property(client, 2, "name", ["Test", "Track"])
 
+#--------------------------------------------------------------------------------
+# Test track properties - all tracks
+#--------------------------------------------------------------------------------
+
+def test_track_property_all_tracks(client):
+    num_tracks = len(client.query("/live/song/get/track_names"))
+    client.send_message("/live/track/set/mute", ["*", 1])
+    wait_one_tick()
+    assert client.query("/live/track/get/mute", ["*"]) == tuple(value for track_id in range(num_tracks) for value in (track_id, 1, True))
+    client.send_message("/live/track/set/mute", ["*", 0])
+    wait_one_tick()
+    assert client.query("/live/track/get/mute", ["*"]) == tuple(value for track_id in range(num_tracks) for value in (track_id, 1, False))
+
+def test_track_multiple_values_all_tracks(client):
+    num_tracks = len(client.query("/live/song/get/track_names"))
+    num_scenes = client.query("/live/song/get/num_scenes")[0]
+    rv = client.query("/live/track/get/clips/name", ["*"])
+    assert len(rv) == num_tracks * (2 + num_scenes)
+    for track_id in range(num_tracks):
+        offset = track_id * (2 + num_scenes)
+        assert rv[offset:offset + 2] == (track_id, num_scenes)
+
 #--------------------------------------------------------------------------------
 # Test track properties - sends
 #--------------------------------------------------------------------------------
@@ -107,3 +129,53 @@ def test_track_listen_playing_slot_index(client):
 
     for track_id, clip_id in itertools.product((0, 1), (0, 1)):
         client.send_message("/live/clip_slot/delete_clip", (track_id, clip_id))
+
+def test_track_listen_coalesced(client):
+    updates = []
+    client.set_handler("/live/track/get/volume", lambda address, params: updates.append(params))
+    client.send_message("/live/track/start_listen/volume", (2,))
+    wait_one_tick()
+    assert updates == [(2, 1.0)]
+
+    #--------------------------------------------------------------------------------
+    # Changes are sent at most once per tick, containing the latest value, and
+    # unchanged values are not resent.
+    #--------------------------------------------------------------------------------
+    updates.clear()
+    client.send_bundle([
+        ("/live/track/set/volume", (2, 0.5)),
+        ("/live/track/set/volume", (2, 0.25)),
+        ("/live/track/set/volume", (2, 0.75))
+    ])
+    wait_one_tick()
+    assert updates == [(2, 0.75)]
+    client.send_message("/live/track/set/volume", (2, 0.75))
+    wait_one_tick()
+    assert updates == [(2, 0.75)]
+
+    client.send_message("/live/track/stop_listen/volume", (2,))
+    client.send_message("/live/track/set/volume", (2, 1.0))
+
+def test_track_listen_throttle(client):
+    assert client.query("/live/api/get/listener_throttle") == (0.0, 0.0, True)
+    client.send_message("/live/api/set/listener_throttle", (10.0, 0.125, 0))
+    assert client.query("/live/api/get/listener_throttle") == (10.0, 0.125, False)
+    updates = []
+    client.set_handler("/live/track/get/volume", lambda address, params: updates.append(params))
+    client.send_message("/live/track/start_listen/volume", (2,))
+    wait_one_tick()
+    updates.clear()
+
+    #--------------------------------------------------------------------------------
+    # Changes smaller than the threshold are not sent.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/track/set/volume", (2, 0.9375))
+    wait_one_tick()
+    assert updates == []
+    client.send_message("/live/track/set/volume", (2, 0.5))
+    wait_one_tick()
+    assert updates == [(2, 0.5)]
+
+    client.send_message("/live/track/stop_listen/volume", (2,))
+    client.send_message("/live/track/set/volume", (2, 1.0))
+    client.send_message("/live/api/set/listener_throttle", (0.0, 0.0, 1))